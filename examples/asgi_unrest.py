@@ -0,0 +1,56 @@
+import os
+from functools import partial
+
+from sqlalchemy.engine import create_engine
+from sqlalchemy.orm import scoped_session, sessionmaker
+from sqlalchemy.types import Float
+
+from unrest import UnRest
+from unrest.framework.asgi import ASGIApplication, ASGIFramework
+from unrest.tests.model import Base, Fruit, Tree, fill_data
+
+
+async def index(scope, receive, send):
+    await send(
+        {
+            'type': 'http.response.start',
+            'status': 200,
+            'headers': [(b'content-type', b'text/plain')],
+        }
+    )
+    await send({'type': 'http.response.body', 'body': b'A normal asgi route!'})
+
+
+app = ASGIApplication(index)
+sqlite_db = os.path.join(
+    os.path.dirname(os.path.realpath(__file__)), 'unrest-test.db'
+)
+db_url = f'sqlite:///{sqlite_db}'
+
+engine = create_engine(db_url)
+Session = sessionmaker()
+Session.configure(bind=engine)
+session = scoped_session(Session)
+
+if not os.path.exists(sqlite_db):
+    Base.metadata.create_all(bind=engine)
+    fill_data(session)
+    session.remove()
+
+
+# Remove the request session once each response is sent
+rest = UnRest(
+    app, session, framework=partial(ASGIFramework, teardown=session.remove)
+)
+fruit = rest(
+    Fruit, methods=rest.all, properties=[rest.Property('square_size', Float())]
+)
+rest(
+    Tree,
+    methods=rest.all,
+    relationships={'fruits': fruit},
+    properties=['fruit_colors'],
+    allow_batch=True,
+)
+
+# Run with: uvicorn asgi_unrest:app
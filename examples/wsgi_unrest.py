@@ -0,0 +1,52 @@
+import os
+from functools import partial
+from wsgiref.simple_server import make_server
+
+from sqlalchemy.engine import create_engine
+from sqlalchemy.orm import scoped_session, sessionmaker
+from sqlalchemy.types import Float
+
+from unrest import UnRest
+from unrest.framework.wsgi import WSGIApplication, WSGIFramework
+from unrest.tests.model import Base, Fruit, Tree, fill_data
+
+
+def index(environ, start_response):
+    start_response('200 OK', [('Content-Type', 'text/plain')])
+    return [b'A normal wsgi route!']
+
+
+app = WSGIApplication(index)
+sqlite_db = os.path.join(
+    os.path.dirname(os.path.realpath(__file__)), 'unrest-test.db'
+)
+db_url = f'sqlite:///{sqlite_db}'
+
+engine = create_engine(db_url)
+Session = sessionmaker()
+Session.configure(bind=engine)
+session = scoped_session(Session)
+
+if not os.path.exists(sqlite_db):
+    Base.metadata.create_all(bind=engine)
+    fill_data(session)
+    session.remove()
+
+
+# Remove the request session once each response is sent
+rest = UnRest(
+    app, session, framework=partial(WSGIFramework, teardown=session.remove)
+)
+fruit = rest(
+    Fruit, methods=rest.all, properties=[rest.Property('square_size', Float())]
+)
+rest(
+    Tree,
+    methods=rest.all,
+    relationships={'fruits': fruit},
+    properties=['fruit_colors'],
+    allow_batch=True,
+)
+
+# Or with gunicorn: gunicorn wsgi_unrest:app
+make_server('localhost', 8000, app).serve_forever()
@@ -43,6 +43,9 @@ tests_requirements = [
     'sanic<21',
     'aiohttp',
     'pyyaml',
+    'orjson',
+    'ujson',
+    'aiosqlite',
 ]
 
 needs_pytest = {'pytest', 'test', 'ptr'}.intersection(sys.argv)
@@ -69,6 +72,8 @@ setup(
         'flask': ['flask'],
         'tornado': ['tornado'],
         'yaml': ['pyyaml'],
+        'orjson': ['orjson'],
+        'ujson': ['ujson'],
     },
     classifiers=[
         "Development Status :: 4 - Beta",
@@ -0,0 +1,191 @@
+import json
+import os
+from collections import OrderedDict
+from itertools import count
+from tempfile import NamedTemporaryFile
+from threading import Lock
+from time import monotonic, time
+from uuid import uuid4
+
+
+class MemoryCache(object):
+    """
+    The in-process response cache: a LRU mapping bounded in number of
+    entries and in bytes whose entries expire after `ttl` seconds.
+
+    Caches are used by the `cache` option of #::unrest.rest#Rest to store the
+    encoded GET responses:
+
+    ```python
+    from unrest.cache import MemoryCache
+
+    cache = MemoryCache(max_bytes=256 * 1024 * 1024)
+    rest(Model, cache=cache)
+    ```
+
+    Instead of deleting entries, writes bump the generation of the written
+    tables which is part of the cache keys (see
+    #::unrest.rest#Rest.cache_key), stale entries are then evicted by the
+    LRU or expire.
+
+    To implement a cache backend you have to implement the `get`, `set`,
+    `generation` and `invalidate` methods described below.
+
+    # Arguments
+        max_entries: The maximum number of cached responses.
+        max_bytes: The maximum total size of the cached payloads.
+        ttl: The time to live in seconds of the cached responses.
+    """
+
+    def __init__(self, max_entries=1024, max_bytes=64 * 1024 * 1024, ttl=60):
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.ttl = ttl
+        self.size = 0
+        self._entries = OrderedDict()
+        self._generations = {}
+        self._counter = count(1)
+        self._lock = Lock()
+
+    def get(self, key):
+        """
+        Returns the `(status, headers, payload)` response cached for `key` or
+        None.
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return
+            response, expiry = entry
+            if expiry <= monotonic():
+                self._remove(key)
+                return
+            self._entries.move_to_end(key)
+            return response
+
+    def set(self, key, response):
+        """
+        Caches the `(status, headers, payload)` `response` for `key`, unless
+        its payload is larger than `max_bytes`.
+        """
+        size = len(response[2])
+        if size > self.max_bytes:
+            return
+        with self._lock:
+            if key in self._entries:
+                self._remove(key)
+            self._entries[key] = response, monotonic() + self.ttl
+            self.size += size
+            while (
+                len(self._entries) > self.max_entries
+                or self.size > self.max_bytes
+            ):
+                self._remove(next(iter(self._entries)))
+
+    def generation(self, tag):
+        """Returns the current generation of the `tag` (a table name)."""
+        return self._generations.get(tag, 0)
+
+    def invalidate(self, tag):
+        """Invalidates all the entries cached with the `tag` generation."""
+        self._generations[tag] = next(self._counter)
+
+    def clear(self):
+        """Removes all the cached entries."""
+        with self._lock:
+            self._entries.clear()
+            self.size = 0
+
+    def _remove(self, key):
+        response, _ = self._entries.pop(key)
+        self.size -= len(response[2])
+
+
+class FileCache(object):
+    """
+    A response cache stored in a local `directory` and thus shared by all the
+    processes of the host (i.e. gunicorn workers), which can be a tmpfs
+    mount such as `/dev/shm` to stay in memory.
+
+    Entries and table generations are files written atomically. Expired
+    entries are removed when read and by #purge which is run every
+    `purge_every` writes.
+
+    See #MemoryCache for the backend interface.
+
+    # Arguments
+        directory: The cache directory, created if needed.
+        ttl: The time to live in seconds of the cached responses.
+        purge_every: The number of writes between two purges.
+    """
+
+    def __init__(self, directory, ttl=60, purge_every=1024):
+        self.directory = directory
+        self.ttl = ttl
+        self.purge_every = purge_every
+        self._writes = count(1)
+        os.makedirs(os.path.join(directory, 'entries'), exist_ok=True)
+        os.makedirs(os.path.join(directory, 'generations'), exist_ok=True)
+
+    def get(self, key):
+        path = os.path.join(self.directory, 'entries', key)
+        try:
+            with open(path, 'rb') as file:
+                if os.fstat(file.fileno()).st_mtime + self.ttl <= time():
+                    os.unlink(path)
+                    return
+                head = json.loads(file.readline())
+                return head['status'], head['headers'], file.read()
+        except (OSError, ValueError):
+            return
+
+    def set(self, key, response):
+        status, headers, payload = response
+        head = json.dumps({'status': status, 'headers': headers})
+        self._write(
+            os.path.join(self.directory, 'entries', key),
+            head.encode('utf-8') + b'\n' + payload,
+        )
+        if next(self._writes) % self.purge_every == 0:
+            self.purge()
+
+    def generation(self, tag):
+        try:
+            with open(self._generation_path(tag), 'rb') as file:
+                return file.read().decode('ascii')
+        except OSError:
+            return ''
+
+    def invalidate(self, tag):
+        # A unique token rather than a counter: concurrent invalidations
+        # from several processes must all change the generation
+        self._write(self._generation_path(tag), uuid4().hex.encode('ascii'))
+
+    def purge(self):
+        """Removes the expired entries."""
+        directory = os.path.join(self.directory, 'entries')
+        expired = time() - self.ttl
+        for entry in os.scandir(directory):
+            try:
+                if entry.stat().st_mtime <= expired:
+                    os.unlink(entry.path)
+            except OSError:
+                continue
+
+    def clear(self):
+        """Removes all the cached entries."""
+        for entry in os.scandir(os.path.join(self.directory, 'entries')):
+            try:
+                os.unlink(entry.path)
+            except OSError:
+                continue
+
+    def _generation_path(self, tag):
+        return os.path.join(self.directory, 'generations', tag)
+
+    def _write(self, path, data):
+        with NamedTemporaryFile(
+            dir=os.path.dirname(path), prefix='.', delete=False
+        ) as file:
+            file.write(data)
+        os.replace(file.name, path)
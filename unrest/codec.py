@@ -0,0 +1,106 @@
+import datetime
+import json
+import uuid
+
+
+class JsonCodec(object):
+    """
+    The default json codec based on the python standard library.
+
+    Codecs are used by the json idioms and the #::unrest.UnRest index routes
+    to decode request payloads and encode response data. They can be set
+    with the `codec` argument of #::unrest.UnRest:
+
+    ```python
+    from unrest.codec import best_json_codec
+
+    rest = UnRest(app, session, codec=best_json_codec())
+    ```
+
+    To implement a codec you have to implement the `loads` and `dumps`
+    methods described below.
+
+    # Attributes
+        native_types: The python types this codec encodes natively. Values of
+            these types are not coerced by the #::unrest.coercers#Serialize
+            plan.
+    """
+
+    native_types = ()
+
+    def loads(self, payload):
+        """
+        Decode the `payload` bytes (or string).
+
+        # Raises
+        A `ValueError` if the payload is not valid json.
+        """
+        return json.loads(payload)
+
+    def dumps(self, data):
+        """Encode `data` as json string or bytes."""
+        return json.dumps(data)
+
+
+class OrJsonCodec(JsonCodec):
+    """
+    A [orjson](https://github.com/ijl/orjson) json codec.
+
+    Produces bytes and encodes natively datetimes, dates, times and uuids.
+
+    Requires orjson to be installed.
+    """
+
+    native_types = (datetime.datetime, datetime.date, datetime.time, uuid.UUID)
+
+    def __init__(self):
+        try:
+            import orjson
+        except ImportError:
+            raise ImportError(
+                'You must have orjson installed to use this codec'
+            )
+        self.orjson = orjson
+
+    def loads(self, payload):
+        return self.orjson.loads(payload)
+
+    def dumps(self, data):
+        return self.orjson.dumps(data)
+
+
+class UJsonCodec(JsonCodec):
+    """
+    A [ujson](https://github.com/ultrajson/ultrajson) json codec.
+
+    Requires ujson to be installed.
+    """
+
+    def __init__(self):
+        try:
+            import ujson
+        except ImportError:
+            raise ImportError(
+                'You must have ujson installed to use this codec'
+            )
+        self.ujson = ujson
+
+    def loads(self, payload):
+        return self.ujson.loads(payload)
+
+    def dumps(self, data):
+        return self.ujson.dumps(data, escape_forward_slashes=False)
+
+
+def best_json_codec():
+    """
+    Returns the fastest available json codec class:
+    #OrJsonCodec, #UJsonCodec or #JsonCodec as a fallback.
+    """
+    for Codec in (OrJsonCodec, UJsonCodec):
+        try:
+            Codec()
+        except ImportError:
+            continue
+        return Codec
+    return JsonCodec
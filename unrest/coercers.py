@@ -2,6 +2,8 @@ import datetime
 import decimal
 import logging
 from base64 import b64decode, b64encode
+from functools import partial
+from operator import attrgetter
 
 from dateutil.parser import parse as dateparse
 from sqlalchemy.types import String
@@ -18,12 +20,16 @@ class Property(object):
         name: This property name
         type: The sqlalchemy type used for type coercion
         formatter: An optional function to transform the parameter as string
+        depends: The names of the columns this property is computed from. If
+            given, the rest can load only the columns it serializes (see the
+            #::unrest.rest#Rest `projection` parameter).
     """
 
-    def __init__(self, name, type=None, formatter=None):
+    def __init__(self, name, type=None, formatter=None, depends=None):
         self.name = name
         self.type = type or String()
         self.formatter = formatter
+        self.depends = depends
 
     def get(self, serializer, model):
         prop = getattr(model, self.name)
@@ -33,6 +39,29 @@ class Property(object):
             prop = serializer._serialize(self.type, prop)
         return prop
 
+    def getter(self, serializer):
+        """
+        Returns a one argument function that gets this property value from a
+        model, used by the #::unrest.coercers#Serialize plan.
+        """
+        if type(self).get is not Property.get:
+            return partial(self.get, serializer)
+        get = attrgetter(self.name)
+        if self.formatter:
+            formatter = self.formatter
+            return lambda model: formatter(get(model))
+        coerce = serializer.coercer(self.type)
+        if coerce is None:
+            return get
+
+        def getter(model):
+            data = get(model)
+            if data is None:
+                return
+            return coerce(data)
+
+        return getter
+
 
 class Serialize(object):
     """
@@ -59,6 +88,12 @@ class Serialize(object):
     ...
     ```
 
+    A serializer can also be instantiated without model to serialize a whole
+    result set with #all. In this case the per column coercion is resolved
+    once into a plan which is then run over every item. Data of
+    `native_types` (set from the idiom codec) is then left as is unless
+    the corresponding `serialize_type` method is overridden.
+
     # Arguments
         model: The sqlachemy item to serialize.
         columns: The list of columns to serialize.
@@ -71,6 +106,8 @@ class Serialize(object):
         self.columns = columns
         self.properties = properties
         self.relationships = relationships
+        self.native_types = ()
+        self._plan = None
 
     def dict(self):
         """Serialize the given model to a JSON compatible dict"""
@@ -102,6 +139,101 @@ class Serialize(object):
             ),
         )
 
+    def all(self, models):
+        """
+        Serialize all the given models to a list of JSON compatible dicts
+        using the compiled #plan.
+        """
+        if not self.compilable:
+            return [
+                self.__class__(
+                    model, self.columns, self.properties, self.relationships
+                ).dict()
+                for model in models
+            ]
+
+        columns, properties, relationships = self.plan
+        rv = []
+        for model in models:
+            obj = {}
+            for name, get, coerce in columns:
+                data = get(model)
+                if data is not None and coerce is not None:
+                    data = coerce(data)
+                obj[name] = data
+            for name, get in properties:
+                obj[name] = get(model)
+            for name, get, serializer in relationships:
+                related = get(model)
+                try:
+                    related = iter(related)
+                except TypeError:
+                    related = (related,)
+                obj[name] = serializer.all(
+                    item for item in related if item is not None
+                )
+            rv.append(obj)
+        return rv
+
+    @property
+    def compilable(self):
+        """
+        Returns whether this serializer can use a compiled plan, that is if
+        none of `dict`, `serialize` and `_serialize` are overridden.
+        """
+        cls = type(self)
+        return all(
+            getattr(cls, name) is getattr(Serialize, name)
+            for name in ('dict', 'serialize', '_serialize')
+        )
+
+    @property
+    def plan(self):
+        """
+        The serialization plan of this serializer, compiled on first access.
+
+        It is a tuple of:
+
+        - the columns as `(name, getter, coercer)` tuples
+        - the properties as `(name, getter)` tuples
+        - the relationships as `(name, getter, serializer)` tuples
+        """
+        if self._plan is None:
+            self._plan = (
+                tuple(
+                    (name, attrgetter(name), self.coercer(column.type))
+                    for name, column in self.columns.items()
+                ),
+                tuple(
+                    (property.name, property.getter(self))
+                    for property in self.properties
+                ),
+                tuple(
+                    (key, attrgetter(key), relationship_rest.serializer)
+                    for key, relationship_rest in self.relationships.items()
+                ),
+            )
+        return self._plan
+
+    def coercer(self, type):
+        """
+        Resolve the `serialize_type` method for `type` into a one argument
+        function or None if data is returned as is.
+        """
+        method_name = f'serialize_{type.__class__.__name__.lower()}'
+        if not hasattr(self, method_name):
+            log.debug(f'Missing method for type serialization {method_name}')
+            return
+        if self.native_types and getattr(
+            self.__class__, method_name
+        ) is getattr(Serialize, method_name, None):
+            try:
+                if type.python_type in self.native_types:
+                    return
+            except NotImplementedError:
+                pass
+        return partial(getattr(self, method_name), type)
+
     def serialize(self, name, column):
         return self._serialize(column.type, getattr(self.model, name))
 
@@ -166,6 +298,9 @@ class Deserialize(object):
     ...
     ```
 
+    As for #::unrest.coercers#Serialize, the per column coercion is
+    resolved once into a plan used by #create and #mappings on batches.
+
     # Arguments
         payload: The payload to deserialize
         columns: The list of columns to deserialize
@@ -174,6 +309,7 @@ class Deserialize(object):
     def __init__(self, payload, columns):
         self.payload = payload
         self.columns = columns
+        self._plan = None
 
     def merge(self, item, payload=None):
         """Deserialize the given payload into the existing sqlalchemy `item`"""
@@ -181,14 +317,96 @@ class Deserialize(object):
             setattr(item, name, self.deserialize(name, column, payload))
         return item
 
-    def create(self, factory):
+    def create(self, factory, objects=None):
+        """
+        Deserialize objects in the given payload (or `objects` if given) into
+        a list of new items created with the `factory` function.
+        """
+        if objects is None:
+            objects = self.payload['objects']
+        if not self.compilable:
+            return [self.merge(factory(), item) for item in objects]
+
+        rv = []
+        for mapping in self._run(objects):
+            item = factory()
+            for name, value in mapping.items():
+                setattr(item, name, value)
+            rv.append(item)
+        return rv
+
+    def mappings(self, objects=None, primary_keys=()):
+        """
+        Deserialize objects in the given payload (or `objects` if given) into
+        a list of plain dicts suitable for `session.bulk_insert_mappings`.
+        `primary_keys` set to None are left out so that they can be generated.
+        """
+        if objects is None:
+            objects = self.payload['objects']
+        if self.compilable:
+            mappings = self._run(objects)
+        else:
+            mappings = [
+                {
+                    name: self.deserialize(name, column, item)
+                    for name, column in self.columns.items()
+                }
+                for item in objects
+            ]
+        for mapping in mappings:
+            for pk in primary_keys:
+                if mapping.get(pk, False) is None:
+                    del mapping[pk]
+        return mappings
+
+    def _run(self, objects):
+        plan = self.plan
+        rv = []
+        for item in objects:
+            mapping = {}
+            for name, coerce in plan:
+                data = item.get(name)
+                if data is not None and coerce is not None:
+                    data = coerce(data)
+                mapping[name] = data
+            rv.append(mapping)
+        return rv
+
+    @property
+    def compilable(self):
         """
-        Deserialize objects in the given payload into a list of new items
-        created with the `factory` function.
+        Returns whether this deserializer can use a compiled plan, that is if
+        none of `merge`, `deserialize` and `_deserialize` are overridden.
         """
-        return [
-            self.merge(factory(), item) for item in self.payload['objects']
-        ]
+        cls = type(self)
+        return all(
+            getattr(cls, name) is getattr(Deserialize, name)
+            for name in ('merge', 'deserialize', '_deserialize')
+        )
+
+    @property
+    def plan(self):
+        """
+        The deserialization plan of this deserializer as `(name, coercer)`
+        tuples, compiled on first access.
+        """
+        if self._plan is None:
+            self._plan = tuple(
+                (name, self.coercer(column.type))
+                for name, column in self.columns.items()
+            )
+        return self._plan
+
+    def coercer(self, type):
+        """
+        Resolve the `deserialize_type` method for `type` into a one argument
+        function or None if data is returned as is.
+        """
+        method_name = f'deserialize_{type.__class__.__name__.lower()}'
+        if not hasattr(self, method_name):
+            log.debug(f'Missing method for type deserialization {method_name}')
+            return
+        return partial(getattr(self, method_name), type)
 
     def deserialize(self, name, column, payload=None):
         payload = payload or self.payload
@@ -1,3 +1,8 @@
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+from inspect import isawaitable
+
+
 class Framework(object):
     """
     UnRest Framework abstract class.
@@ -12,11 +17,24 @@ class Framework(object):
         app: Your framework instance used in `register_route` to register
             route.
         url: The current UnRest url ('/api' by default)
+        executor: For asynchronous frameworks, an executor (or the number
+            of threads of a thread pool executor) in which synchronous
+            routes are run instead of blocking the event loop (see #run).
+        teardown: A function called after each route, i.e. `session.remove`
+            for a thread scoped session: in the executor thread if there is
+            one, otherwise once the response is sent (for the WSGI and ASGI
+            frameworks).
     """
 
-    def __init__(self, app, url):
+    def __init__(self, app, url, executor=None, teardown=None):
         self.app = app
         self.url = url
+        if isinstance(executor, int):
+            executor = ThreadPoolExecutor(
+                executor, thread_name_prefix='unrest'
+            )
+        self.executor = executor
+        self.teardown = teardown
 
     def register_route(self, path, method, parameters, function):
         """
@@ -37,6 +55,38 @@ class Framework(object):
             'You have to implement the register route method'
         )
 
+    async def run(self, function, request):
+        """
+        Helper for asynchronous frameworks that returns the response of the
+        route `function` for the `request`. If an `executor` is set, the
+        function is run in it (streamed payloads included), otherwise it is
+        run on the event loop. Awaitable responses are awaited.
+
+        # Arguments
+            function: The route function
+            request: The #::unrest.util#Request
+        """
+        if self.executor is None:
+            response = function(request)
+        else:
+            response = await asyncio.get_running_loop().run_in_executor(
+                self.executor, self._run_sync, function, request
+            )
+        if isawaitable(response):
+            response = await response
+        return response
+
+    def _run_sync(self, function, request):
+        try:
+            response = function(request)
+            if not isawaitable(response) and response.streamed:
+                # The stream must be consumed with this thread session
+                response.payload = list(response.payload)
+            return response
+        finally:
+            if self.teardown:
+                self.teardown()
+
     @property
     def external_url(self):
         """
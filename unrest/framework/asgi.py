@@ -0,0 +1,199 @@
+import logging
+from collections.abc import Mapping
+from functools import partial
+from urllib.parse import parse_qs
+
+from ..util import Request, to_bytes
+from .router import RouterFramework
+
+log = logging.getLogger(__name__)
+
+
+async def not_found(scope, receive, send):
+    """
+    An ASGI application answering 404 to every http request and accepting
+    the lifespan events.
+    """
+    if scope['type'] == 'lifespan':
+        while True:
+            message = await receive()
+            if message['type'] == 'lifespan.startup':
+                await send({'type': 'lifespan.startup.complete'})
+            elif message['type'] == 'lifespan.shutdown':
+                await send({'type': 'lifespan.shutdown.complete'})
+                return
+    if scope['type'] != 'http':
+        return
+    await send(
+        {
+            'type': 'http.response.start',
+            'status': 404,
+            'headers': [(b'content-type', b'text/plain')],
+        }
+    )
+    await send({'type': 'http.response.body', 'body': b'Not Found'})
+
+
+class ASGIApplication(object):
+    """
+    A minimal ASGI application on which #ASGIFramework routes are mounted.
+
+    ```python
+    app = ASGIApplication()
+    rest = UnRest(app, session, framework=ASGIFramework)
+    rest(Model)
+    # uvicorn module:app
+    ```
+
+    # Arguments
+        application: The ASGI application answering the requests not handled
+            by unrest, defaults to #not_found.
+    """
+
+    def __init__(self, application=None):
+        self.application = application or not_found
+
+    async def __call__(self, scope, receive, send):
+        await self.application(scope, receive, send)
+
+
+class ScopeHeaders(Mapping):
+    """A case insensitive read-only view of the headers of an ASGI scope."""
+
+    def __init__(self, headers):
+        self.headers = headers
+
+    def __getitem__(self, name):
+        key = name.lower().encode('latin-1')
+        values = [value for header, value in self.headers if header == key]
+        if not values:
+            raise KeyError(name)
+        return b', '.join(values).decode('latin-1')
+
+    def __iter__(self):
+        return iter(
+            {
+                header.decode('latin-1').title(): None
+                for header, _ in self.headers
+            }
+        )
+
+    def __len__(self):
+        return len({header for header, _ in self.headers})
+
+
+def request_url(scope):
+    """Rebuild the full request url of the ASGI `scope`."""
+    host = ScopeHeaders(scope['headers']).get('Host')
+    if host is None:
+        host, port = scope['server']
+        host = f'{host}:{port}'
+    url = f"{scope['scheme']}://{host}{scope.get('root_path', '')}"
+    url += scope['path']
+    if scope['query_string']:
+        url += '?' + scope['query_string'].decode('latin-1')
+    return url
+
+
+class ASGIFramework(RouterFramework):
+    """
+    Unrest #::unrest.framework#Framework implementation for any ASGI server
+    (uvicorn, hypercorn, daphne...) without a web framework.
+
+    The `app` must have an `application` attribute holding an ASGI
+    application (like #ASGIApplication): it is replaced by this framework
+    which answers the http requests to its url and passes the others to the
+    previous application.
+
+    Routes are run like with the other asynchronous frameworks (see
+    #::unrest.framework#Framework.run). The url and query string of the
+    requests are only parsed when read, the headers are a view of the scope
+    (see #ScopeHeaders) and response payloads (bytes or iterables of bytes
+    chunks) are sent without being copied.
+
+    Without an `executor`, the `teardown` function is called after the last
+    body message of each response (with an executor, it is called in the
+    executor thread instead).
+
+    This implementation requires no external library.
+    """
+
+    def __init__(self, app, url, executor=None, teardown=None):
+        super().__init__(app, url, executor, teardown)
+        self.application = app.application
+        app.application = self
+
+    async def __call__(self, scope, receive, send):
+        path = scope.get('path', '')
+        found = (
+            scope['type'] == 'http'
+            and path.startswith(self.url)
+            and self.lookup(path)
+        )
+        if not found:
+            return await self.application(scope, receive, send)
+        methods, url_parameters = found
+        method = scope['method']
+        # With a corresponding method
+        if method not in methods:
+            return await self.send(send, 405, 'Method Not Allowed')
+
+        body = []
+        more_body = True
+        while more_body:
+            message = await receive()
+            body.append(message.get('body', b''))
+            more_body = message.get('more_body', False)
+        request = Request(
+            partial(request_url, scope),
+            method,
+            url_parameters,
+            partial(
+                parse_qs,
+                scope['query_string'].decode('latin-1'),
+                keep_blank_values=True,
+            ),
+            b''.join(body),
+            ScopeHeaders(scope['headers']),
+        )
+
+        try:
+            try:
+                response = await self.run(methods[method], request)
+            except Exception:
+                log.exception(f'Error on {method} {path}')
+                return await self.send(send, 500, 'Internal Server Error')
+            await self.send(
+                send, response.status, response.payload, response.headers
+            )
+        finally:
+            if self.teardown and self.executor is None:
+                self.teardown()
+
+    async def send(self, send, status, payload, headers=None):
+        await send(
+            {
+                'type': 'http.response.start',
+                'status': status,
+                'headers': [
+                    (name.encode('latin-1'), str(value).encode('latin-1'))
+                    for name, value in (headers or {}).items()
+                ],
+            }
+        )
+        if isinstance(payload, (str, bytes)):
+            await send(
+                {'type': 'http.response.body', 'body': to_bytes(payload)}
+            )
+            return
+
+        for chunk in payload:
+            if chunk:
+                await send(
+                    {
+                        'type': 'http.response.body',
+                        'body': chunk,
+                        'more_body': True,
+                    }
+                )
+        await send({'type': 'http.response.body', 'body': b''})
@@ -2,7 +2,7 @@ import logging
 from functools import wraps
 
 from flask import request as flask_request
-from flask import url_for
+from flask import stream_with_context, url_for
 
 from ..util import Request
 from . import Framework
@@ -25,19 +25,24 @@ class FlaskFramework(Framework):
 
         @wraps(function)
         def unrest_fun(**url_parameters):
+            req = flask_request._get_current_object()
             request = Request(
-                flask_request.url,
-                flask_request.method,
+                lambda: req.url,
+                req.method,
                 url_parameters,
-                dict(flask_request.args.lists()),
-                flask_request.data,
-                flask_request.headers,
+                lambda: dict(req.args.lists()),
+                req.get_data,
+                req.headers,
             )
 
             response = function(request)
+            payload = response.payload
+            if response.streamed:
+                # Keep the request context (and the session) during streaming
+                payload = stream_with_context(payload)
 
             return self.app.response_class(
-                response.payload,
+                payload,
                 status=response.status,
                 headers=response.headers,
             )
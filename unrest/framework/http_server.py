@@ -1,15 +1,15 @@
 import logging
-import re
+from functools import partial
 from types import MethodType
 from urllib.parse import parse_qs, urlparse
 
-from ..util import Request
-from . import Framework
+from ..util import Request, to_bytes
+from .router import RouterFramework
 
 log = logging.getLogger(__name__)
 
 
-class HTTPServerFramework(Framework):
+class HTTPServerFramework(RouterFramework):
     """
     Unrest #::unrest.framework#Framework implementation for
     [http.server.HTTPServer](https://docs.python.org/3/library/http.server.html)
@@ -20,7 +20,6 @@ class HTTPServerFramework(Framework):
 
     def __init__(self, app, url):
         super().__init__(app, url)
-        self.url_map = {}
         parent = self
 
         class HTTPServerFrameworkHandlerClass(self.app.RequestHandlerClass):
@@ -44,27 +43,49 @@ class HTTPServerFramework(Framework):
 
             def handle_request(self, method):
                 url = urlparse(self.path)
-                # Look up in the url_map if we have matching endpoint
-                for path, methods in parent.url_map.items():
-                    match = re.fullmatch(path, url.path)
-                    if match:
-                        # With a corresponding method
-                        if method not in methods:
-                            return self.send(405, 'Method Not Allowed')
-                        return self.respond(
-                            url, method, methods[method], match.groupdict()
-                        )
-                return self.send(404, 'Not Found')
+                # Look up in the route trie if we have matching endpoint
+                found = parent.lookup(url.path)
+                if not found:
+                    return self.send(404, 'Not Found')
+                methods, url_parameters = found
+                # With a corresponding method
+                if method not in methods:
+                    return self.send(405, 'Method Not Allowed')
+                return self.respond(
+                    url, method, methods[method], url_parameters
+                )
 
             def send(self, status, message, headers=None):
                 headers = headers or {}
+                streamed = not isinstance(message, (str, bytes))
+                # Both ends must speak HTTP/1.1 to use chunked encoding
+                chunked = streamed and (
+                    self.protocol_version >= 'HTTP/1.1'
+                    and self.request_version >= 'HTTP/1.1'
+                )
+                if streamed and not chunked:
+                    self.close_connection = True
                 self.send_response(status)
 
                 for name, value in headers.items():
                     self.send_header(name, value)
+                if chunked:
+                    self.send_header('Transfer-Encoding', 'chunked')
                 self.end_headers()
 
-                self.wfile.write(message.encode('utf-8'))
+                if not streamed:
+                    self.wfile.write(to_bytes(message))
+                    return
+
+                # HTTP/1.0 streamed responses are delimited by connection close
+                for chunk in message:
+                    if not chunk:
+                        continue
+                    if chunked:
+                        chunk = b'%x\r\n%b\r\n' % (len(chunk), chunk)
+                    self.wfile.write(chunk)
+                if chunked:
+                    self.wfile.write(b'0\r\n\r\n')
 
             def respond(self, url, method, function, url_parameters):
                 length = (
@@ -72,12 +93,13 @@ class HTTPServerFramework(Framework):
                     if 'Content-Length' in self.headers
                     else 0
                 )
-                body = self.rfile.read(length) if length else ''
+                # The body is always read to leave the connection clean
+                body = self.rfile.read(length) if length else b''
                 request = Request(
                     url.path,
                     method,
                     url_parameters,
-                    parse_qs(url.query),
+                    partial(parse_qs, url.query, keep_blank_values=True),
                     body,
                     self.headers,
                 )
@@ -90,28 +112,3 @@ class HTTPServerFramework(Framework):
                 self.send(response.status, response.payload, response.headers)
 
         self.app.RequestHandlerClass = HTTPServerFrameworkHandlerClass
-
-    def register_route(self, path, method, parameters, function):
-        name = self._name(function.__name__.replace(method + '_', ''))
-        # Creating an url regex that accept parameters
-        if parameters:
-            params = '/'.join(f'(?P<{param}>.+)' for param in parameters)
-            path_with_params = f'{path}(?:/{params})?'
-        else:
-            path_with_params = path
-
-        # If this is the first method for path, initialize method mapping
-        if path_with_params not in self.url_map:
-            self.url_map[path_with_params] = {}
-
-        if method in self.url_map[path_with_params]:
-            raise KeyError(
-                f'Method {method} is already registered for path {path}'
-            )
-
-        log.info(
-            f'Registering route {name} for {path_with_params} for {method}'
-        )
-
-        # Associate UnRest function with path and method
-        self.url_map[path_with_params][method] = function
@@ -0,0 +1,118 @@
+import logging
+import re
+
+from . import Framework
+
+log = logging.getLogger(__name__)
+
+
+class RouteNode(object):
+    """
+    A node of the #RouterFramework route trie.
+
+    Each node corresponds to a literal path segment and holds the routes
+    registered for the path ending at this segment as a list of
+    `(pattern, methods)` where `pattern` is the precompiled regex matching
+    the url parameters (or `None` if the route has no parameters).
+    """
+
+    __slots__ = ('children', 'routes')
+
+    def __init__(self):
+        self.children = {}
+        self.routes = []
+
+    def walk(self, segments):
+        """Returns the nodes along the longest literal prefix of `segments`."""
+        nodes = [self]
+        node = self
+        for segment in segments:
+            node = node.children.get(segment)
+            if node is None:
+                break
+            nodes.append(node)
+        return nodes
+
+    def match(self, remainder):
+        """
+        Returns the first `(methods, url_parameters)` of this node routes
+        matching the `remainder` of the path (`None` if the path ends at this
+        node), or `None`.
+        """
+        for pattern, methods in self.routes:
+            if remainder is None:
+                return methods, dict.fromkeys(
+                    pattern.groupindex if pattern else ()
+                )
+            if pattern:
+                match = pattern.fullmatch(remainder)
+                if match:
+                    return methods, match.groupdict()
+
+
+class RouterFramework(Framework):
+    """
+    Base #::unrest.framework#Framework for the frameworks without routing
+    which dispatch the requests themselves with #lookup.
+
+    Routes are stored in a trie of literal path segments with their url
+    parameters regex precompiled.
+    """
+
+    def __init__(self, app, url, executor=None, teardown=None):
+        super().__init__(app, url, executor, teardown)
+        self.url_map = {}
+        self.routes = RouteNode()
+
+    def lookup(self, path):
+        """
+        Returns the `(methods, url_parameters)` of the endpoint matching
+        `path` or `None`.
+
+        The route trie is walked down along the literal path segments and the
+        deepest matching endpoint is tried first.
+        """
+        segments = path.split('/')
+        nodes = self.routes.walk(segments)
+        for depth in range(len(nodes) - 1, -1, -1):
+            remainder = segments[depth:]
+            found = nodes[depth].match(
+                '/'.join(remainder) if remainder else None
+            )
+            if found:
+                return found
+
+    def register_route(self, path, method, parameters, function):
+        name = self._name(function.__name__.replace(method + '_', ''))
+        # Creating an url regex that accept parameters
+        if parameters:
+            params = '/'.join(f'(?P<{param}>.+)' for param in parameters)
+            path_with_params = f'{path}(?:/{params})?'
+        else:
+            path_with_params = path
+
+        # If this is the first method for path, initialize method mapping
+        # and add it to the route trie with its precompiled parameters regex
+        if path_with_params not in self.url_map:
+            self.url_map[path_with_params] = {}
+            node = self.routes
+            for segment in path.split('/'):
+                node = node.children.setdefault(segment, RouteNode())
+            node.routes.append(
+                (
+                    re.compile(params) if parameters else None,
+                    self.url_map[path_with_params],
+                )
+            )
+
+        if method in self.url_map[path_with_params]:
+            raise KeyError(
+                f'Method {method} is already registered for path {path}'
+            )
+
+        log.info(
+            f'Registering route {name} for {path_with_params} for {method}'
+        )
+
+        # Associate UnRest function with path and method
+        self.url_map[path_with_params][method] = function
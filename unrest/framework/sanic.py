@@ -3,7 +3,7 @@ from functools import wraps
 
 from sanic import response
 
-from ..util import Request
+from ..util import Request, to_bytes
 from . import Framework
 
 log = logging.getLogger(__name__)
@@ -12,7 +12,15 @@ log = logging.getLogger(__name__)
 class SanicFramework(Framework):
     """
     Unrest #::unrest.framework#Framework implementation for Sanic.
-    Sadly only synchroneous sqlalchemy query are supported for now.
+
+    With a synchronous session, the routes are run on the event loop unless
+    an `executor` is given (see #::unrest.framework#Framework.run). Use a
+    SQLAlchemy (>= 1.4) `AsyncSession` to await the database IO (see
+    #::unrest.rest#Rest.async_route).
+
+    Streamed responses (see the `stream` option of #::unrest.rest#Rest) are
+    written after the response middlewares are run: if you release your
+    session in one of them, wrap the response `streaming_fn` to do so.
 
     Requires [Sanic](https://sanicframework.org/) to be installed.
     """
@@ -21,20 +29,33 @@ class SanicFramework(Framework):
         name = self._name(function.__name__)
 
         @wraps(function)
-        def unrest_fun(request, **url_parameters):
+        async def unrest_fun(request, **url_parameters):
             req = Request(
-                request.url,
+                lambda: request.url,
                 request.method,
                 url_parameters,
-                dict(request.args),
+                lambda: dict(request.get_args(keep_blank_values=True)),
                 request.body,
                 request.headers,
             )
 
-            res = function(req)
+            res = await self.run(function, req)
+
+            if res.streamed:
+
+                async def streaming_fn(stream):
+                    for chunk in res.payload:
+                        await stream.write(chunk)
+
+                return response.stream(
+                    streaming_fn,
+                    status=res.status,
+                    headers=res.headers,
+                    content_type=res.headers.get('Content-Type'),
+                )
 
             return response.raw(
-                res.payload.encode('utf-8'),
+                to_bytes(res.payload),
                 status=res.status,
                 headers=res.headers,
             )
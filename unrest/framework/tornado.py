@@ -13,13 +13,18 @@ class TornadoFramework(Framework):
     """
     Unrest #::unrest.framework#Framework implementation for Tornado.
 
+    With a synchronous session, the routes are run on the IOLoop unless an
+    `executor` is given (see #::unrest.framework#Framework.run). Use a
+    SQLAlchemy (>= 1.4) `AsyncSession` to await the database IO (see
+    #::unrest.rest#Rest.async_route).
+
     Requires [tornado](https://www.tornadoweb.org/) to be installed.
     """
 
     __RequestHandlerClass__ = RequestHandler
 
-    def __init__(self, app, url):
-        super().__init__(app, url)
+    def __init__(self, app, url, executor=None, teardown=None):
+        super().__init__(app, url, executor, teardown)
         self.router = _ApplicationRouter(app)
         self.app.default_router.add_rules([(url + r'(.*)', self.router)])
 
@@ -55,25 +60,34 @@ class TornadoFramework(Framework):
             f'Registering route {name} for {path_with_params} for {method}'
         )
 
+        framework = self
+
         @wraps(function)
-        def tornado_fun(self, **url_parameters):
+        async def tornado_fun(self, **url_parameters):
+            query_arguments = self.request.query_arguments
             request = Request(
                 self.request.path,
                 self.request.method,
                 url_parameters,
-                {
+                lambda: {
                     key: [val.decode('utf-8') for val in values]
-                    for key, values in self.request.query_arguments.items()
+                    for key, values in query_arguments.items()
                 },
                 self.request.body,
                 self.request.headers,
             )
 
-            response = function(request)
+            response = await framework.run(function, request)
             for name, value in response.headers.items():
                 self.set_header(name, value)
             self.set_status(response.status)
-            self.write(response.payload)
+            if response.streamed:
+                for chunk in response.payload:
+                    self.write(chunk)
+                    await self.flush()
+            elif response.payload:
+                # 304 responses must not write a body, even empty
+                self.write(response.payload)
 
         setattr(Handler, method.lower(), tornado_fun)
 
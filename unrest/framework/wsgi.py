@@ -0,0 +1,167 @@
+import logging
+from collections.abc import Mapping
+from functools import partial
+from http import HTTPStatus
+from urllib.parse import parse_qs
+from wsgiref.util import request_uri
+
+from ..util import Request, to_bytes
+from .router import RouterFramework
+
+log = logging.getLogger(__name__)
+
+
+def not_found(environ, start_response):
+    """A WSGI application answering 404 to every request."""
+    start_response('404 Not Found', [('Content-Type', 'text/plain')])
+    return [b'Not Found']
+
+
+class WSGIApplication(object):
+    """
+    A minimal WSGI application on which #WSGIFramework routes are mounted.
+
+    ```python
+    app = WSGIApplication()
+    rest = UnRest(app, session, framework=WSGIFramework)
+    rest(Model)
+    # gunicorn module:app
+    ```
+
+    # Arguments
+        application: The WSGI application answering the requests not handled
+            by unrest, defaults to #not_found.
+    """
+
+    def __init__(self, application=None):
+        self.application = application or not_found
+
+    def __call__(self, environ, start_response):
+        return self.application(environ, start_response)
+
+
+class EnvironHeaders(Mapping):
+    """A case insensitive read-only view of the headers of a WSGI environ."""
+
+    def __init__(self, environ):
+        self.environ = environ
+
+    def _key(self, name):
+        key = name.upper().replace('-', '_')
+        if key in ('CONTENT_TYPE', 'CONTENT_LENGTH'):
+            return key
+        return f'HTTP_{key}'
+
+    def __getitem__(self, name):
+        value = self.environ.get(self._key(name))
+        if not value:
+            raise KeyError(name)
+        return value
+
+    def __iter__(self):
+        for key, value in self.environ.items():
+            if key.startswith('HTTP_'):
+                yield key[5:].replace('_', '-').title()
+            elif key in ('CONTENT_TYPE', 'CONTENT_LENGTH') and value:
+                yield key.replace('_', '-').title()
+
+    def __len__(self):
+        return sum(1 for _ in self)
+
+
+class ClosingPayload(object):
+    """
+    A WSGI response iterable calling `teardown` when closed by the server,
+    once the response (streamed chunks included) has been fully sent.
+    """
+
+    def __init__(self, payload, teardown):
+        self.payload = payload
+        self.teardown = teardown
+
+    def __iter__(self):
+        return iter(self.payload)
+
+    def close(self):
+        try:
+            if hasattr(self.payload, 'close'):
+                self.payload.close()
+        finally:
+            self.teardown()
+
+
+def read_payload(environ):
+    """Read the request body of the WSGI `environ`."""
+    length = int(environ.get('CONTENT_LENGTH') or 0)
+    return environ['wsgi.input'].read(length) if length else b''
+
+
+class WSGIFramework(RouterFramework):
+    """
+    Unrest #::unrest.framework#Framework implementation for any WSGI server
+    (gunicorn, uwsgi, wsgiref...) without a web framework.
+
+    The `app` must have an `application` attribute holding a WSGI
+    application (like #WSGIApplication): it is replaced by this framework
+    which answers the requests to its url and passes the others to the
+    previous application.
+
+    The url, query string and body of the requests are only parsed when
+    read, the headers are a view of the environ (see #EnvironHeaders) and
+    response payloads (bytes or iterables of bytes chunks) are handed to the
+    server without being copied.
+
+    If a `teardown` function is given (i.e. `session.remove` for a scoped
+    session), it is called after each response of an unrest route has been
+    sent, when the server closes the response iterable (see #ClosingPayload).
+
+    This implementation requires no external library.
+    """
+
+    def __init__(self, app, url, teardown=None):
+        super().__init__(app, url, teardown=teardown)
+        self.application = app.application
+        app.application = self
+
+    def __call__(self, environ, start_response):
+        path = environ.get('PATH_INFO') or '/'
+        found = path.startswith(self.url) and self.lookup(path)
+        if not found:
+            return self.application(environ, start_response)
+        methods, url_parameters = found
+        method = environ['REQUEST_METHOD']
+        # With a corresponding method
+        if method not in methods:
+            return self.send(start_response, 405, 'Method Not Allowed')
+
+        request = Request(
+            partial(request_uri, environ),
+            method,
+            url_parameters,
+            partial(
+                parse_qs,
+                environ.get('QUERY_STRING', ''),
+                keep_blank_values=True,
+            ),
+            partial(read_payload, environ),
+            EnvironHeaders(environ),
+        )
+        try:
+            response = methods[method](request)
+        except Exception:
+            log.exception(f'Error on {method} {path}')
+            return self.send(start_response, 500, 'Internal Server Error')
+        return self.send(
+            start_response, response.status, response.payload, response.headers
+        )
+
+    def send(self, start_response, status, payload, headers=None):
+        start_response(
+            f'{status} {HTTPStatus(status).phrase}',
+            [(name, str(value)) for name, value in (headers or {}).items()],
+        )
+        if isinstance(payload, (str, bytes)):
+            payload = [to_bytes(payload)]
+        if self.teardown:
+            return ClosingPayload(payload, self.teardown)
+        return payload
@@ -1,3 +1,6 @@
+from ..util import Response
+
+
 class Idiom(object):
     """
     UnRest Idiom abstract class.
@@ -20,6 +23,14 @@ class Idiom(object):
     def __init__(self, rest):
         self.rest = rest
 
+    @property
+    def native_types(self):
+        """
+        The python types that this idiom encodes natively, and thus don't need
+        to be coerced by the #::unrest.coercers#Serialize plan.
+        """
+        return ()
+
     def request_to_payload(self, request):
         """
         This method takes a #::unrest.util#Request `request` parameter and
@@ -45,10 +56,43 @@ class Idiom(object):
             status: The current status (500 if route raised an error)
 
         # Returns
-        An #::unrest.util#Response response object.
+        An #::unrest.util#Response response object, preferably with a bytes
+        (or iterable of bytes) payload.
         """
         raise NotImplementedError()
 
+    def not_modified(self, request, headers):
+        """
+        This method returns the #::unrest.util#Response of a conditional GET
+        whose content did not change (see the `etag` option of
+        #::unrest.rest#Rest).
+
+        The default implementation returns an empty 304 response.
+
+        # Arguments
+            request: The original #::unrest.util#Request request
+            headers: The `ETag` and `Last-Modified` headers
+
+        # Returns
+        An #::unrest.util#Response response object.
+        """
+        return Response(b'', headers, 304)
+
+    def count_mode(self, request):
+        """
+        This method takes the `request` and returns the count mode it asks for
+        (see #::unrest.rest#Rest) or None to use the rest one.
+
+        The default implementation uses the `_count` query parameter.
+
+        # Arguments
+            request: The original #::unrest.util#Request request
+
+        # Returns
+        The count mode or None.
+        """
+        return (request.query or {}).get('_count', [None])[0]
+
     def alter_query(self, request, query):
         """
         This method takes the `request` and the current `query` and returns
@@ -1,12 +1,13 @@
-import json
+from base64 import urlsafe_b64decode, urlsafe_b64encode
 from collections import defaultdict
+from collections.abc import Iterator
 from itertools import zip_longest
 
-from sqlalchemy import asc, desc, func, or_
+from sqlalchemy import and_, asc, desc, false, func, or_, tuple_
 from sqlalchemy.sql.expression import cast
 from sqlalchemy.types import String
 
-from ..util import Response
+from ..util import Response, iterencode, to_bytes
 from . import Idiom
 
 PK_DELIM = '___'
@@ -34,13 +35,30 @@ class JsonServerIdiom(Idiom):
     (`_gte`, `_lte`, `_ne`, `_like`)
     and `q` full-text search (which works better with
     [SQLAlchemy-Searchable](https://sqlalchemy-searchable.readthedocs.io))
+
+    It also supports keyset pagination with the `_cursor` parameter
+    (empty for the first page) and `_limit` (10 by default).
+    Pages are then ordered by the `_sort` columns and the primary keys
+    (NULL values last, or first in descending order), and the opaque cursor
+    of the next page is returned in the `X-Next-Cursor` header if there's
+    one.
+    Unlike `_page` or `_start`, a deep page costs the same as the first one.
+    In this mode `X-Total-Count` is the number of remaining items.
     """
 
+    @property
+    def codec(self):
+        return self.rest.unrest.codec
+
+    @property
+    def native_types(self):
+        return self.codec.native_types
+
     def request_to_payload(self, request):
         if request.payload:
             try:
-                data = json.loads(request.payload.decode('utf-8'))
-            except json.JSONDecodeError as e:
+                data = self.codec.loads(request.payload)
+            except ValueError as e:
                 self.rest.raise_error(400, f'JSON Error in payload: {e}')
             if isinstance(data, list):
                 return {'objects': data}
@@ -56,8 +74,8 @@ class JsonServerIdiom(Idiom):
             status = 404
 
         if 'objects' in data:
-            objects = data['objects']
-            for object in objects:
+
+            def flatten(object):
                 for key, relationship in self.rest.relationships.items():
                     object[key] = (
                         [
@@ -73,26 +91,169 @@ class JsonServerIdiom(Idiom):
                             for ref in object[key]
                         ]
                     )
-            # When there's parameter it applies on a unique object
-            # except from POST
-            if (
-                request.parameters
-                and all(
-                    value is not None for value in request.parameters.values()
-                )
-                or request.method == 'POST'
-            ):
-                objects = objects[0]
-            payload = json.dumps(objects)
+                return object
+
+            objects = data['objects']
+            if isinstance(objects, Iterator):
+                payload = iterencode(map(flatten, objects), self.codec.dumps)
+            else:
+                objects = [flatten(object) for object in objects]
+                # When there's parameter it applies on a unique object
+                # except from POST
+                if (
+                    request.parameters
+                    and all(
+                        value is not None
+                        for value in request.parameters.values()
+                    )
+                    or request.method == 'POST'
+                ):
+                    objects = objects[0]
+                payload = to_bytes(self.codec.dumps(objects))
         else:
-            payload = json.dumps(data)
+            payload = to_bytes(self.codec.dumps(data))
         headers = {'Content-Type': 'application/json'}
         if 'occurences' in data:
             headers['X-Total-Count'] = data['occurences']
             headers['Access-Control-Expose-Headers'] = 'X-Total-Count'
+        if (
+            request.method == 'GET'
+            and '_cursor' in request.query
+            and isinstance(data.get('objects'), list)
+            and len(data['objects']) == self.cursor_limit(request)
+        ):
+            headers['X-Next-Cursor'] = self.encode_cursor(
+                request, data['objects'][-1]
+            )
+            headers['Access-Control-Expose-Headers'] = (
+                'X-Total-Count, X-Next-Cursor'
+                if 'occurences' in data
+                else 'X-Next-Cursor'
+            )
         response = Response(payload, headers, status)
         return response
 
+    def cursor_limit(self, request):
+        """The page size in keyset pagination mode."""
+        return int(request.query.get('_limit', ['10'])[0] or 10)
+
+    def cursor_columns(self, request):
+        """
+        Returns the list of `(name, descending)` keyset pagination columns
+        from the `_sort` and `_order` parameters followed by the primary keys.
+        """
+        sorts = request.query.get('_sort', [''])[0]
+        orders = request.query.get('_order', [''])[0]
+        columns = {}
+        if sorts:
+            for sort, way in zip_longest(
+                sorts.split(','), orders.split(','), fillvalue='asc'
+            ):
+                if (
+                    sort not in self.rest.columns
+                    and sort not in self.rest.primary_keys
+                ):
+                    self.rest.raise_error(
+                        400, f'Cannot paginate with a cursor on {sort}'
+                    )
+                columns[sort] = way.lower() == 'desc'
+        for pk in self.rest.primary_keys:
+            columns.setdefault(pk, False)
+        return list(columns.items())
+
+    def encode_cursor(self, request, object):
+        """Encode the cursor pointing after the serialized `object`."""
+        values = [object[name] for name, _ in self.cursor_columns(request)]
+        return urlsafe_b64encode(to_bytes(self.codec.dumps(values))).decode(
+            'ascii'
+        )
+
+    def decode_cursor(self, request, cursor):
+        """Decode the `cursor` into the model values it points after."""
+        columns = self.cursor_columns(request)
+        try:
+            values = self.codec.loads(urlsafe_b64decode(cursor.encode()))
+            assert isinstance(values, list) and len(values) == len(columns)
+        except (ValueError, AssertionError):
+            self.rest.raise_error(400, f'Invalid cursor {cursor}')
+        values = dict(zip((name for name, _ in columns), values))
+        pks = self.rest.parameters_to_pks(
+            {pk: values[pk] for pk in self.rest.primary_keys}
+        )
+        deserialize = self.rest.DeserializeClass(values, self.rest.columns)
+        return [
+            (
+                pks[name]
+                if name in pks
+                else deserialize.deserialize(name, self.rest.columns[name])
+            )
+            for name, _ in columns
+        ]
+
+    def cursor_nullable(self, name):
+        """Returns whether the keyset pagination column `name` can be NULL."""
+        return getattr(self.rest.columns.get(name), 'nullable', True)
+
+    def cursor_order(self, request):
+        """
+        Returns the keyset pagination order by clauses, with NULL values
+        sorted last (or first in descending order) on every database.
+        """
+        Model = self.rest.Model
+        order = []
+        for name, descending in self.cursor_columns(request):
+            column = getattr(Model, name)
+            way = desc if descending else asc
+            if self.cursor_nullable(name):
+                order.append(way(column.is_(None)))
+            order.append(way(column))
+        return order
+
+    def after_cursor(self, request, cursor):
+        """
+        Returns the condition selecting the rows after the `cursor` in the
+        keyset order.
+        """
+        Model = self.rest.Model
+        columns = [
+            (getattr(Model, name), descending, self.cursor_nullable(name))
+            for name, descending in self.cursor_columns(request)
+        ]
+        values = self.decode_cursor(request, cursor)
+        if len({descending for _, descending, _ in columns}) == 1 and not any(
+            nullable for _, _, nullable in columns
+        ):
+            # Same direction for all columns: use a row value comparison
+            row = tuple_(*[column for column, _, _ in columns])
+            cursor_row = tuple_(*values)
+            return row < cursor_row if columns[0][1] else row > cursor_row
+
+        def equal(column, value):
+            return column.is_(None) if value is None else column == value
+
+        def after(column, descending, nullable, value):
+            # NULL values are after the others, before them if descending
+            if value is None:
+                return column.isnot(None) if descending else false()
+            if descending:
+                return column < value
+            if nullable:
+                return or_(column > value, column.is_(None))
+            return column > value
+
+        return or_(
+            *[
+                and_(
+                    *[
+                        equal(column, value)
+                        for (column, _, _), value in zip(columns[:i], values)
+                    ],
+                    after(column, descending, nullable, values[i]),
+                )
+                for i, (column, descending, nullable) in enumerate(columns)
+            ]
+        )
+
     def alter_query(self, request, query):
         Model = self.rest.Model
         params = defaultdict(str)
@@ -147,6 +308,16 @@ class JsonServerIdiom(Idiom):
                     )
                 )
 
+        # Keyset pagination
+        if '_cursor' in request.query and request.method == 'GET':
+            if params['cursor']:
+                query = query.filter(
+                    self.after_cursor(request, params['cursor'])
+                )
+            return query.order_by(*self.cursor_order(request)).limit(
+                self.cursor_limit(request)
+            )
+
         # Order
         if params['sort'] and request.method == 'GET':
             for sort, way in zip_longest(
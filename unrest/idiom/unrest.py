@@ -1,6 +1,6 @@
-import json
+from collections.abc import Iterator
 
-from ..util import Response
+from ..util import Response, iterencode, to_bytes
 from . import Idiom
 
 
@@ -9,16 +9,25 @@ class UnRestIdiom(Idiom):
     The default UnRest implementation.
 
     Parses request payload as json.
-    Serialize data as json.
+    Serialize data as json bytes, streamed if the objects are an iterator.
+    Both with the #::unrest.UnRest json codec.
     Can return a 404 on empty GET if `empty_get_as_404` is set as True in the
     Unrest instance.
     """
 
+    @property
+    def codec(self):
+        return self.rest.unrest.codec
+
+    @property
+    def native_types(self):
+        return self.codec.native_types
+
     def request_to_payload(self, request):
         if request.payload:
             try:
-                return json.loads(request.payload.decode('utf-8'))
-            except json.JSONDecodeError as e:
+                return self.codec.loads(request.payload)
+            except ValueError as e:
                 self.rest.raise_error(400, f'JSON Error in payload: {e}')
 
     def data_to_response(self, data, request, status=200):
@@ -29,7 +38,25 @@ class UnRestIdiom(Idiom):
             and data['occurences'] == 0
         ):
             status = 404
-        payload = json.dumps(data)
+        objects = data.get('objects')
+        if isinstance(objects, Iterator):
+            head = to_bytes(
+                self.codec.dumps(
+                    dict(
+                        {
+                            key: val
+                            for key, val in data.items()
+                            if key != 'objects'
+                        },
+                        objects=[],
+                    )
+                )
+            )
+            payload = iterencode(
+                objects, self.codec.dumps, head[: -len(']}')], ']}'
+            )
+        else:
+            payload = to_bytes(self.codec.dumps(data))
         headers = {'Content-Type': 'application/json'}
         response = Response(payload, headers, status)
         return response
@@ -40,7 +40,12 @@ class YamlIdiom(Idiom):
             and data['occurences'] == 0
         ):
             status = 404
-        payload = self.yaml.dump(data, default_flow_style=False)
+        if 'objects' in data and not isinstance(data['objects'], list):
+            # Streaming is not supported
+            data = dict(data, objects=list(data['objects']))
+        payload = self.yaml.dump(
+            data, default_flow_style=False, encoding='utf-8'
+        )
         headers = {'Content-Type': 'text/yaml'}
         response = Response(payload, headers, status)
         return response
@@ -1,18 +1,47 @@
 import logging
+from collections import OrderedDict
 from contextlib import contextmanager
+from contextvars import ContextVar
+from datetime import datetime, timezone
+from email.utils import format_datetime, parsedate_to_datetime
 from functools import partial
-
-from sqlalchemy import and_, or_
+from hashlib import sha1
+from itertools import islice
+from threading import Lock
+from time import monotonic
+from types import MappingProxyType
+
+from sqlalchemy import and_, bindparam, func, orm, text, tuple_
+from sqlalchemy.dialects import mysql, postgresql
 from sqlalchemy.inspection import inspect
+from sqlalchemy.orm.attributes import set_committed_value
 from sqlalchemy.orm.query import Query
+from sqlalchemy.orm.session import Session
 from sqlalchemy.orm.strategy_options import Load
+from sqlalchemy.sql.schema import Column
 
 from .coercers import Deserialize, Serialize
 from .generators.options import Options
 from .idiom.unrest import UnRestIdiom
+from .util import Response, to_bytes
 
 log = logging.getLogger(__name__)
 
+# The synchronous session of an AsyncSession during an async route
+_sync_session = ContextVar('unrest_sync_session', default=None)
+# The (query alterer, count mode) of the rests during their routes, so that
+# concurrent requests on the same rest (in threads or greenlets) don't mix
+_request_state = ContextVar(
+    'unrest_request_state', default=MappingProxyType({})
+)
+
+COUNT_MODES = ('exact', 'window', 'estimate', 'cached', 'none')
+# The dialects supporting multi-row DELETE ... RETURNING (implicit_returning
+# only applies to inserted primary keys, Oracle only has RETURNING INTO)
+DELETE_RETURNING_DIALECTS = ('postgresql', 'mssql')
+# The relationship loading strategies on which eager loading can't be applied
+NOT_EAGER_LOADABLE = ('dynamic', 'noload', 'raise')
+
 
 def _call_me_maybe(fun_or_value, *args, **kwargs):
     """Call first argument `fun_or_value` with `*args, **kwargs`
@@ -23,6 +52,11 @@ def _call_me_maybe(fun_or_value, *args, **kwargs):
     return fun_or_value
 
 
+def _has_default(column):
+    """Whether the table `column` has a default or a server default."""
+    return column.default is not None or column.server_default is not None
+
+
 def _identity(arg):
     """Identity function, return `arg`"""
     return arg
@@ -62,6 +96,52 @@ class Rest(object):
         properties: A list of additional properties to retrieve on the model.
         relationships: A mapping of relationships and rest endpoints to fetch
             with the model.
+        eager: The loading strategy of the relationships on GET: 'selectin'
+            (the default), 'joined' or 'subquery' or a mapping of relationship
+            names and strategies (a missing or None strategy means lazy
+            loading). It applies recursively with the relationship rests
+            strategies. Set it to None to disable eager loading.
+            Relationships declared with a 'dynamic', 'noload' or 'raise'
+            `lazy` strategy are never eager loaded.
+        projection: How the columns are loaded on GET:
+
+            - 'orm' (the default): Load only the serialized columns (primary
+                keys, relationship foreign keys and property `depends`
+                included) unless a property does not declare its `depends`.
+            - 'core': Select only the serialized columns as tuples instead of
+                model instances. This skips the instances construction and
+                the session identity map but is only possible without
+                properties and relationships ('orm' is used otherwise).
+            - None: Load all the model columns.
+        read_only: Run GET queries outside of the rest session: the model
+            instances are loaded in a throwaway session (without autoflush)
+            which does not grow the rest session identity map and is closed
+            after the serialization. With the 'core' projection the SELECT
+            is directly executed and its rows are serialized.
+        bulk: Insert the batch PUT items in bulk (see #bulk_insert) and update
+            the batch PATCH items without loading them (see #bulk_update,
+            unless there are validators) instead of going through the
+            session.
+        batch_delete: What batch DELETE returns:
+
+            - 'objects' (the default): The deleted objects, loaded before
+                the deletion.
+            - 'primary_keys': Only the primary keys of the deleted objects
+                which are deleted without being loaded (see #bulk_delete).
+            - 'count': Only the number of deleted objects, as occurences.
+        refresh: How the written items are refreshed before being serialized:
+
+            - 'expire' (the default): Expire the items so that they are
+                entirely reloaded.
+            - 'server': Only reload the serialized columns computed by the
+                database (server defaults, server onupdate, computed columns
+                and `column_property`), in one query for batches.
+            - None: Serialize the items as they were written.
+        upsert: Insert or update items with a single statement on PUT with
+            primary keys on PostgreSQL and MySQL (see #upsert_statement).
+            It is not used if the rest has a `query` (or is a #sub rest) or
+            if the idiom filters the request query, since the statement could
+            overwrite an existing item out of the query.
         allow_batch: Allow batch operations (PUT, DELETE and PATCH)
             without primary key.
         auth: A decorator that will always be called.
@@ -85,6 +165,47 @@ class Rest(object):
             will be called at runtime with the payload as argument.
         SerializeClass: An alternative #::unrest.coercers#Serialize class.
         DeserializeClass: An alternative #::unrest.coercers#Deserialize class.
+        stream: If True, GET collections are fetched, serialized and sent
+            lazily by batches of `yield_per` items.
+        yield_per: The batch size used when `stream` is set.
+        count: How the total number of occurences of GET collections is
+            computed:
+
+            - 'exact': With a `SELECT count(*)` on the query (the default)
+            - 'window': With a `count(*) OVER ()` in the page query, as
+                'exact' when `stream` is set
+            - 'estimate': With the PostgreSQL table statistics for
+                unfiltered queries, as 'cached' otherwise
+            - 'cached': As 'exact' but cached `count_ttl` seconds per query
+            - None: Not computed
+
+            It can be overridden per request with the `_count` query
+            parameter ('none' for None).
+        count_ttl: The time to live in seconds of the 'cached' counts.
+        chunk_size: The maximum number of primary keys looked up by query in
+            batch methods.
+        etag: Send an `ETag` on GET and answer a 304 Not Modified to the
+            requests whose `If-None-Match` (or `If-Modified-Since`) matches:
+
+            - A column name or expression (i.e. an `updated_at` or a version
+                column): The `ETag` is computed from the max of this column
+                and the count of the queried rows before anything is
+                serialized (see #version_headers). If the max is a datetime,
+                it is also sent as `Last-Modified`. The column must change on
+                every update.
+            - True: The `ETag` is a hash of the response payload.
+            - None: No conditional GET (the default).
+        cache: A response cache backend (see #::unrest.cache#MemoryCache)
+            in which the encoded GET responses are stored (unless streamed),
+            so that the same requests are answered without querying and
+            serializing again. Writes through any rest of this
+            #::unrest#UnRest invalidate the cached responses of the rests on
+            the same tables or with relationships to them (see #cache_tags).
+            Writes made outside of unrest are only seen after the cache
+            `ttl`.
+        cache_principal: A function taking the #::unrest.util#Request and
+            returning who the response is for (i.e. the user id) when it
+            depends on the authentication.
     """
 
     def __init__(
@@ -98,6 +219,13 @@ class Rest(object):
         query=None,
         properties=None,
         relationships=None,
+        eager='selectin',
+        projection='orm',
+        read_only=False,
+        bulk=False,
+        upsert=False,
+        refresh='expire',
+        batch_delete='objects',
         allow_batch=False,
         auth=None,
         read_auth=None,
@@ -110,6 +238,14 @@ class Rest(object):
         idiom=UnRestIdiom,
         SerializeClass=Serialize,
         DeserializeClass=Deserialize,
+        stream=False,
+        yield_per=1000,
+        count='exact',
+        count_ttl=60,
+        chunk_size=500,
+        etag=None,
+        cache=None,
+        cache_principal=None,
     ):
         self.unrest = unrest
         self.unrest.rests.append(self)
@@ -119,7 +255,7 @@ class Rest(object):
         self.name = name or self.table.name
         self.only = only
         self.exclude = exclude
-        self.query_factory = query or (lambda q: q)
+        self.query_factory = query or _identity
         self.properties = [
             self.unrest.Property(property)
             if not isinstance(property, self.unrest.Property)
@@ -127,6 +263,13 @@ class Rest(object):
             for property in (properties or [])
         ]
         self.relationships = relationships or {}
+        self.eager = eager
+        self.projection = projection
+        self.read_only = read_only
+        self.bulk = bulk
+        self.upsert = upsert
+        self.refresh_mode = refresh
+        self.batch_delete = batch_delete
 
         self.allow_batch = allow_batch
 
@@ -144,8 +287,23 @@ class Rest(object):
 
         self.SerializeClass = SerializeClass
         self.DeserializeClass = DeserializeClass
+        self.invalidate()
+
+        self.stream = stream
+        self.yield_per = yield_per
 
-        self._query_alterer = _identity
+        self.count_mode = count or 'none'
+        assert self.count_mode in COUNT_MODES, (
+            f'Unknown count mode {count} '
+            f'(must be one of {", ".join(COUNT_MODES)} or None)'
+        )
+        self.count_ttl = count_ttl
+        self.chunk_size = chunk_size
+        self.etag = etag
+        self.cache = cache
+        self.cache_principal = cache_principal
+        self._count_cache = OrderedDict()
+        self._count_lock = Lock()
 
         self.overrides = {}
 
@@ -164,12 +322,27 @@ class Rest(object):
             payload: The request content ignored for GET.
             pks: The primary keys in url if any.
         """
-        if self.has(pks):
-            item = self.get_from_pk(self.query, **pks)
-            return self.serialize_all([item] if item else [])
+        query = self.project(
+            self.query.options(*self.loader_options(stream=self.stream))
+        )
+        if self.read_only:
+            query = query.with_session(
+                Session(
+                    bind=self.session.connection(mapper=self.mapper),
+                    autoflush=False,
+                )
+            )
+        streamed = self.stream and not self.has(pks)
+        try:
+            if self.has(pks):
+                item = self.get_from_pk(query, **pks)
+                return self.serialize_all([item] if item else [])
 
-        items = self.query
-        return self.serialize_all(items)
+            return self.serialize_all(query)
+        finally:
+            if self.read_only and not streamed:
+                # The stream closes it once consumed
+                query.session.close()
 
     def put(self, payload, **pks):
         """
@@ -196,13 +369,39 @@ class Rest(object):
                     )
                 else:
                     payload[pk] = val
+            if self.upsertable:
+                item = self.deserialize(payload, self.Model())
+                self.validate(item)
+                dialect = self.dialect
+                statement = self.upsert_statement(item, dialect)
+                if dialect.implicit_returning and not (
+                    self.properties or self.relationships
+                ):
+                    statement = statement.returning(
+                        *(
+                            column.label(name)
+                            for name, column in self.columns.items()
+                        )
+                    )
+                    row = self.session.execute(statement).first()
+                    # Nothing is returned if the item exists and there's no
+                    # column to update (ON CONFLICT DO NOTHING)
+                    if row is not None:
+                        return self.serialize_all([row])
+                else:
+                    self.session.execute(statement)
+                item = self.get_from_pk(
+                    self.session.query(self.Model).populate_existing(), **pks
+                )
+                return self.serialize_all([item])
+
             existingItem = self.get_from_pk(self.query, **pks)
             item = self.deserialize(payload, existingItem or self.Model())
             self.validate(item)
             if existingItem is None:
                 self.session.add(item)
             self.session.flush()
-            self.session.expire(item)
+            self.refresh([item])
             return self.serialize_all([item])
 
         if not self.allow_batch:
@@ -213,11 +412,29 @@ class Rest(object):
             )
 
         self.query.delete()
+        if self.bulk and not self.validators:
+            mappings = self.deserialize_all(payload, mappings=True)
+            return self.serialize_all(self.bulk_insert(mappings))
+
         items = self.deserialize_all(payload)
         self.validate_all(items)
+        if self.bulk:
+            mappings = [
+                {
+                    name: getattr(item, name)
+                    for name in self.columns
+                    if not (
+                        name in self.primary_keys
+                        and getattr(item, name) is None
+                    )
+                }
+                for item in items
+            ]
+            return self.serialize_all(self.bulk_insert(mappings))
+
         self.session.add_all(items)
         self.session.flush()
-        self.session.expire_all()
+        self.refresh(items)
         return self.serialize_all(items)
 
     def post(self, payload, **pks):
@@ -246,7 +463,7 @@ class Rest(object):
         self.session.add(item)
         self.validate(item)
         self.session.flush()
-        self.session.expire(item)
+        self.refresh([item])
         return self.serialize_all([item])
 
     def delete(self, payload, **pks):
@@ -278,6 +495,32 @@ class Rest(object):
                 'if you want to use batch methods.',
             )
 
+        if (
+            self.batch_delete != 'objects'
+            and self.table_primary_keys is not None
+        ):
+            rv = {'primary_keys': list(self.primary_keys), 'occurences': 0}
+            if self.batch_delete == 'count':
+                rv['objects'] = []
+                for rows in self.bulk_delete():
+                    rv['occurences'] += len(rows)
+                return rv
+
+            serializer = self.SerializeClass(
+                None,
+                {pk: self.columns[pk] for pk in self.primary_keys},
+                [],
+                {},
+            )
+            serializer.native_types = self.idiom.native_types
+            rv['objects'] = [
+                key
+                for rows in self.bulk_delete()
+                for key in serializer.all(rows)
+            ]
+            rv['occurences'] = len(rv['objects'])
+            return rv
+
         items = self.undefered_query.all()
         self.query.delete()
         self.session.flush()
@@ -314,7 +557,7 @@ class Rest(object):
             self.deserialize(payload, item, blank_missing=False)
             self.validate(item)
             self.session.flush()
-            self.session.expire(item)
+            self.refresh([item])
             return self.serialize_all([item])
 
         if not self.allow_batch:
@@ -325,44 +568,47 @@ class Rest(object):
             )
 
         patches = payload['objects']
-        # Get all concerned items
+        keys = [
+            tuple(patch[pk] for pk in self.primary_keys) for patch in patches
+        ]
+        bulk = (
+            self.bulk
+            and not self.validators
+            and self.table_primary_keys is not None
+        )
+        query = self.query
+        if bulk:
+            # Only check that the items exist
+            query = query.with_entities(
+                *(
+                    getattr(self.Model, pk).label(pk)
+                    for pk in self.primary_keys
+                )
+            )
+        # Get all concerned items indexed by their full primary key
         items = self.get_all_from_pks(
-            self.query,
-            [{pk: patch[pk] for pk in self.primary_keys} for patch in patches],
+            query, [dict(zip(self.primary_keys, key)) for key in keys]
         )
-        if len(items) < len(patches):
-            for patch in patches:
-                if (
-                    len(
-                        [
-                            it
-                            for pk in self.primary_keys
-                            for it in items
-                            if getattr(it, pk) == patch[pk]
-                        ]
-                    )
-                    == 0
-                ):
-                    patch = {
-                        key: val
-                        for key, val in patch.items()
-                        if key in self.primary_keys
-                    }
-                    self.raise_error(404, f'{self.name}({patch}) not found')
+        index = {
+            tuple(getattr(item, pk) for pk in self.primary_keys): item
+            for item in items
+        }
+        missing = [key for key in keys if key not in index]
+        if missing:
+            missing = ', '.join(
+                str(dict(zip(self.primary_keys, key))) for key in missing
+            )
+            self.raise_error(404, f'{self.name}({missing}) not found')
 
-        for patch in patches:
-            # Get the patch item
-            item = [
-                it
-                for pk in self.primary_keys
-                for it in items
-                if getattr(it, pk) == patch[pk]
-            ][0]
+        if bulk:
+            return self.serialize_all(self.bulk_update(patches))
+
+        for key, patch in zip(keys, patches):
             # Merge only patched colmuns
-            self.deserialize(patch, item, blank_missing=False)
+            self.deserialize(patch, index[key], blank_missing=False)
         self.validate_all(items)
         self.session.flush()
-        self.session.expire_all()
+        self.refresh(items)
         return self.serialize_all(items)
 
     def options(self, payload, **pks):
@@ -429,6 +675,13 @@ class Rest(object):
             'exclude': self.exclude,
             'properties': self.properties,
             'relationships': self.relationships,
+            'eager': self.eager,
+            'projection': self.projection,
+            'read_only': self.read_only,
+            'bulk': self.bulk,
+            'upsert': self.upsert,
+            'refresh': self.refresh_mode,
+            'batch_delete': self.batch_delete,
             'allow_batch': self.allow_batch,
             'auth': self.auth,
             'read_auth': self.read_auth,
@@ -439,6 +692,14 @@ class Rest(object):
             'DeserializeClass': self.DeserializeClass,
             'fixed': self.fixed,
             'defaults': self.defaults,
+            'stream': self.stream,
+            'yield_per': self.yield_per,
+            'count': self.count_mode,
+            'count_ttl': self.count_ttl,
+            'chunk_size': self.chunk_size,
+            'etag': self.etag,
+            'cache': self.cache,
+            'cache_principal': self.cache_principal,
         }
         inherited.update(kwargs)
         subrest = self.__class__(self.unrest, self.Model, **inherited)
@@ -455,16 +716,10 @@ class Rest(object):
         ):
             return {}
 
-        # In case of column_property or hybrid_property
-        prop_by_name = {prop.name: prop for prop in self.properties}
-        columns = {
-            pk: self.columns.get(pk, prop_by_name.get(pk))
-            for pk in self.primary_keys
-        }
-        deserialize = self.DeserializeClass(parameters, columns)
+        deserialize = self.DeserializeClass(parameters, self._pk_columns)
         return {
             name: deserialize.deserialize(name, column)
-            for name, column in columns.items()
+            for name, column in self._pk_columns.items()
         }
 
     def deserialize(self, payload, item, blank_missing=True):
@@ -489,22 +744,25 @@ class Rest(object):
         self.set_defaults(payload, columns)
         return self.DeserializeClass(payload, columns).merge(item)
 
-    def deserialize_all(self, payload):
+    def deserialize_all(self, payload, mappings=False):
         """
         Deserialize all the payload items.
 
         # Arguments
             payload: The payload containing the item list
+            mappings: Return plain dicts suitable for
+                `session.bulk_insert_mappings` instead of model instances
         """
-        for item in payload['objects']:
+        objects = payload['objects']
+        for item in objects:
             self.set_defaults(item, self.columns)
-        return self.DeserializeClass(payload, self.columns).create(self.Model)
+        if mappings:
+            return self.deserializer.mappings(objects, self.primary_keys)
+        return self.deserializer.create(self.Model, objects)
 
     def serialize(self, item):
         """Serialize an `item` with the given `SerializeClass`"""
-        return self.SerializeClass(
-            item, self.columns, self.properties, self.relationships
-        ).dict()
+        return self.serializer.all((item,))[0]
 
     def serialize_all(self, items):
         """
@@ -517,32 +775,210 @@ class Rest(object):
         - primary_keys: The list of primary keys defined for this rest
             endpoint
         - occurences: The number of total occurences (without limit)
+            unless the count mode is None (see #count)
         - offset if there's a query offset
         - limit if there's a query limit
+
+        If `stream` is set and `items` is a query, objects are an iterator
+        lazily serializing the items (see #serialize_stream).
         """
 
         rv = {}
-        rv['primary_keys'] = self.primary_keys
+        rv['primary_keys'] = list(self.primary_keys)
 
-        if isinstance(items, Query):
-            rv['occurences'] = items.offset(None).limit(None).count()
-            if items.selectable._offset is not None:
-                rv['offset'] = items.selectable._offset
-            if items.selectable._limit is not None:
-                rv['limit'] = items.selectable._limit
-
-        rv['objects'] = [self.serialize(item) for item in items]
-        if 'occurences' not in rv:
+        if not isinstance(items, Query):
+            rv['objects'] = self.serializer.all(items)
             rv['occurences'] = len(rv['objects'])
+            return rv
+
+        query = items
+        mode = self._request_count_mode or self.count_mode
+        if mode == 'window' and not self.stream:
+            rows = list(self.execute(query.add_columns(func.count().over())))
+            if rows:
+                rv['occurences'] = rows[0][-1]
+            elif query.selectable._offset:
+                # Out of range page, the total is unknown
+                rv['occurences'] = self.count(query)
+            else:
+                rv['occurences'] = 0
+            # Core rows are serialized with their extra count column
+            items = rows if self.core else [row[0] for row in rows]
+        elif mode != 'none':
+            rv['occurences'] = self.count(query, mode)
+
+        if query.selectable._offset is not None:
+            rv['offset'] = query.selectable._offset
+        if query.selectable._limit is not None:
+            rv['limit'] = query.selectable._limit
+
+        if self.stream:
+            rv['objects'] = self.serialize_stream(query)
+        else:
+            rv['objects'] = self.serializer.all(self.execute(items))
         return rv
 
+    def execute(self, query):
+        """
+        Returns the items of the GET `query`. In `read_only` mode with the
+        'core' projection, the query statement is directly executed.
+        """
+        if self.read_only and self.core and isinstance(query, Query):
+            return query.session.execute(query.statement)
+        return query
+
+    def count(self, query, mode='exact'):
+        """
+        Returns the number of occurences of `query` without offset and limit
+        according to the count `mode` ('exact', 'estimate' or 'cached').
+        """
+        query = query.offset(None).limit(None)
+        if mode == 'estimate':
+            estimate = self.estimate_count(query)
+            if estimate is not None:
+                return estimate
+            mode = 'cached'
+
+        if mode != 'cached':
+            return query.count()
+
+        statement = query.statement.compile(
+            dialect=self.dialect
+        )
+        key = (str(statement), repr(sorted(statement.params.items())))
+        now = monotonic()
+        with self._count_lock:
+            cached = self._count_cache.get(key)
+        if cached and cached[1] > now:
+            return cached[0]
+        # The count query is run outside of the lock
+        count = query.count()
+        with self._count_lock:
+            self._count_cache[key] = count, now + self.count_ttl
+            self._count_cache.move_to_end(key)
+            while len(self._count_cache) > 1024:
+                self._count_cache.popitem(last=False)
+        return count
+
+    @property
+    def version_column(self):
+        """The `etag` column (or expression) if any."""
+        if self.etag is None or isinstance(self.etag, bool):
+            return
+        if isinstance(self.etag, str):
+            return getattr(self.Model, self.etag)
+        return self.etag
+
+    def version_headers(self, **pks):
+        """
+        Returns the `ETag` (and `Last-Modified`) headers of the GET query (of
+        the item with `pks` if any) computed with a single aggregate query on
+        the `etag` column. Offset and limit are ignored so that the headers
+        also change with the total occurences.
+        """
+        query = self.query
+        if self.has(pks):
+            for key, val in pks.items():
+                query = query.filter(getattr(self.Model, key) == val)
+        column = self.version_column
+        subquery = (
+            query.offset(None)
+            .limit(None)
+            .order_by(None)
+            .with_entities(column.label('version'))
+            .subquery()
+        )
+        version, count = (
+            self.session.query(func.max(subquery.c.version), func.count())
+            .select_from(subquery)
+            .one()
+        )
+        digest = sha1(repr((version, count)).encode('utf-8')).hexdigest()
+        headers = {'ETag': f'W/"{digest}"'}
+        if isinstance(version, datetime):
+            if version.tzinfo is None:
+                version = version.replace(tzinfo=timezone.utc)
+            headers['Last-Modified'] = format_datetime(
+                version.astimezone(timezone.utc), usegmt=True
+            )
+        return headers
+
+    def not_modified(self, request, headers):
+        """
+        Returns whether the `request` conditional headers match the `ETag` or
+        `Last-Modified` response `headers`.
+        """
+        request_headers = request.headers or {}
+        if_none_match = request_headers.get('If-None-Match')
+        if if_none_match is not None:
+            if 'ETag' not in headers:
+                return False
+            etags = [etag.strip() for etag in if_none_match.split(',')]
+            # Weak comparison
+            return '*' in etags or headers['ETag'].replace('W/', '') in (
+                etag.replace('W/', '') for etag in etags
+            )
+        if_modified_since = request_headers.get('If-Modified-Since')
+        if if_modified_since is None or 'Last-Modified' not in headers:
+            return False
+        try:
+            since = parsedate_to_datetime(if_modified_since)
+        except (TypeError, ValueError):
+            return False
+        if since.tzinfo is None:
+            since = since.replace(tzinfo=timezone.utc)
+        return parsedate_to_datetime(headers['Last-Modified']) <= since
+
+    def estimate_count(self, query):
+        """
+        Returns the PostgreSQL estimated row count of this table if `query` is
+        not filtered, None otherwise.
+        """
+        dialect = self.dialect
+        if dialect.name != 'postgresql' or query.whereclause is not None:
+            return
+        estimate = self.session.execute(
+            text(
+                'SELECT reltuples FROM pg_class '
+                'WHERE oid = CAST(:table AS regclass)'
+            ),
+            {'table': self.table.fullname},
+        ).scalar()  # pragma: no cover
+        if estimate is not None and estimate >= 0:  # pragma: no cover
+            return int(estimate)
+
+    def serialize_stream(self, query):
+        """
+        Lazily serialize the items of `query` which are fetched and serialized
+        by batches of `yield_per` items. In `read_only` mode, the throwaway
+        session is closed once the stream is consumed.
+        """
+        try:
+            if self.read_only and self.core:
+                result = query.session.execute(
+                    query.statement.execution_options(stream_results=True)
+                )
+                while True:
+                    batch = result.fetchmany(self.yield_per)
+                    if not batch:
+                        return
+                    yield from self.serializer.all(batch)
+
+            items = iter(query.yield_per(self.yield_per))
+            while True:
+                batch = list(islice(items, self.yield_per))
+                if not batch:
+                    return
+                yield from self.serializer.all(batch)
+        finally:
+            if self.read_only:
+                query.session.close()
+
     def set_defaults(self, payload, columns):
         """Sets in payload item all the fixed and defaults values"""
-        for name, column in columns.items():
-            if name in self.fixed:
-                payload[name] = _call_me_maybe(self.fixed[name], payload)
-            elif name not in payload and name in self.defaults:
-                payload[name] = _call_me_maybe(self.defaults[name], payload)
+        for name, fixed, value in self._defaulters:
+            if name in columns and (fixed or name not in payload):
+                payload[name] = _call_me_maybe(value, payload)
 
     class Validatable(object):
         """
@@ -651,8 +1087,11 @@ class Rest(object):
             request: The current #::unrest.util#Request
 
         # Returns
-        The #::unrest.util#Response of this request
+        The #::unrest.util#Response of this request or an awaitable of it
+        if the session is an `AsyncSession` (see #async_route).
         """
+        if self.is_async and _sync_session.get() is None:
+            return self.async_route(method, request)
         try:
             pks = self.parameters_to_pks(request.parameters)
             payload = self.idiom.request_to_payload(request)
@@ -664,6 +1103,39 @@ class Rest(object):
                 dict(message=e.message, **e.extra), request, e.status
             )
 
+    async def async_route(self, method, request):
+        """
+        The #route coroutine used when the #::unrest#UnRest session is a
+        SQLAlchemy (>= 1.4) `AsyncSession` (or `async_scoped_session`).
+
+        The synchronous #route is run with the `AsyncSession.run_sync`
+        synchronous session, in a greenlet in which the database IO is
+        awaited on the event loop. It is therefore only supported by the
+        asynchronous frameworks (Sanic and Tornado).
+
+        Streamed payloads are consumed in the greenlet before returning.
+
+        # Arguments
+            method: The HTTP method which is curried in a partial
+            request: The current #::unrest.util#Request
+
+        # Returns
+        The #::unrest.util#Response of this request
+        """
+        return await self.async_session.run_sync(
+            self._sync_route, method, request
+        )
+
+    def _sync_route(self, session, method, request):
+        token = _sync_session.set(session)
+        try:
+            response = self.route(method, request)
+            if response.streamed:
+                response.payload = list(response.payload)
+            return response
+        finally:
+            _sync_session.reset(token)
+
     def wrap_auth_route(self, method, route):
         """This takes a route and apply auth wrappers around it."""
         if method == 'GET' and self.read_auth:
@@ -693,11 +1165,26 @@ class Rest(object):
         if method in self.overrides:
             route, manual_commit = self.overrides[method]
 
+        conditional = method == 'GET' and method not in self.overrides
+        headers = {}
+        cache_key = None
         with self.query_request(request):
+            if conditional and self.cache is not None:
+                cache_key = self.cache_key(request, pks)
+                cached = self.cache.get(cache_key)
+                if cached is not None:
+                    return self.cached_response(request, *cached)
+            if conditional and self.version_column is not None:
+                # Answer before running the query if nothing changed
+                headers = self.version_headers(**pks)
+                if self.not_modified(request, headers):
+                    return self.idiom.not_modified(request, headers)
             data = route(payload, **pks)
 
-        if not manual_commit and method in ['PUT', 'POST', 'DELETE', 'PATCH']:
-            self.session.commit()
+        if method in ['PUT', 'POST', 'DELETE', 'PATCH']:
+            if not manual_commit:
+                self.session.commit()
+            self.invalidate_responses()
 
         occurences = (
             f": {data['occurences']} occurences"
@@ -706,7 +1193,85 @@ class Rest(object):
         )
         log.info(f'{method} {self.path}{occurences}')
 
-        return self.idiom.data_to_response(data, request)
+        response = self.idiom.data_to_response(data, request)
+        if not conditional or response.status != 200:
+            return response
+        if self.etag is True and not response.streamed:
+            digest = sha1(to_bytes(response.payload)).hexdigest()
+            headers = {'ETag': f'"{digest}"'}
+            if self.not_modified(request, headers):
+                return self.idiom.not_modified(request, headers)
+        response.headers.update(headers)
+        if cache_key is not None and not response.streamed:
+            response.payload = to_bytes(response.payload)
+            self.cache.set(
+                cache_key,
+                (response.status, dict(response.headers), response.payload),
+            )
+        return response
+
+    def cached_response(self, request, status, headers, payload):
+        """
+        Returns the #::unrest.util#Response of a cached response (or a 304
+        if it matches the `request` conditional headers).
+        """
+        validators = {
+            name: headers[name]
+            for name in ('ETag', 'Last-Modified')
+            if name in headers
+        }
+        if self.not_modified(request, validators):
+            return self.idiom.not_modified(request, validators)
+        return Response(payload, dict(headers), status)
+
+    def cache_key(self, request, pks):
+        """
+        Returns the key of the cached GET response for the `request` and the
+        `pks`: a hash of the rest path, the primary keys, the query string,
+        the `cache_principal` and the generations of the #cache_tags.
+        """
+        key = (
+            self.path,
+            sorted(pks.items()),
+            sorted((request.query or {}).items()),
+            self.cache_principal and self.cache_principal(request),
+            [self.cache.generation(tag) for tag in self.cache_tags],
+        )
+        return sha1(repr(key).encode('utf-8')).hexdigest()
+
+    @property
+    def cache_tags(self):
+        """
+        The names of the tables whose writes invalidate the cached responses
+        of this rest: its model tables and the ones of its relationships
+        (recursively).
+        """
+        tags = set()
+        seen = set()
+        rests = [self]
+        while rests:
+            rest = rests.pop()
+            if id(rest) in seen:
+                continue
+            seen.add(id(rest))
+            tags.update(table.fullname for table in rest.mapper.tables)
+            rests.extend(rest.relationships.values())
+        return sorted(tags)
+
+    def invalidate_responses(self):
+        """
+        Invalidates the cached responses depending on this rest model tables
+        in the caches of all the #::unrest#UnRest rests. This is called after
+        each write.
+        """
+        caches = {
+            id(rest.cache): rest.cache
+            for rest in self.unrest.rests
+            if rest.cache is not None
+        }
+        for cache in caches.values():
+            for table in self.mapper.tables:
+                cache.invalidate(table.fullname)
 
     def register_method(self, method):
         """
@@ -737,10 +1302,434 @@ class Rest(object):
         ):
             self.register_method('OPTIONS')
 
+    def loader_options(self, load=None, stream=False):
+        """
+        Returns the eager loading options of the relationships according to
+        the `eager` strategies of this rest and its relationship rests.
+
+        # Arguments
+            load: The parent relationship loader if any
+            stream: True if the query is streamed with `yield_per`, which is
+                incompatible with subquery and joined collection loading:
+                'selectin' is used instead.
+        """
+        options = []
+        for key, relationship_rest in self.relationships.items():
+            relationship = self.mapper.relationships.get(key)
+            if relationship is None:
+                # Not a relationship (i.e. a property)
+                continue
+            if isinstance(self.eager, dict):
+                strategy = self.eager.get(key)
+            else:
+                strategy = self.eager
+            if not strategy or relationship.lazy in NOT_EAGER_LOADABLE:
+                continue
+            if stream and (
+                strategy == 'subquery'
+                or (strategy == 'joined' and relationship.uselist)
+            ):
+                strategy = 'selectin'
+            loader = getattr(load or orm, f'{strategy}load')(
+                getattr(self.Model, key)
+            )
+            nested = relationship_rest.loader_options(loader, stream)
+            options.extend(nested or [loader])
+        return options
+
+    @property
+    def core(self):
+        """True if the GET query selects column tuples (see `projection`)."""
+        return (
+            self.projection == 'core'
+            and not self.properties
+            and not self.relationships
+        )
+
+    def project(self, query):
+        """
+        Returns the GET `query` restricted to the serialized columns according
+        to `projection`.
+        """
+        if self.core:
+            return query.with_entities(
+                *(
+                    getattr(self.Model, name).label(name)
+                    for name in self.columns
+                )
+            )
+        if not self.projection or any(
+            property.depends is None for property in self.properties
+        ):
+            return query
+
+        names = set(self.columns)
+        for property in self.properties:
+            names.update(property.depends)
+        for key in self.relationships:
+            relationship = self.mapper.relationships.get(key)
+            if relationship is not None:
+                names.update(
+                    self.mapper.get_property_by_column(column).key
+                    for column in relationship.local_columns
+                )
+        return query.options(Load(self.Model).load_only(*names))
+
     def has(self, pks):
         """Returns whether the pks dict has values in it."""
         return pks and all(val is not None for val in pks.values())
 
+    def refresh(self, items):
+        """
+        Refresh the written `items` after the flush according to the
+        `refresh` mode.
+        """
+        if self.refresh_mode == 'expire':
+            for item in items:
+                self.session.expire(item)
+            return
+        if self.refresh_mode != 'server' or not items:
+            return
+
+        names = [
+            name
+            for name, column in self.columns.items()
+            if not isinstance(column, Column)
+            or column.server_default is not None
+            or column.server_onupdate is not None
+        ]
+        if not names:
+            return
+        if len(items) == 1:
+            self.session.refresh(items[0], names)
+            return
+
+        pks = [
+            self.mapper.get_property_by_column(column).key
+            for column in self.mapper.primary_key
+        ]
+        index = {
+            tuple(getattr(item, pk) for pk in pks): item for item in items
+        }
+        rows = self.get_all_from_pks(
+            self.session.query(
+                *(
+                    getattr(self.Model, name).label(name)
+                    for name in pks + names
+                )
+            ),
+            [dict(zip(pks, key)) for key in index],
+        )
+        for row in rows:
+            item = index[tuple(getattr(row, pk) for pk in pks)]
+            for name in names:
+                set_committed_value(item, name, getattr(row, name))
+
+    @property
+    def table_primary_keys(self):
+        """
+        The primary keys if they are the model table ones (and the model is
+        mapped to a single table), None otherwise. Statements bypassing the
+        session can only be used in this case.
+        """
+        if len(self.mapper.tables) != 1:
+            return None
+        if set(self.primary_keys) != {
+            self.mapper.get_property_by_column(column).key
+            for column in self.mapper.primary_key
+        }:
+            return None
+        return self.primary_keys
+
+    @property
+    def upsertable(self):
+        """
+        True if `upsert` is set and PUT with primary keys can be done with a
+        single upsert statement (see #upsert_statement): the dialect supports
+        it and the rest query is not filtered.
+        """
+        if (
+            not self.upsert
+            or self.table_primary_keys is None
+            # The existing item must be in the query
+            or self.query_factory is not _identity
+            or self.query.whereclause is not None
+        ):
+            return False
+        dialect = self.dialect
+        return dialect.name in ('postgresql', 'mysql')
+
+    def upsert_statement(self, item, dialect):
+        """
+        Returns the statement inserting the `item` columns or updating them
+        if the item already exists for the `dialect`:
+        `INSERT ... ON CONFLICT DO UPDATE` for PostgreSQL and
+        `INSERT ... ON DUPLICATE KEY UPDATE` for MySQL.
+
+        As with the ORM, the `None` values of the columns with a default are
+        not inserted (but still updated).
+        """
+        columns = {
+            name: column
+            for name, column in self.columns.items()
+            if getattr(column, 'table', None) is self.table
+        }
+        values = {
+            column.key: getattr(item, name) for name, column in columns.items()
+        }
+        # Let the defaults apply to the inserted row like the ORM does
+        inserted = {
+            key: value
+            for key, value in values.items()
+            if value is not None or not _has_default(self.table.c[key])
+        }
+        updated = [
+            column.key
+            for name, column in columns.items()
+            if name not in self.primary_keys
+        ]
+        if dialect.name == 'postgresql':
+            statement = postgresql.insert(self.table).values(inserted)
+            if not updated:
+                return statement.on_conflict_do_nothing()
+            return statement.on_conflict_do_update(
+                index_elements=list(self.mapper.primary_key),
+                set_={
+                    key: statement.excluded[key] if key in inserted else None
+                    for key in updated
+                },
+            )
+        statement = mysql.insert(self.table).values(inserted)
+        return statement.on_duplicate_key_update(
+            {
+                key: statement.inserted[key] if key in inserted else None
+                for key in updated or [self.mapper.primary_key[0].key]
+            }
+        )
+
+    def bulk_insert(self, mappings):
+        """
+        Insert the items `mappings` (see #deserialize_all) with as few
+        statements as possible, bypassing the session unit of work, and
+        returns the inserted items. The `None` values of the columns with a
+        default are not inserted so that the defaults apply.
+
+        - If the dialect supports it, with multi-row
+            `INSERT ... VALUES ... RETURNING` statements (see
+            #bulk_insert_statement) of at most `chunk_size` rows. The items
+            are then returned grouped by set of given columns. The returned
+            rows are directly serialized if they are #serializable_rows,
+            otherwise the items are reloaded.
+        - Otherwise with executemany inserts if all the primary keys are
+            given or with `session.bulk_insert_mappings` fetching the
+            generated ones, and the items are reloaded in order.
+        """
+        mapper = self.mapper
+        pks = [
+            mapper.get_property_by_column(column).key
+            for column in mapper.primary_key
+        ]
+        columns = {
+            key: column
+            for key, column in mapper.columns.items()
+            if getattr(column, 'table', None) is self.table
+        }
+        single_table = len(mapper.tables) == 1
+
+        groups = OrderedDict()
+        for mapping in mappings:
+            # Let the defaults apply like the ORM does
+            row = {
+                columns[key].key: value
+                for key, value in mapping.items()
+                if key in columns
+                and (value is not None or not _has_default(columns[key]))
+            }
+            groups.setdefault(tuple(sorted(row)), []).append(row)
+
+        dialect = self.dialect
+        if (
+            single_table
+            and dialect.implicit_returning
+            and dialect.supports_multivalues_insert
+        ):
+            rows = []
+            for group in groups.values():
+                for start in range(0, len(group), self.chunk_size):
+                    end = start + self.chunk_size
+                    rows.extend(
+                        self.session.execute(
+                            self.bulk_insert_statement(group[start:end])
+                        )
+                    )
+            if self.serializable_rows:
+                return rows
+            mappings = rows
+        elif single_table and all(
+            mapping.get(pk) is not None for mapping in mappings for pk in pks
+        ):
+            for group in groups.values():
+                self.session.execute(self.table.insert(), group)
+        else:
+            self.session.bulk_insert_mappings(
+                self.Model, mappings, return_defaults=True
+            )
+
+        keys = [tuple(mapping[pk] for pk in pks) for mapping in mappings]
+        index = {
+            tuple(getattr(item, pk) for pk in pks): item
+            for item in self.get_all_from_pks(
+                self.session.query(self.Model),
+                [dict(zip(pks, key)) for key in keys],
+            )
+        }
+        return [index[key] for key in keys]
+
+    @property
+    def serializable_rows(self):
+        """
+        True if rows of the serialized columns can be serialized instead of
+        the model instances: this rest has no properties nor relationships
+        and all its columns are table columns (no `column_property`).
+        """
+        return not (self.properties or self.relationships) and all(
+            getattr(column, 'table', None) is self.table
+            for column in self.columns.values()
+        )
+
+    def bulk_insert_statement(self, rows):
+        """
+        Returns the multi-row `INSERT ... VALUES ... RETURNING` statement of
+        the table `rows` used by #bulk_insert. It returns the serialized
+        columns if they are #serializable_rows, only the primary keys
+        otherwise.
+        """
+        if self.serializable_rows:
+            returning = [
+                column.label(name) for name, column in self.columns.items()
+            ]
+        else:
+            returning = [
+                column.label(self.mapper.get_property_by_column(column).key)
+                for column in self.mapper.primary_key
+            ]
+        return self.table.insert().values(rows).returning(*returning)
+
+    def bulk_delete(self):
+        """
+        Delete all the query items without loading them and yields the rows
+        of the deleted primary keys:
+
+        - In one chunk with a `DELETE ... RETURNING` statement (see
+            #bulk_delete_statement) on PostgreSQL and SQL Server.
+        - Otherwise by chunks of `chunk_size` items, selecting their primary
+            keys and deleting them.
+
+        The deleted items are expunged from the session.
+        """
+        pks = self.table_primary_keys
+        columns = [self.columns[pk] for pk in pks]
+        column = columns[0] if len(columns) == 1 else tuple_(*columns)
+        keys = [getattr(self.Model, pk) for pk in pks]
+        select = self.query.with_entities(
+            *(key.label(pk) for key, pk in zip(keys, pks))
+        )
+        mapper_pks = [
+            self.mapper.get_property_by_column(primary_key).key
+            for primary_key in self.mapper.primary_key
+        ]
+
+        def expunge(rows):
+            for row in rows:
+                item = self.session.identity_map.get(
+                    self.mapper.identity_key_from_primary_key(
+                        [getattr(row, pk) for pk in mapper_pks]
+                    )
+                )
+                if item is not None:
+                    self.session.expunge(item)
+            return rows
+
+        if self.dialect.name in DELETE_RETURNING_DIALECTS:
+            self.session.flush()
+            rows = self.session.execute(
+                self.bulk_delete_statement()
+            ).fetchall()
+            yield expunge(rows)
+            return
+
+        select = select.order_by(None).order_by(*keys).limit(self.chunk_size)
+        delete = self.table.delete().where(
+            column.in_(bindparam('pks', expanding=True))
+        )
+        while True:
+            rows = select.all()
+            if not rows:
+                return
+            values = [row[0] if len(pks) == 1 else tuple(row) for row in rows]
+            if not self.session.execute(delete, {'pks': values}).rowcount:
+                return
+            yield expunge(rows)
+
+    def bulk_delete_statement(self):
+        """
+        Returns the `DELETE ... WHERE pk IN (SELECT ...) RETURNING pk`
+        statement deleting all the query items used by #bulk_delete when the
+        dialect supports it.
+        """
+        pks = self.table_primary_keys
+        columns = [self.columns[pk] for pk in pks]
+        column = columns[0] if len(columns) == 1 else tuple_(*columns)
+        select = self.query.with_entities(
+            *(getattr(self.Model, pk).label(pk) for pk in pks)
+        )
+        return (
+            self.table.delete()
+            .where(column.in_(select.statement))
+            .returning(*(column.label(pk) for column, pk in zip(columns, pks)))
+        )
+
+    def bulk_update(self, patches):
+        """
+        Update the items with the `patches` without loading them with one
+        executemany `UPDATE ... WHERE pk = :pk` statement per set of patched
+        columns and returns the updated items.
+        """
+        pks = self.table_primary_keys
+        for patch in patches:
+            self.set_defaults(
+                patch, [name for name in self.columns if name in patch]
+            )
+        mappings = self.deserializer.mappings(patches)
+        columns = {
+            name: column
+            for name, column in self.columns.items()
+            if getattr(column, 'table', None) is self.table
+        }
+
+        groups = OrderedDict()
+        for patch, mapping in zip(patches, mappings):
+            params = {f'_pk_{pk}': mapping[pk] for pk in pks}
+            for name, value in mapping.items():
+                if name in patch and name in columns and name not in pks:
+                    params[columns[name].key] = value
+            if len(params) > len(pks):
+                groups.setdefault(tuple(sorted(params)), []).append(params)
+
+        statement = self.table.update().where(
+            and_(*(columns[pk] == bindparam(f'_pk_{pk}') for pk in pks))
+        )
+        for group in groups.values():
+            self.session.execute(statement, group)
+
+        keys = OrderedDict.fromkeys(
+            tuple(mapping[pk] for pk in pks) for mapping in mappings
+        )
+        return self.get_all_from_pks(
+            self.session.query(self.Model).populate_existing(),
+            [dict(zip(pks, key)) for key in keys],
+        )
+
     def get_from_pk(self, query, **pks):
         """Get the item from `query` that has `**pks` or None if not found."""
         for key, val in pks.items():
@@ -750,36 +1739,99 @@ class Rest(object):
     def get_all_from_pks(self, query, items_pks):
         """
         Get all items from `query` correponding to the primary keys `items_pks`
-        in one query.
-        """
-        return query.filter(
-            or_(
-                *[
-                    and_(
-                        *[
-                            getattr(self.Model, key) == val
-                            for key, val in pks.items()
-                        ]
-                    )
-                    for pks in items_pks
-                ]
-            )
-        ).all()
+        with one `IN` query per `chunk_size` keys.
+        """
+        if not items_pks:
+            return []
+        keys = list(items_pks[0])
+        if len(keys) == 1:
+            (key,) = keys
+            column = getattr(self.Model, key)
+            values = [pks[key] for pks in items_pks]
+        else:
+            column = tuple_(*(getattr(self.Model, key) for key in keys))
+            values = [tuple(pks[key] for key in keys) for pks in items_pks]
+
+        query = query.filter(column.in_(bindparam('pks', expanding=True)))
+        items = []
+        for start in range(0, len(values), self.chunk_size):
+            end = start + self.chunk_size
+            items.extend(query.params(pks=values[start:end]).all())
+        return items
 
     @contextmanager
     def query_request(self, request):
         """
         Context manager that sets the `_query_alterer` to the idiom alter_query
-        and restore it to identity at exit.
+        and the count mode to the one asked by the request if any, and
+        restore them at exit.
+
+        They are stored in a context variable and not on the rest since
+        several requests can be routed concurrently (in the threads of an
+        executor or in the greenlets of an `AsyncSession`).
         """
-        self._query_alterer = partial(self.idiom.alter_query, request)
-        yield
-        self._query_alterer = _identity
+        mode = self.idiom.count_mode(request)
+        if mode is not None and mode not in COUNT_MODES:
+            self.raise_error(
+                400,
+                f'Unknown count mode {mode} '
+                f'(must be one of {", ".join(COUNT_MODES)})',
+            )
+        state = dict(_request_state.get())
+        state[self] = partial(self.idiom.alter_query, request), mode
+        token = _request_state.set(state)
+        try:
+            yield
+        finally:
+            _request_state.reset(token)
+
+    @property
+    def _query_alterer(self):
+        """The idiom alter_query of the current request."""
+        return _request_state.get().get(self, (_identity, None))[0]
+
+    @property
+    def _request_count_mode(self):
+        """The count mode asked by the current request if any."""
+        return _request_state.get().get(self, (_identity, None))[1]
 
     @property
     def session(self):
-        """Shortcut property to the #::unrest#UnRest session."""
-        return self.unrest.session
+        """
+        Shortcut property to the #::unrest#UnRest session or to the
+        synchronous session of its `AsyncSession` during an #async_route.
+        """
+        session = _sync_session.get()
+        if session is None:
+            return self.unrest.session
+        return session
+
+    @property
+    def async_session(self):
+        """
+        The #::unrest#UnRest session if it is an `AsyncSession` (or the
+        current one of its `async_scoped_session`), None otherwise.
+        """
+        session = self.unrest.session
+        if not hasattr(session, 'run_sync') and hasattr(session, 'registry'):
+            # async_scoped_session does not proxy run_sync in SQLAlchemy 1.4
+            session = session()
+        if hasattr(session, 'run_sync'):
+            return session
+
+    @property
+    def dialect(self):
+        """
+        The SQLAlchemy dialect of the session connection of this model
+        (rather than of `session.get_bind` whose signature differs in
+        Flask-SQLAlchemy 2 sessions under SQLAlchemy 1.4).
+        """
+        return self.session.connection(mapper=self.mapper).dialect
+
+    @property
+    def is_async(self):
+        """True if the #::unrest#UnRest session is an `AsyncSession`."""
+        return self.async_session is not None
 
     @property
     def query(self):
@@ -814,33 +1866,75 @@ class Rest(object):
         """This Model table name."""
         return self.Model.__table__
 
+    def invalidate(self):
+        """
+        Reset the cached mapper, primary keys and columns and recompile the
+        serialization plans.
+
+        This is called on creation and must be called again if the `Model`
+        mapping or the `only`, `exclude`, `properties`, `relationships`,
+        `primary_keys`, `defaults` or `fixed` attributes are changed afterwards
+        (i.e. a `column_property` added after the mapper configuration).
+        """
+        self._mapper = None
+        self._resolved_primary_keys = None
+        self._columns = None
+
+        self.serializer = self.SerializeClass(
+            None, self.columns, self.properties, self.relationships
+        )
+        self.serializer.native_types = self.idiom.native_types
+        self.deserializer = self.DeserializeClass(None, self.columns)
+        # In case of column_property or hybrid_property
+        prop_by_name = {prop.name: prop for prop in self.properties}
+        self._pk_columns = {
+            pk: self.columns.get(pk, prop_by_name.get(pk))
+            for pk in self.primary_keys
+        }
+        defaults = dict(self.defaults, **self.fixed)
+        self._defaulters = tuple(
+            (name, name in self.fixed, defaults[name])
+            for name in self.columns
+            if name in defaults
+        )
+
     @property
     def mapper(self):
         """Get the SQLAlchemy mapper of this Model."""
-        return inspect(self.Model)
+        if self._mapper is None:
+            self._mapper = inspect(self.Model)
+        return self._mapper
 
     @property
     def primary_keys(self):
-        """This model primary keys names."""
-        if self._primary_keys:
-            return self._primary_keys
-
-        return [
-            self.mapper.get_property_by_column(pk).key
-            for pk in self.mapper.primary_key
-        ]
+        """This model primary keys names as a tuple."""
+        if self._resolved_primary_keys is None:
+            if self._primary_keys:
+                self._resolved_primary_keys = tuple(self._primary_keys)
+            else:
+                self._resolved_primary_keys = tuple(
+                    self.mapper.get_property_by_column(pk).key
+                    for pk in self.mapper.primary_key
+                )
+        return self._resolved_primary_keys
 
     @property
     def columns(self):
-        """Gets all columns of this model `column_property` included."""
-
-        def gen():
-            for name, column in self.mapper.columns.items():
-                if name not in self.primary_keys:
-                    if self.only is not None and name not in self.only:
-                        continue
-                    if self.exclude and name in self.exclude:
-                        continue
-                yield name, column
-
-        return dict(gen())
+        """
+        Gets all columns of this model `column_property` included as a
+        read-only mapping.
+        """
+        if self._columns is None:
+            primary_keys = set(self.primary_keys)
+
+            def gen():
+                for name, column in self.mapper.columns.items():
+                    if name not in primary_keys:
+                        if self.only is not None and name not in self.only:
+                            continue
+                        if self.exclude and name in self.exclude:
+                            continue
+                    yield name, column
+
+            self._columns = MappingProxyType(dict(gen()))
+        return self._columns
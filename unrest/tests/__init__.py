@@ -1,2 +1,23 @@
+from contextlib import contextmanager
+
+from sqlalchemy import event
+
+
 def idsorted(it, key='id'):
     return sorted(it, key=lambda x: x[key])
+
+
+@contextmanager
+def selects(engine, verb='SELECT'):
+    """Collects the SELECT (or `verb`) statements executed on `engine`."""
+    statements = []
+
+    def before_cursor_execute(conn, cursor, statement, *args):
+        if statement.startswith(verb):
+            statements.append(statement)
+
+    event.listen(engine, 'before_cursor_execute', before_cursor_execute)
+    try:
+        yield statements
+    finally:
+        event.remove(engine, 'before_cursor_execute', before_cursor_execute)
@@ -1,9 +1,11 @@
 import pytest
 
+from .helpers.asgi import ASGIClient
 from .helpers.flask import FlaskClient
 from .helpers.http_server import HTTPServerClient
 from .helpers.sanic import SanicClient
 from .helpers.tornado import TornadoClient
+from .helpers.wsgi import WSGIClient
 
 
 @pytest.fixture(
@@ -13,6 +15,8 @@ from .helpers.tornado import TornadoClient
         pytest.param(HTTPServerClient, marks=pytest.mark.http_server),
         pytest.param(TornadoClient, marks=pytest.mark.tornado),
         pytest.param(SanicClient, marks=pytest.mark.sanic),
+        pytest.param(WSGIClient, marks=pytest.mark.wsgi),
+        pytest.param(ASGIClient, marks=pytest.mark.asgi),
     ],
 )
 def client_class(request):
@@ -1,5 +1,7 @@
+from sqlalchemy.dialects import postgresql
+
 from ...unrest import UnRest
-from .. import idsorted
+from .. import idsorted, selects
 from ..model import Fruit, Tree
 
 
@@ -81,3 +83,79 @@ def test_delete_fruits(client):
     assert code == 200
     assert json['occurences'] == 0
     assert idsorted(json['objects']) == []
+
+
+def test_delete_primary_keys(client):
+    rest = UnRest(client.app, client.session, framework=client.__framework__)
+    rest(
+        Fruit,
+        methods=['GET', 'DELETE'],
+        query=lambda q: q.filter(Fruit.fruit_id > 1),
+        allow_batch=True,
+        batch_delete='primary_keys',
+        chunk_size=3,
+    )
+    with selects(client.engine, 'DELETE') as statements:
+        code, json = client.fetch('/api/fruit', method="DELETE")
+    assert code == 200
+    assert len(statements) == 2
+    assert json['occurences'] == 4
+    assert idsorted(json['objects'], 'fruit_id') == [
+        {'fruit_id': 2},
+        {'fruit_id': 3},
+        {'fruit_id': 4},
+        {'fruit_id': 5},
+    ]
+
+    code, json = client.fetch('/api/fruit')
+    assert code == 200
+    assert json['occurences'] == 0
+
+
+def test_delete_primary_keys_implicit_returning(client, monkeypatch):
+    rest = UnRest(client.app, client.session, framework=client.__framework__)
+    tree = rest(
+        Tree,
+        methods=['GET', 'DELETE'],
+        allow_batch=True,
+        batch_delete='primary_keys',
+    )
+    # Like Oracle which has no multi-row DELETE ... RETURNING
+    monkeypatch.setattr(tree.dialect, 'implicit_returning', True)
+    code, json = client.fetch('/api/tree', method="DELETE")
+    assert code == 200
+    assert json['occurences'] == 3
+
+
+def test_delete_count(client):
+    rest = UnRest(client.app, client.session, framework=client.__framework__)
+    rest(
+        Tree, methods=['GET', 'DELETE'], allow_batch=True, batch_delete='count'
+    )
+    with selects(client.engine) as statements:
+        code, json = client.fetch('/api/tree', method="DELETE")
+    assert code == 200
+    assert json == {'primary_keys': ['id'], 'occurences': 3, 'objects': []}
+    # Only the primary keys are selected
+    assert all('tree.name' not in statement for statement in statements)
+
+    code, json = client.fetch('/api/tree')
+    assert code == 200
+    assert json['occurences'] == 0
+
+
+def test_delete_bulk_statement(client):
+    rest = UnRest(client.app, client.session, framework=client.__framework__)
+    tree = rest(
+        Tree,
+        methods=[],
+        query=lambda q: q.filter(Tree.name != 'oak'),
+        batch_delete='primary_keys',
+    )
+    dialect = postgresql.dialect()
+    statement = str(tree.bulk_delete_statement().compile(dialect=dialect))
+    assert ' '.join(statement.split()) == (
+        'DELETE FROM tree WHERE tree.id IN '
+        '(SELECT tree.id AS id FROM tree WHERE tree.name != %(name_1)s) '
+        'RETURNING tree.id AS id'
+    )
@@ -1,7 +1,7 @@
 from datetime import timedelta
 
 from ...unrest import UnRest
-from .. import idsorted
+from .. import idsorted, selects
 from ..model import Fruit, Tree
 
 
@@ -60,6 +60,67 @@ def test_patch_missing_tree(client):
         },
     )
     assert code == 404
+    assert json['message'] == "tree({'id': 8}) not found"
+
+
+def test_patch_missing_trees(client):
+    rest = UnRest(client.app, client.session, framework=client.__framework__)
+    rest(Tree, methods=['GET', 'PATCH'], allow_batch=True)
+    code, json = client.fetch(
+        '/api/tree',
+        method="PATCH",
+        json={
+            'objects': [
+                {'id': 8, 'name': 'cedar'},
+                {'id': 1, 'name': 'mango'},
+                {'id': 9, 'name': 'ash'},
+            ]
+        },
+    )
+    assert code == 404
+    assert json['message'] == "tree({'id': 8}, {'id': 9}) not found"
+
+
+def test_patch_composite_primary_keys(client):
+    rest = UnRest(client.app, client.session, framework=client.__framework__)
+    rest(
+        Fruit,
+        methods=['GET', 'PATCH'],
+        only=['color', 'size'],
+        primary_keys=['fruit_id', 'color'],
+        allow_batch=True,
+    )
+    code, json = client.fetch(
+        '/api/fruit',
+        method="PATCH",
+        json={
+            'objects': [
+                {'fruit_id': 4, 'color': 'red', 'size': 4},
+                {'fruit_id': 1, 'color': 'grey', 'size': 1},
+            ]
+        },
+    )
+    assert code == 200
+    assert idsorted(json['objects'], 'fruit_id') == [
+        {'fruit_id': 1, 'color': 'grey', 'size': 1.0},
+        {'fruit_id': 4, 'color': 'red', 'size': 4.0},
+    ]
+
+    # Each component must match
+    code, json = client.fetch(
+        '/api/fruit',
+        method="PATCH",
+        json={
+            'objects': [
+                {'fruit_id': 1, 'color': 'grey', 'size': 2},
+                {'fruit_id': 4, 'color': 'grey', 'size': 3},
+            ]
+        },
+    )
+    assert code == 404
+    assert json['message'] == (
+        "fruit({'fruit_id': 4, 'color': 'grey'}) not found"
+    )
 
 
 def test_patch_fruit(client):
@@ -162,3 +223,94 @@ def test_patch_fruit(client):
             'tree_id': 1,
         },
     ]
+
+
+def test_patch_chunked(client):
+    rest = UnRest(client.app, client.session, framework=client.__framework__)
+    rest(
+        Fruit,
+        methods=['GET', 'PATCH'],
+        only=['color'],
+        allow_batch=True,
+        chunk_size=2,
+    )
+    with selects(client.engine) as statements:
+        code, json = client.fetch(
+            '/api/fruit',
+            method="PATCH",
+            json={
+                'objects': [
+                    {'fruit_id': 1, 'color': 'blue'},
+                    {'fruit_id': 3, 'color': 'green'},
+                    {'fruit_id': 4, 'color': 'yellow'},
+                ]
+            },
+        )
+    assert code == 200
+    assert sum(' IN ' in statement for statement in statements) == 2
+    assert idsorted(json['objects'], 'fruit_id') == [
+        {'fruit_id': 1, 'color': 'blue'},
+        {'fruit_id': 3, 'color': 'green'},
+        {'fruit_id': 4, 'color': 'yellow'},
+    ]
+
+
+def test_patch_bulk(client):
+    rest = UnRest(client.app, client.session, framework=client.__framework__)
+    rest(
+        Fruit,
+        methods=['GET', 'PATCH'],
+        only=['color', 'size'],
+        allow_batch=True,
+        bulk=True,
+        fixed={'size': lambda patch: len(patch.get('color', ''))},
+    )
+    with selects(client.engine, 'UPDATE') as statements:
+        code, json = client.fetch(
+            '/api/fruit',
+            method="PATCH",
+            json={
+                'objects': [
+                    {'fruit_id': 1, 'color': 'blue', 'size': 0},
+                    {'fruit_id': 3},
+                    {'fruit_id': 4, 'color': 'rainbow', 'size': 0},
+                    {'fruit_id': 5, 'tree_id': 1},
+                ]
+            },
+        )
+    assert code == 200
+    # One UPDATE for the fruits 1 and 4, fruits 3 and 5 have nothing to patch
+    assert len(statements) == 1
+    assert idsorted(json['objects'], 'fruit_id') == [
+        {'fruit_id': 1, 'color': 'blue', 'size': 4.0},
+        {'fruit_id': 3, 'color': 'brown', 'size': 2.12},
+        {'fruit_id': 4, 'color': 'rainbow', 'size': 7.0},
+        {'fruit_id': 5, 'color': 'orangered', 'size': 100.0},
+    ]
+
+    code, json = client.fetch('/api/fruit/4')
+    assert code == 200
+    assert json['objects'] == [{'fruit_id': 4, 'color': 'rainbow', 'size': 7}]
+
+
+def test_patch_bulk_missing(client):
+    rest = UnRest(client.app, client.session, framework=client.__framework__)
+    rest(
+        Tree,
+        methods=['GET', 'PATCH'],
+        query=lambda q: q.filter(Tree.id < 3),
+        allow_batch=True,
+        bulk=True,
+    )
+    code, json = client.fetch(
+        '/api/tree',
+        method="PATCH",
+        json={
+            'objects': [{'id': 1, 'name': 'cedar'}, {'id': 3, 'name': 'mango'}]
+        },
+    )
+    assert code == 404
+    assert json['message'] == "tree({'id': 3}) not found"
+
+    code, json = client.fetch('/api/tree/1')
+    assert json['objects'] == [{'id': 1, 'name': 'pine'}]
@@ -1,5 +1,5 @@
 from ...unrest import UnRest
-from .. import idsorted
+from .. import idsorted, selects
 from ..model import Fruit, Tree
 
 
@@ -253,3 +253,22 @@ def test_post_with_fixed(client):
             'tree_id': 2,
         },
     ]
+
+
+def test_post_refresh_server(client):
+    rest = UnRest(client.app, client.session, framework=client.__framework__)
+    rest(
+        Fruit,
+        methods=['GET', 'POST'],
+        only=['color', 'size', 'double_size'],
+        refresh='server',
+    )
+    with selects(client.engine) as statements:
+        code, json = client.fetch(
+            '/api/fruit', method="POST", json={'color': 'blue', 'size': 2}
+        )
+    assert code == 200
+    assert len(statements) == 1
+    assert json['objects'] == [
+        {'fruit_id': 6, 'color': 'blue', 'size': 2.0, 'double_size': 4.0}
+    ]
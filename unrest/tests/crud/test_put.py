@@ -1,6 +1,8 @@
+from sqlalchemy.dialects import postgresql
+
 from ...unrest import UnRest
-from .. import idsorted
-from ..model import Fruit, Tree
+from .. import idsorted, selects
+from ..model import Fruit, Seed, Tree
 
 
 def test_put_tree_implicitly_unallowed(client):
@@ -168,3 +170,179 @@ def test_put_with_fixed(client):
             'tree_id': 2,
         },
     ]
+
+
+def test_put_deserialize_all_mappings(client):
+    rest = UnRest(client.app, client.session, framework=client.__framework__)
+    fruit = rest(
+        Fruit,
+        methods=['GET', 'PUT'],
+        only=['color', 'size'],
+        defaults={'color': 'white'},
+        fixed={'size': lambda p: len(p['color'])},
+    )
+    assert fruit.deserialize_all(
+        {'objects': [{'fruit_id': 8}, {'color': 'yellow', 'size': 2}]},
+        mappings=True,
+    ) == [
+        {'fruit_id': 8, 'color': 'white', 'size': 5},
+        {'color': 'yellow', 'size': 6},
+    ]
+
+
+def test_put_bulk(client):
+    rest = UnRest(client.app, client.session, framework=client.__framework__)
+    rest(Tree, methods=['GET', 'PUT'], allow_batch=True, bulk=True)
+    code, json = client.fetch(
+        '/api/tree',
+        method="PUT",
+        json={
+            'objects': [{'id': 5, 'name': 'cedar'}, {'id': 2, 'name': 'mango'}]
+        },
+    )
+    assert code == 200
+    assert json['occurences'] == 2
+    assert json['objects'] == [
+        {'id': 5, 'name': 'cedar'},
+        {'id': 2, 'name': 'mango'},
+    ]
+
+    code, json = client.fetch('/api/tree')
+    assert code == 200
+    assert idsorted(json['objects']) == [
+        {'id': 2, 'name': 'mango'},
+        {'id': 5, 'name': 'cedar'},
+    ]
+
+
+def test_put_bulk_defaults(client):
+    rest = UnRest(client.app, client.session, framework=client.__framework__)
+    rest(Seed, methods=['GET', 'PUT'], allow_batch=True, bulk=True)
+    code, json = client.fetch(
+        '/api/seed',
+        method="PUT",
+        json={
+            'objects': [
+                {'id': 1, 'name': 'acorn'},
+                {'id': 2, 'name': 'pip', 'status': 'sown', 'season': None},
+            ]
+        },
+    )
+    assert code == 200
+    assert idsorted(json['objects']) == [
+        {'id': 1, 'name': 'acorn', 'status': 'new', 'season': 'spring'},
+        {'id': 2, 'name': 'pip', 'status': 'sown', 'season': 'spring'},
+    ]
+
+
+def test_put_bulk_statement(client):
+    rest = UnRest(client.app, client.session, framework=client.__framework__)
+    fruit = rest(Fruit, methods=[], only=['color', 'size'])
+    rows = [{'idf': 1, 'hue': 'blue', 'size': 2}]
+    dialect = postgresql.dialect()
+
+    assert fruit.serializable_rows
+    statement = str(fruit.bulk_insert_statement(rows).compile(dialect=dialect))
+    assert statement.startswith('INSERT INTO fruit (idf, hue, size) VALUES')
+    assert statement.endswith(
+        'RETURNING fruit.idf AS fruit_id, fruit.hue AS color, '
+        'fruit.size AS size'
+    )
+
+    # The double_size column_property is not in the inserted rows
+    fruit = rest(Fruit, methods=[], name='fruits')
+    assert not fruit.serializable_rows
+    statement = str(fruit.bulk_insert_statement(rows).compile(dialect=dialect))
+    assert statement.endswith('RETURNING fruit.idf AS fruit_id')
+
+
+def test_put_bulk_generated_primary_keys(client):
+    rest = UnRest(client.app, client.session, framework=client.__framework__)
+    fruit = rest(Fruit, methods=[], only=['color'])
+    rest(
+        Tree,
+        methods=['GET', 'PUT'],
+        relationships={'fruits': fruit},
+        allow_batch=True,
+        bulk=True,
+    )
+    code, json = client.fetch(
+        '/api/tree',
+        method="PUT",
+        json={'objects': [{'name': 'cedar'}, {'id': 8, 'name': 'mango'}]},
+    )
+    assert code == 200
+    assert json['occurences'] == 2
+    assert json['objects'][1] == {'id': 8, 'name': 'mango', 'fruits': []}
+    assert json['objects'][0]['name'] == 'cedar'
+
+    code, json = client.fetch('/api/tree')
+    assert code == 200
+    assert json['occurences'] == 2
+
+
+def test_put_bulk_with_defaults_and_validators(client):
+    rest = UnRest(client.app, client.session, framework=client.__framework__)
+    rest(
+        Fruit,
+        methods=['GET', 'PUT'],
+        only=['color', 'size'],
+        allow_batch=True,
+        bulk=True,
+        defaults={'color': 'white'},
+        validators={'size': lambda field: field.value * 2},
+    )
+    code, json = client.fetch(
+        '/api/fruit',
+        method="PUT",
+        json={'objects': [{'fruit_id': 8, 'size': 2}, {'size': 1.5}]},
+    )
+    assert code == 200
+    assert json['objects'][0] == {'fruit_id': 8, 'color': 'white', 'size': 4}
+    assert json['objects'][1]['size'] == 3
+
+
+def test_put_refresh_server(client):
+    rest = UnRest(client.app, client.session, framework=client.__framework__)
+    rest(
+        Fruit,
+        methods=['GET', 'PUT'],
+        only=['color', 'size', 'double_size'],
+        allow_batch=True,
+        refresh='server',
+    )
+    with selects(client.engine) as statements:
+        code, json = client.fetch(
+            '/api/fruit',
+            method="PUT",
+            json={
+                'objects': [
+                    {'fruit_id': 1, 'color': 'blue', 'size': 2},
+                    {'fruit_id': 2, 'color': 'red', 'size': 3},
+                ]
+            },
+        )
+    assert code == 200
+    # Only the double_size column property is reloaded
+    assert len(statements) == 1
+    assert idsorted(json['objects'], 'fruit_id') == [
+        {'fruit_id': 1, 'color': 'blue', 'size': 2.0, 'double_size': 4.0},
+        {'fruit_id': 2, 'color': 'red', 'size': 3.0, 'double_size': 6.0},
+    ]
+
+
+def test_put_refresh_none(client):
+    rest = UnRest(client.app, client.session, framework=client.__framework__)
+    rest(Tree, methods=['GET', 'PUT'], allow_batch=True, refresh=None)
+    with selects(client.engine) as statements:
+        code, json = client.fetch(
+            '/api/tree',
+            method="PUT",
+            json={'objects': [{'id': 1, 'name': 'cedar'}, {'name': 'mango'}]},
+        )
+    assert code == 200
+    assert statements == []
+    assert idsorted(json['objects']) == [
+        {'id': 1, 'name': 'cedar'},
+        {'id': 2, 'name': 'mango'},
+    ]
@@ -1,6 +1,8 @@
+from sqlalchemy.dialects import mysql, postgresql
+
 from ...unrest import UnRest
 from .. import idsorted
-from ..model import Fruit, Tree
+from ..model import Fruit, Seed, Tree
 
 
 def test_put_tree(client):
@@ -137,3 +139,84 @@ def test_put_fruit(client):
             'tree_id': None,
         },
     ]
+
+
+def test_put_upsert_fallback(client):
+    rest = UnRest(client.app, client.session, framework=client.__framework__)
+    tree = rest(Tree, methods=['GET', 'PUT'], upsert=True)
+    # No upsert in sqlite
+    assert not tree.upsertable
+    code, json = client.fetch(
+        '/api/tree/1', method="PUT", json={'id': 1, 'name': 'cedar'}
+    )
+    assert code == 200
+    assert json['objects'] == [{'id': 1, 'name': 'cedar'}]
+
+
+def test_put_upsert_statement(client):
+    rest = UnRest(client.app, client.session, framework=client.__framework__)
+    fruit = rest(Fruit, methods=['GET', 'PUT'], only=['color', 'size'])
+    item = Fruit(fruit_id=1, color='blue', size=2)
+
+    dialect = postgresql.dialect()
+    statement = str(
+        fruit.upsert_statement(item, dialect).compile(dialect=dialect)
+    )
+    assert statement.startswith('INSERT INTO fruit (idf, hue, size) VALUES')
+    assert statement.endswith(
+        'ON CONFLICT (idf) DO UPDATE SET hue = excluded.hue, '
+        'size = excluded.size'
+    )
+
+    dialect = mysql.dialect()
+    statement = str(
+        fruit.upsert_statement(item, dialect).compile(dialect=dialect)
+    )
+    assert statement.endswith(
+        'ON DUPLICATE KEY UPDATE hue = VALUES(hue), size = VALUES(size)'
+    )
+
+
+def test_put_upsert_statement_defaults(client):
+    rest = UnRest(client.app, client.session, framework=client.__framework__)
+    seed = rest(Seed, methods=['GET', 'PUT'], upsert=True)
+    item = Seed(id=3, name='acorn')
+
+    dialect = postgresql.dialect()
+    statement = seed.upsert_statement(item, dialect).compile(dialect=dialect)
+    # The defaults apply on insert, the columns are blanked on update
+    assert str(statement).startswith(
+        'INSERT INTO seed (id, name, status) VALUES'
+    )
+    assert [column.key for column in statement.insert_prefetch] == ['status']
+    assert str(statement).endswith(
+        'ON CONFLICT (id) DO UPDATE SET name = excluded.name, '
+        'status = %(param_1)s, season = %(param_2)s'
+    )
+    assert statement.params['param_1'] is None
+    assert statement.params['param_2'] is None
+
+
+def test_put_upsert_scoped(client, monkeypatch):
+    rest = UnRest(client.app, client.session, framework=client.__framework__)
+    tree = rest(Tree, methods=['GET', 'PUT'], upsert=True)
+    young = rest(
+        Tree,
+        methods=['GET', 'PUT'],
+        name='young',
+        query=lambda q: q.filter(Tree.id > 1),
+        upsert=True,
+    )
+    monkeypatch.setattr(tree.dialect, 'name', 'postgresql')
+    assert tree.upsertable
+    # The upsert could overwrite an item out of the query
+    assert not young.upsertable
+    assert not tree.sub(lambda q: q.filter(Tree.id > 1)).upsertable
+
+    code, json = client.fetch(
+        '/api/young/1', method="PUT", json={'id': 1, 'name': 'cedar'}
+    )
+    assert code == 500
+    monkeypatch.undo()
+    code, json = client.fetch('/api/tree/1')
+    assert json['objects'] == [{'id': 1, 'name': 'pine'}]
@@ -0,0 +1,170 @@
+import asyncio
+import json
+
+import pytest
+from tornado.httpclient import AsyncHTTPClient
+from tornado.httpserver import HTTPServer
+from tornado.testing import bind_unused_port
+from tornado.web import Application
+
+from ...framework.tornado import TornadoFramework
+from ...idiom.json_server import JsonServerIdiom
+from ...unrest import UnRest
+from .. import idsorted
+from ..model import Base, Fruit, Tree, fill_data
+
+asyncio_ext = pytest.importorskip('sqlalchemy.ext.asyncio')
+pytest.importorskip('aiosqlite')
+
+
+async def fetch_all(requests):
+    from sqlalchemy.pool import StaticPool
+
+    engine = asyncio_ext.create_async_engine(
+        'sqlite+aiosqlite://', poolclass=StaticPool
+    )
+    async with engine.begin() as connection:
+        await connection.run_sync(Base.metadata.create_all)
+    session = asyncio_ext.AsyncSession(engine)
+    await session.run_sync(fill_data)
+    await session.commit()
+
+    app = Application()
+    rest = UnRest(app, session, framework=TornadoFramework)
+    fruit = rest(Fruit, methods=[], only=['color'])
+    rest(Tree, methods=['GET', 'PUT'], relationships={'fruits': fruit})
+    rest(Fruit, name='stream', only=['color'], stream=True, yield_per=2)
+
+    socket, port = bind_unused_port()
+    server = HTTPServer(app)
+    server.add_sockets([socket])
+    client = AsyncHTTPClient()
+    responses = []
+    try:
+        for path, method, body in requests:
+            response = await client.fetch(
+                f'http://127.0.0.1:{port}/api/{path}',
+                method=method,
+                body=body and json.dumps(body),
+                raise_error=False,
+            )
+            responses.append((response.code, json.loads(response.body)))
+    finally:
+        server.stop()
+        await session.close()
+        await engine.dispose()
+    return responses
+
+
+def test_async_session():
+    get, put, get_pk, stream, missing = asyncio.run(
+        fetch_all(
+            [
+                ('tree', 'GET', None),
+                ('tree/1', 'PUT', {'name': 'cedar'}),
+                ('tree/1', 'GET', None),
+                ('stream', 'GET', None),
+                ('tree/9', 'GET', None),
+            ]
+        )
+    )
+    assert get[0] == 200
+    assert [tree['name'] for tree in idsorted(get[1]['objects'])] == [
+        'pine',
+        'maple',
+        'oak',
+    ]
+    assert put[0] == 200
+    assert get_pk == (
+        200,
+        {
+            'primary_keys': ['id'],
+            'occurences': 1,
+            'objects': [
+                {
+                    'id': 1,
+                    'name': 'cedar',
+                    'fruits': [
+                        {'fruit_id': 1, 'color': 'grey'},
+                        {'fruit_id': 2, 'color': 'darkgrey'},
+                        {'fruit_id': 3, 'color': 'brown'},
+                    ],
+                }
+            ],
+        },
+    )
+    assert stream[0] == 200
+    assert stream[1]['occurences'] == 5
+    assert missing == (
+        200,
+        {'primary_keys': ['id'], 'occurences': 0, 'objects': []},
+    )
+
+
+def test_async_session_concurrent_requests(tmp_path):
+    from sqlalchemy.orm import sessionmaker
+    from sqlalchemy.util import await_only
+
+    paths = ['/api/tree?_limit=1&_count=none', '/api/tree']
+
+    async def fetch_concurrently():
+        engine = asyncio_ext.create_async_engine(
+            f'sqlite+aiosqlite:///{tmp_path / "test.db"}'
+        )
+        async with engine.begin() as connection:
+            await connection.run_sync(Base.metadata.create_all)
+        # One session per request task
+        session = asyncio_ext.async_scoped_session(
+            sessionmaker(engine, class_=asyncio_ext.AsyncSession),
+            scopefunc=asyncio.current_task,
+        )
+        await session().run_sync(fill_data)
+        await session.commit()
+        await session.remove()
+
+        app = Application()
+        rest = UnRest(
+            app, session, framework=TornadoFramework, idiom=JsonServerIdiom
+        )
+        tree = rest(Tree, etag='id')
+        routed = asyncio.Event()
+        waiting = []
+        sessions = []
+
+        async def wait_routed():
+            waiting.append(None)
+            if len(waiting) == len(paths):
+                routed.set()
+            await routed.wait()
+
+        @tree.declare('GET')
+        def get(payload, **pks):
+            # Both requests are routed before any of them queries
+            await_only(wait_routed())
+            sessions.append(session())
+            return tree.get(payload, **pks)
+
+        socket, port = bind_unused_port()
+        server = HTTPServer(app)
+        server.add_sockets([socket])
+        client = AsyncHTTPClient()
+
+        async def fetch(path):
+            response = await client.fetch(f'http://127.0.0.1:{port}{path}')
+            return json.loads(response.body), response.headers
+
+        try:
+            return await asyncio.gather(*map(fetch, paths))
+        finally:
+            server.stop()
+            for request_session in sessions:
+                await request_session.close()
+            await engine.dispose()
+
+    (limited, limited_headers), (trees, headers) = asyncio.run(
+        fetch_concurrently()
+    )
+    assert [tree['id'] for tree in limited] == [1]
+    assert 'X-Total-Count' not in limited_headers
+    assert [tree['id'] for tree in trees] == [1, 2, 3]
+    assert headers['X-Total-Count'] == '3'
@@ -0,0 +1,140 @@
+from ...cache import FileCache, MemoryCache
+from ...unrest import UnRest
+from .. import idsorted, selects
+from ..model import Fruit, Tree
+
+
+def test_cache(client):
+    rest = UnRest(client.app, client.session, framework=client.__framework__)
+    cache = MemoryCache()
+    rest(Tree, methods=['GET', 'PUT'], cache=cache)
+    code, json = client.fetch('/api/tree')
+    assert code == 200
+    assert json['occurences'] == 3
+
+    with selects(client.engine) as statements:
+        code, json = client.fetch('/api/tree')
+    assert code == 200
+    assert json['occurences'] == 3
+    assert len(statements) == 0
+
+    code, json = client.fetch('/api/tree?name=oak')
+    assert code == 200
+    code, json = client.fetch('/api/tree/2')
+    assert code == 200
+    assert json['objects'] == [{'id': 2, 'name': 'maple'}]
+    assert len(cache._entries) == 3
+
+    code, json = client.fetch(
+        '/api/tree/2', method='PUT', json={'id': 2, 'name': 'ash'}
+    )
+    assert code == 200
+
+    with selects(client.engine) as statements:
+        code, json = client.fetch('/api/tree/2')
+    assert code == 200
+    assert json['objects'] == [{'id': 2, 'name': 'ash'}]
+    assert len(statements) == 1
+
+
+def test_cache_relationships(client):
+    rest = UnRest(client.app, client.session, framework=client.__framework__)
+    fruit = rest(Fruit, methods=['GET', 'DELETE'], only=['color'])
+    rest(
+        Tree,
+        relationships={'fruits': fruit},
+        cache=MemoryCache(),
+    )
+    code, json = client.fetch('/api/tree/2')
+    assert code == 200
+    assert json['objects'][0]['fruits'] == [{'fruit_id': 4, 'color': 'red'}]
+
+    code, json = client.fetch('/api/fruit/4', method='DELETE')
+    assert code == 200
+
+    code, json = client.fetch('/api/tree/2')
+    assert code == 200
+    assert json['objects'][0]['fruits'] == []
+
+
+def test_cache_sub(client):
+    rest = UnRest(client.app, client.session, framework=client.__framework__)
+    tree = rest(Tree, methods=['GET', 'POST'])
+    subtree = tree.sub(
+        lambda q: q.filter(Tree.name != 'oak'), cache=MemoryCache()
+    )
+    assert subtree.cache_tags == ['tree']
+    code, json = client.fetch('/api/subtree')
+    assert code == 200
+    assert json['occurences'] == 2
+
+    code, json = client.fetch('/api/tree', method='POST', json={'name': 'ash'})
+    assert code == 200
+
+    code, json = client.fetch('/api/subtree')
+    assert code == 200
+    assert json['occurences'] == 3
+
+
+def test_cache_principal(client):
+    rest = UnRest(client.app, client.session, framework=client.__framework__)
+    rest(
+        Tree,
+        cache=MemoryCache(),
+        cache_principal=lambda request: request.headers.get('X-User'),
+    )
+    client.fetch('/api/tree', headers={'X-User': 'alice'})
+    with selects(client.engine) as statements:
+        client.fetch('/api/tree', headers={'X-User': 'alice'})
+    assert len(statements) == 0
+
+    with selects(client.engine) as statements:
+        client.fetch('/api/tree', headers={'X-User': 'bob'})
+    assert len(statements) > 0
+
+
+def test_cache_etag(client):
+    rest = UnRest(client.app, client.session, framework=client.__framework__)
+    rest(Tree, cache=MemoryCache(), etag=True)
+    response = client.raw_fetch('/api/tree', headers={})
+    assert response.code == 200
+    etag = response.headers['ETag']
+
+    response = client.raw_fetch('/api/tree', headers={})
+    assert response.code == 200
+    assert response.headers['ETag'] == etag
+    assert response.headers['Content-Type'] == 'application/json'
+
+    response = client.raw_fetch('/api/tree', headers={'If-None-Match': etag})
+    assert response.code == 304
+
+
+def test_cache_file(client, tmp_path):
+    rest = UnRest(client.app, client.session, framework=client.__framework__)
+    fruit = rest(Fruit, methods=['GET', 'PATCH'], only=['color'])
+    tree = rest(
+        Tree,
+        relationships={'fruits': fruit},
+        cache=FileCache(str(tmp_path)),
+    )
+    code, json = client.fetch('/api/tree')
+    assert code == 200
+
+    with selects(client.engine) as statements:
+        code, cached = client.fetch('/api/tree')
+    assert code == 200
+    assert cached == json
+    assert len(statements) == 0
+
+    code, _ = client.fetch(
+        '/api/fruit/1', method='PATCH', json={'color': 'white'}
+    )
+    assert code == 200
+
+    code, json = client.fetch('/api/tree')
+    assert code == 200
+    assert idsorted(json['objects'])[0]['fruits'][0] == {
+        'fruit_id': 1,
+        'color': 'white',
+    }
+    assert tree.cache_tags == ['fruit', 'tree']
@@ -0,0 +1,122 @@
+from pytest import raises
+
+from ...idiom.json_server import JsonServerIdiom
+from ...idiom.unrest import UnRestIdiom
+from ...unrest import UnRest
+from .. import idsorted
+from ..model import Tree
+
+
+class PaginatedUnRestIdiom(UnRestIdiom):
+    def alter_query(self, request, query):
+        offset = int(request.query.get('offset', [0])[0])
+        return query.order_by(Tree.id).offset(offset).limit(2)
+
+
+def test_count_none(client):
+    rest = UnRest(client.app, client.session, framework=client.__framework__)
+    rest(Tree, count=None)
+    code, json = client.fetch('/api/tree')
+    assert code == 200
+    assert 'occurences' not in json
+    assert len(json['objects']) == 3
+
+    code, json = client.fetch('/api/tree/1')
+    assert code == 200
+    assert json['occurences'] == 1
+
+
+def test_count_window(client):
+    rest = UnRest(
+        client.app,
+        client.session,
+        framework=client.__framework__,
+        idiom=PaginatedUnRestIdiom,
+    )
+    rest(Tree, count='window')
+    code, json = client.fetch('/api/tree')
+    assert code == 200
+    assert json['occurences'] == 3
+    assert json['offset'] == 0
+    assert json['limit'] == 2
+    assert idsorted(json['objects']) == [
+        {'id': 1, 'name': 'pine'},
+        {'id': 2, 'name': 'maple'},
+    ]
+
+    code, json = client.fetch('/api/tree?offset=2')
+    assert code == 200
+    assert json['occurences'] == 3
+    assert json['objects'] == [{'id': 3, 'name': 'oak'}]
+
+    code, json = client.fetch('/api/tree?offset=5')
+    assert code == 200
+    assert json['occurences'] == 3
+    assert json['objects'] == []
+
+
+def test_count_cached(client):
+    rest = UnRest(client.app, client.session, framework=client.__framework__)
+    rest(Tree, methods=['GET', 'POST'], count='cached')
+    code, json = client.fetch('/api/tree')
+    assert code == 200
+    assert json['occurences'] == 3
+
+    code, json = client.fetch('/api/tree', method='POST', json={'name': 'ash'})
+    assert code == 200
+
+    code, json = client.fetch('/api/tree')
+    assert code == 200
+    assert json['occurences'] == 3
+    assert len(json['objects']) == 4
+
+
+def test_count_estimate_fallback(client):
+    rest = UnRest(client.app, client.session, framework=client.__framework__)
+    tree = rest(Tree, count='estimate')
+    code, json = client.fetch('/api/tree')
+    assert code == 200
+    assert json['occurences'] == 3
+    assert len(tree._count_cache) == 1
+
+
+def test_count_per_request(client):
+    rest = UnRest(client.app, client.session, framework=client.__framework__)
+    rest(Tree)
+    code, json = client.fetch('/api/tree?_count=none')
+    assert code == 200
+    assert 'occurences' not in json
+
+    code, json = client.fetch('/api/tree?_count=window')
+    assert code == 200
+    assert json['occurences'] == 3
+
+    code, json = client.fetch('/api/tree?_count=wrong')
+    assert code == 400
+    assert json['message'] == (
+        'Unknown count mode wrong '
+        '(must be one of exact, window, estimate, cached, none)'
+    )
+
+
+def test_count_invalid(client):
+    rest = UnRest(client.app, client.session, framework=client.__framework__)
+    with raises(AssertionError):
+        rest(Tree, count='wrong')
+
+
+def test_count_json_server(client):
+    rest = UnRest(
+        client.app,
+        client.session,
+        idiom=JsonServerIdiom,
+        framework=client.__framework__,
+    )
+    rest(Tree, count=None)
+    response = client.raw_fetch('/api/tree')
+    assert response.code == 200
+    assert 'X-Total-Count' not in response.headers
+
+    response = client.raw_fetch('/api/tree?_count=window&_start=1&_end=2')
+    assert response.code == 200
+    assert int(response.headers['X-Total-Count']) == 3
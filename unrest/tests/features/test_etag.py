@@ -0,0 +1,138 @@
+from datetime import datetime
+
+from sqlalchemy import DateTime, literal
+
+from ...unrest import UnRest
+from ...util import Request
+from .. import selects
+from ..model import Tree
+
+
+def test_etag_version(client):
+    rest = UnRest(client.app, client.session, framework=client.__framework__)
+    rest(Tree, methods=['GET', 'PUT'], etag='id')
+    response = client.raw_fetch('/api/tree')
+    assert response.code == 200
+    etag = response.headers['ETag']
+    assert etag.startswith('W/"')
+    assert 'Last-Modified' not in response.headers
+
+    with selects(client.engine) as statements:
+        response = client.raw_fetch(
+            '/api/tree', headers={'If-None-Match': etag}
+        )
+    assert response.code == 304
+    assert not response.body
+    # Only the version query is run
+    assert len(statements) == 1
+
+    response = client.raw_fetch(
+        '/api/tree', headers={'If-None-Match': f'"other", {etag[2:]}'}
+    )
+    assert response.code == 304
+
+    response = client.raw_fetch('/api/tree', headers={'If-None-Match': '*'})
+    assert response.code == 304
+
+    response = client.raw_fetch('/api/tree/2', headers={'If-None-Match': etag})
+    assert response.code == 200
+    assert response.headers['ETag'] != etag
+
+    code, json = client.fetch(
+        '/api/tree/4', method='PUT', json={'id': 4, 'name': 'ash'}
+    )
+    assert code == 200
+
+    response = client.raw_fetch('/api/tree', headers={'If-None-Match': etag})
+    assert response.code == 200
+    assert response.headers['ETag'] != etag
+
+
+def test_etag_content(client):
+    rest = UnRest(client.app, client.session, framework=client.__framework__)
+    rest(Tree, methods=['GET', 'PUT'], etag=True)
+    response = client.raw_fetch('/api/tree/1')
+    assert response.code == 200
+    etag = response.headers['ETag']
+    assert not etag.startswith('W/')
+
+    response = client.raw_fetch('/api/tree/1', headers={'If-None-Match': etag})
+    assert response.code == 304
+    assert not response.body
+
+    code, json = client.fetch(
+        '/api/tree/1', method='PUT', json={'id': 1, 'name': 'cedar'}
+    )
+    assert code == 200
+
+    response = client.raw_fetch('/api/tree/1', headers={'If-None-Match': etag})
+    assert response.code == 200
+    assert response.headers['ETag'] != etag
+
+
+def test_etag_none(client):
+    rest = UnRest(client.app, client.session, framework=client.__framework__)
+    tree = rest(Tree)
+    response = client.raw_fetch(
+        '/api/tree', headers={'If-None-Match': '"other"'}
+    )
+    assert response.code == 200
+    assert tree.version_column is None
+
+
+def test_not_modified_since(client):
+    rest = UnRest(client.app, client.session, framework=client.__framework__)
+    tree = rest(Tree, methods=[], etag='id')
+
+    def request(**headers):
+        return Request('/api/tree', 'GET', {}, {}, b'', headers)
+
+    headers = {'Last-Modified': 'Wed, 01 Jan 2020 10:00:00 GMT'}
+    assert tree.not_modified(
+        request(**{'If-Modified-Since': 'Wed, 01 Jan 2020 10:00:00 GMT'}),
+        headers,
+    )
+    assert tree.not_modified(
+        request(**{'If-Modified-Since': 'Thu, 02 Jan 2020 10:00:00 GMT'}),
+        headers,
+    )
+    assert not tree.not_modified(
+        request(**{'If-Modified-Since': 'Wed, 01 Jan 2020 09:59:59 GMT'}),
+        headers,
+    )
+    assert not tree.not_modified(
+        request(**{'If-Modified-Since': 'garbage'}), headers
+    )
+    assert not tree.not_modified(request(), headers)
+    # If-None-Match takes precedence
+    assert not tree.not_modified(
+        request(
+            **{
+                'If-None-Match': '"other"',
+                'If-Modified-Since': 'Wed, 01 Jan 2020 10:00:00 GMT',
+            }
+        ),
+        dict(headers, ETag='"etag"'),
+    )
+
+
+def test_etag_last_modified(client):
+    rest = UnRest(client.app, client.session, framework=client.__framework__)
+    rest(Tree, etag=literal(datetime(2020, 1, 1, 10, 0, 0, 500), DateTime))
+    response = client.raw_fetch('/api/tree')
+    assert response.code == 200
+    assert response.headers['Last-Modified'] == (
+        'Wed, 01 Jan 2020 10:00:00 GMT'
+    )
+
+    response = client.raw_fetch(
+        '/api/tree',
+        headers={'If-Modified-Since': 'Wed, 01 Jan 2020 10:00:00 GMT'},
+    )
+    assert response.code == 304
+
+    response = client.raw_fetch(
+        '/api/tree',
+        headers={'If-Modified-Since': 'Wed, 01 Jan 2020 09:00:00 GMT'},
+    )
+    assert response.code == 200
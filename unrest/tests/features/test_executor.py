@@ -0,0 +1,118 @@
+import asyncio
+import json
+import threading
+import time
+
+from sqlalchemy import create_engine
+from sqlalchemy.orm import scoped_session, sessionmaker
+from tornado.httpclient import AsyncHTTPClient
+from tornado.httpserver import HTTPServer
+from tornado.testing import bind_unused_port
+from tornado.web import Application
+
+from ...framework.tornado import TornadoFramework
+from ...idiom.json_server import JsonServerIdiom
+from ...unrest import UnRest
+from ..model import Base, Fruit, Tree, fill_data
+
+
+class ExecutorTornadoFramework(TornadoFramework):
+    def __init__(self, app, url):
+        super().__init__(app, url, 2, app.session.remove)
+
+
+def make_app(tmp_path, **kwargs):
+    engine = create_engine(f'sqlite:///{tmp_path / "test.db"}')
+    Base.metadata.create_all(engine)
+    session = scoped_session(sessionmaker(bind=engine))
+    fill_data(session)
+    session.commit()
+    session.remove()
+
+    app = Application()
+    app.session = session
+    return app, UnRest(
+        app, session, framework=ExecutorTornadoFramework, **kwargs
+    )
+
+
+async def fetch_all(app, paths):
+    socket, port = bind_unused_port()
+    server = HTTPServer(app)
+    server.add_sockets([socket])
+    client = AsyncHTTPClient()
+    finished = []
+
+    async def fetch(path):
+        response = await client.fetch(f'http://127.0.0.1:{port}{path}')
+        finished.append(path)
+        return json.loads(response.body), response.headers
+
+    try:
+        return await asyncio.gather(*map(fetch, paths)), finished
+    finally:
+        server.stop()
+
+
+def test_executor(tmp_path):
+    app, rest = make_app(tmp_path)
+    threads = set()
+    tree = rest(Tree)
+    rest(Fruit, only=['color'], stream=True, yield_per=2)
+
+    @tree.declare('GET')
+    def get(payload, **pks):
+        threads.add(threading.current_thread().name)
+        time.sleep(0.5)
+        return tree.get(payload, **pks)
+
+    ((trees, _), (fruits, _)), finished = asyncio.run(
+        fetch_all(app, ['/api/tree', '/api/fruit'])
+    )
+    assert trees['occurences'] == 3
+    assert fruits['occurences'] == 5
+    assert len(fruits['objects']) == 5
+    # The slow route did not block the event loop
+    assert finished == ['/api/fruit', '/api/tree']
+    assert all(thread.startswith('unrest') for thread in threads)
+    rest.framework.executor.shutdown()
+
+
+def test_executor_concurrent_requests(tmp_path):
+    app, rest = make_app(tmp_path, idiom=JsonServerIdiom)
+    tree = rest(Tree)
+    barrier = threading.Barrier(2, timeout=5)
+
+    @tree.declare('GET')
+    def get(payload, **pks):
+        # Both requests are routed before any of them queries
+        barrier.wait()
+        return tree.get(payload, **pks)
+
+    ((limited, limited_headers), (trees, headers)), _ = asyncio.run(
+        fetch_all(app, ['/api/tree?_limit=1&_count=none', '/api/tree'])
+    )
+    assert [tree['id'] for tree in limited] == [1]
+    assert 'X-Total-Count' not in limited_headers
+    assert [tree['id'] for tree in trees] == [1, 2, 3]
+    assert headers['X-Total-Count'] == '3'
+    rest.framework.executor.shutdown()
+
+
+def test_executor_concurrent_cached_counts(tmp_path):
+    app, rest = make_app(tmp_path, idiom=JsonServerIdiom)
+    fruit = rest(Fruit, count='cached')
+    barrier = threading.Barrier(2, timeout=5)
+
+    @fruit.declare('GET')
+    def get(payload, **pks):
+        barrier.wait()
+        return fruit.get(payload, **pks)
+
+    ((_, headers), (_, filtered_headers)), _ = asyncio.run(
+        fetch_all(app, ['/api/fruit', '/api/fruit?tree_id=1'])
+    )
+    assert headers['X-Total-Count'] == '5'
+    assert filtered_headers['X-Total-Count'] == '3'
+    assert len(fruit._count_cache) == 2
+    rest.framework.executor.shutdown()
@@ -1,3 +1,4 @@
+import json as jsonlib
 import sys
 
 from pytest import raises
@@ -8,7 +9,7 @@ from ...idiom import Idiom
 from ...idiom.json_server import JsonServerIdiom
 from ...idiom.unrest import UnRestIdiom
 from ...idiom.yaml import YamlIdiom
-from ...util import Response
+from ...util import Request, Response
 from .. import idsorted
 from ..model import Fruit, Tree
 
@@ -110,6 +111,18 @@ def test_idiom_no_implementation(client):
     assert code == 500
 
 
+def test_idiom_bytes_payload(client):
+    rest = UnRest(client.app, client.session, framework=client.__framework__)
+    request = Request('/api/tree', 'GET', {'id': None}, {}, b'', {})
+    data = {'primary_keys': ['id'], 'occurences': 0, 'objects': []}
+    for idiom in (UnRestIdiom, JsonServerIdiom, YamlIdiom):
+        tree = rest(Tree, methods=[], idiom=idiom)
+        response = tree.idiom.data_to_response(data, request)
+        assert isinstance(response.payload, bytes)
+    assert isinstance(rest.index(request).payload, bytes)
+    assert isinstance(rest.send_json({}).payload, bytes)
+
+
 def test_yaml_idiom_get(client):
     rest = UnRest(
         client.app,
@@ -753,3 +766,110 @@ def test_json_server_paginate(client):
         {'fruit_id': 3, 'color': 'brown'},
         {'fruit_id': 4, 'color': 'red'},
     ]
+
+
+def test_json_server_cursor_paginate(client):
+    rest = UnRest(
+        client.app,
+        client.session,
+        idiom=JsonServerIdiom,
+        framework=client.__framework__,
+    )
+    rest(Fruit, only=['color'])
+
+    response = client.raw_fetch('/api/fruit?_cursor=&_limit=2')
+    assert response.code == 200
+    assert jsonlib.loads(response.body.decode('utf-8')) == [
+        {'fruit_id': 1, 'color': 'grey'},
+        {'fruit_id': 2, 'color': 'darkgrey'},
+    ]
+    cursor = response.headers['X-Next-Cursor']
+
+    response = client.raw_fetch(f'/api/fruit?_cursor={cursor}&_limit=2')
+    assert response.code == 200
+    assert jsonlib.loads(response.body.decode('utf-8')) == [
+        {'fruit_id': 3, 'color': 'brown'},
+        {'fruit_id': 4, 'color': 'red'},
+    ]
+    assert int(response.headers['X-Total-Count']) == 3
+    cursor = response.headers['X-Next-Cursor']
+
+    response = client.raw_fetch(f'/api/fruit?_cursor={cursor}&_limit=2')
+    assert response.code == 200
+    assert jsonlib.loads(response.body.decode('utf-8')) == [
+        {'fruit_id': 5, 'color': 'orangered'}
+    ]
+    assert 'X-Next-Cursor' not in response.headers
+
+
+def test_json_server_cursor_paginate_sort(client):
+    rest = UnRest(
+        client.app,
+        client.session,
+        idiom=JsonServerIdiom,
+        framework=client.__framework__,
+    )
+    rest(Fruit, only=['color', 'tree_id'])
+
+    colors = []
+    cursor = ''
+    while cursor is not None:
+        response = client.raw_fetch(
+            '/api/fruit?_sort=tree_id,color&_order=asc,desc'
+            f'&_limit=2&_cursor={cursor}&fruit_id_ne=5'
+        )
+        assert response.code == 200
+        colors.extend(
+            fruit['color']
+            for fruit in jsonlib.loads(response.body.decode('utf-8'))
+        )
+        cursor = response.headers.get('X-Next-Cursor')
+    assert colors == ['grey', 'darkgrey', 'brown', 'red']
+
+
+def test_json_server_cursor_paginate_nullable(client):
+    rest = UnRest(
+        client.app,
+        client.session,
+        idiom=JsonServerIdiom,
+        framework=client.__framework__,
+    )
+    rest(Fruit, only=['color', 'tree_id'])
+
+    def paginate(sort, order):
+        ids = []
+        cursor = ''
+        while cursor is not None:
+            response = client.raw_fetch(
+                f'/api/fruit?_sort={sort}&_order={order}'
+                f'&_limit=2&_cursor={cursor}'
+            )
+            assert response.code == 200
+            ids.extend(
+                fruit['fruit_id']
+                for fruit in jsonlib.loads(response.body.decode('utf-8'))
+            )
+            cursor = response.headers.get('X-Next-Cursor')
+        return ids
+
+    # The fruit 5 has no tree
+    assert paginate('tree_id', 'asc') == [1, 2, 3, 4, 5]
+    assert paginate('tree_id', 'desc') == [5, 4, 1, 2, 3]
+    assert paginate('tree_id,color', 'desc,asc') == [5, 4, 3, 2, 1]
+    assert paginate('tree_id,color', 'asc,desc') == [1, 2, 3, 4, 5]
+
+
+def test_json_server_cursor_invalid(client):
+    rest = UnRest(
+        client.app,
+        client.session,
+        idiom=JsonServerIdiom,
+        framework=client.__framework__,
+    )
+    rest(Fruit, only=['color'])
+    code, json = client.fetch('/api/fruit?_cursor=WzEsIDJd')
+    assert code == 400
+    assert json['message'] == 'Invalid cursor WzEsIDJd'
+    code, json = client.fetch('/api/fruit?_cursor=&_sort=age')
+    assert code == 400
+    assert json['message'] == 'Cannot paginate with a cursor on age'
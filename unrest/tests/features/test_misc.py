@@ -2,9 +2,10 @@ import sys
 
 from pytest import raises
 from sqlalchemy.dialects.postgresql import INET
-from sqlalchemy.types import Boolean, Float, String
+from sqlalchemy.types import Boolean, DateTime, Float, String
 
 from unrest import UnRest, __about__
+from unrest.codec import OrJsonCodec
 from unrest.coercers import Deserialize, Serialize
 from unrest.rest import Rest
 
@@ -436,6 +437,27 @@ def test_sub_fixed(client):
         assert getattr(subfruit, key) == getattr(fruit, key)
 
 
+def test_invalidate(client):
+    rest = UnRest(client.app, client.session, framework=client.__framework__)
+    tree = rest(Tree, only=[])
+    assert tree.primary_keys == ('id',)
+    assert list(tree.columns) == ['id']
+    with raises(TypeError):
+        tree.columns['name'] = Tree.name
+
+    code, json = client.fetch('/api/tree/1')
+    assert code == 200
+    assert json['primary_keys'] == ['id']
+    assert json['objects'] == [{'id': 1}]
+
+    tree.only = None
+    tree.invalidate()
+    assert list(tree.columns) == ['id', 'name']
+    code, json = client.fetch('/api/tree/1')
+    assert code == 200
+    assert json['objects'] == [{'id': 1, 'name': 'pine'}]
+
+
 def test_wrong_framework(client):
     with raises(NotImplementedError):
         UnRest(client.app, client.session, framework=Framework)
@@ -519,6 +541,51 @@ def test_custom_deserialization(client):
     ]
 
 
+def test_orjson_codec(client):
+    rest = UnRest(
+        client.app,
+        client.session,
+        framework=client.__framework__,
+        codec=OrJsonCodec,
+    )
+    fruit = rest(
+        Fruit,
+        methods=['GET', 'POST'],
+        only=['color', 'age'],
+        properties=[rest.Property('birthday', type=DateTime())],
+    )
+    assert fruit.serializer.native_types == OrJsonCodec.native_types
+    code, json = client.fetch('/api/fruit/2')
+    assert code == 200
+    assert json['objects'] == [
+        {
+            'fruit_id': 2,
+            'color': 'darkgrey',
+            'age': 4_233_830.213,
+            'birthday': '2019-11-12T23:56:09.787000',
+        }
+    ]
+
+    code, json = client.fetch(
+        '/api/fruit', method="POST", json={'color': 'yellow', 'age': 1}
+    )
+    assert code == 200
+    assert json['objects'] == [
+        {
+            'fruit_id': 6,
+            'color': 'yellow',
+            'age': 1.0,
+            'birthday': '2019-12-31T23:59:59',
+        }
+    ]
+
+    code, json = client.fetch(
+        '/api/fruit', method="POST", body="{'name'; 'cedar'}"
+    )
+    assert code == 400
+    assert json['message'].startswith('JSON Error in payload: ')
+
+
 def test_wrong_method(client):
     rest = UnRest(client.app, client.session, framework=client.__framework__)
     rest(Tree, methods=['GET', 'POST'])
@@ -0,0 +1,107 @@
+from sqlalchemy.types import Float
+
+from ...unrest import UnRest
+from .. import idsorted, selects
+from ..model import Fruit, Tree
+
+
+def test_projection_orm(client):
+    rest = UnRest(client.app, client.session, framework=client.__framework__)
+    rest(Fruit, only=['color', 'age'])
+    with selects(client.engine) as statements:
+        code, json = client.fetch('/api/fruit')
+    assert code == 200
+    # count and fruits with their deferred age
+    assert len(statements) == 2
+    assert 'fruit.size' not in statements[1]
+    assert 'fruit.age' in statements[1]
+    assert idsorted(json['objects'], 'fruit_id') == [
+        {'fruit_id': 1, 'color': 'grey', 'age': 1_041_300.0},
+        {'fruit_id': 2, 'color': 'darkgrey', 'age': 4_233_830.213},
+        {'fruit_id': 3, 'color': 'brown', 'age': 0.0},
+        {'fruit_id': 4, 'color': 'red', 'age': 2400.0},
+        {'fruit_id': 5, 'color': 'orangered', 'age': 7200.000012},
+    ]
+
+
+def test_projection_orm_with_property_depends(client):
+    rest = UnRest(client.app, client.session, framework=client.__framework__)
+    rest(
+        Fruit,
+        only=['color'],
+        properties=[rest.Property('square_size', Float(), depends=['size'])],
+    )
+    with selects(client.engine) as statements:
+        code, json = client.fetch('/api/fruit/4')
+    assert code == 200
+    assert len(statements) == 1
+    assert 'fruit.size' in statements[0]
+    assert 'fruit.tree_id' not in statements[0]
+    assert json['objects'] == [
+        {'fruit_id': 4, 'color': 'red', 'square_size': 0.25}
+    ]
+
+
+def test_projection_orm_with_relationship(client):
+    rest = UnRest(client.app, client.session, framework=client.__framework__)
+    tree = rest(Tree, methods=[])
+    rest(Fruit, only=['color'], relationships={'tree': tree})
+    with selects(client.engine) as statements:
+        code, json = client.fetch('/api/fruit/4')
+    assert code == 200
+    # fruit (with its tree_id) and tree
+    assert len(statements) == 2
+    assert json['objects'] == [
+        {'fruit_id': 4, 'color': 'red', 'tree': [{'id': 2, 'name': 'maple'}]}
+    ]
+
+
+def test_projection_none(client):
+    rest = UnRest(client.app, client.session, framework=client.__framework__)
+    rest(Fruit, only=['color'], projection=None)
+    with selects(client.engine) as statements:
+        code, json = client.fetch('/api/fruit/4')
+    assert code == 200
+    assert 'fruit.size' in statements[0]
+    assert json['objects'] == [{'fruit_id': 4, 'color': 'red'}]
+
+
+def test_projection_core(client):
+    rest = UnRest(client.app, client.session, framework=client.__framework__)
+    rest(Fruit, only=['color', 'double_size'], projection='core')
+    with selects(client.engine) as statements:
+        code, json = client.fetch('/api/fruit')
+    assert code == 200
+    assert 'fruit.size AS fruit_size' not in statements[1]
+    assert json['occurences'] == 5
+    assert idsorted(json['objects'], 'fruit_id') == [
+        {'fruit_id': 1, 'color': 'grey', 'double_size': 24.0},
+        {'fruit_id': 2, 'color': 'darkgrey', 'double_size': 46.0},
+        {'fruit_id': 3, 'color': 'brown', 'double_size': 4.24},
+        {'fruit_id': 4, 'color': 'red', 'double_size': 1.0},
+        {'fruit_id': 5, 'color': 'orangered', 'double_size': 200.0},
+    ]
+
+    code, json = client.fetch('/api/fruit/2')
+    assert code == 200
+    assert json['objects'] == [
+        {'fruit_id': 2, 'color': 'darkgrey', 'double_size': 46.0}
+    ]
+
+    with selects(client.engine) as statements:
+        code, json = client.fetch('/api/fruit?_count=window')
+    assert code == 200
+    assert len(statements) == 1
+    assert json['occurences'] == 5
+    assert len(json['objects']) == 5
+
+
+def test_projection_core_with_relationship(client):
+    rest = UnRest(client.app, client.session, framework=client.__framework__)
+    fruit = rest(Fruit, methods=[], only=['color'])
+    rest(Tree, relationships={'fruits': fruit}, projection='core')
+    code, json = client.fetch('/api/tree/2')
+    assert code == 200
+    assert json['objects'] == [
+        {'id': 2, 'name': 'maple', 'fruits': [{'fruit_id': 4, 'color': 'red'}]}
+    ]
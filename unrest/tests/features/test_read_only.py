@@ -0,0 +1,140 @@
+from sqlalchemy.orm.session import Session
+
+from ... import rest as rest_module
+from ...unrest import UnRest
+from .. import idsorted, selects
+from ..model import Fruit, Tree
+
+trees = [
+    {
+        'id': 1,
+        'name': 'pine',
+        'fruits': [
+            {'fruit_id': 1, 'color': 'grey'},
+            {'fruit_id': 2, 'color': 'darkgrey'},
+            {'fruit_id': 3, 'color': 'brown'},
+        ],
+    },
+    {'id': 2, 'name': 'maple', 'fruits': [{'fruit_id': 4, 'color': 'red'}]},
+    {'id': 3, 'name': 'oak', 'fruits': []},
+]
+
+
+def test_read_only(client):
+    rest = UnRest(client.app, client.session, framework=client.__framework__)
+    fruit = rest(Fruit, methods=[], only=['color'])
+    rest(Tree, relationships={'fruits': fruit}, read_only=True)
+    code, json = client.fetch('/api/tree')
+    assert code == 200
+    assert json['occurences'] == 3
+    assert idsorted(json['objects']) == trees
+
+    code, json = client.fetch('/api/tree/2')
+    assert code == 200
+    assert json['objects'] == [trees[1]]
+
+
+def test_read_only_stream(client):
+    rest = UnRest(client.app, client.session, framework=client.__framework__)
+    fruit = rest(Fruit, methods=[], only=['color'])
+    rest(
+        Tree,
+        relationships={'fruits': fruit},
+        read_only=True,
+        stream=True,
+        yield_per=2,
+    )
+    code, json = client.fetch('/api/tree')
+    assert code == 200
+    assert idsorted(json['objects']) == trees
+
+
+def test_read_only_core(client):
+    rest = UnRest(client.app, client.session, framework=client.__framework__)
+    rest(Fruit, only=['color'], projection='core', read_only=True)
+    with selects(client.engine) as statements:
+        code, json = client.fetch('/api/fruit?_count=window')
+    assert code == 200
+    # The items and their count in the same query
+    assert len(statements) == 1
+    assert json['occurences'] == 5
+    assert idsorted(json['objects'], 'fruit_id') == [
+        {'fruit_id': 1, 'color': 'grey'},
+        {'fruit_id': 2, 'color': 'darkgrey'},
+        {'fruit_id': 3, 'color': 'brown'},
+        {'fruit_id': 4, 'color': 'red'},
+        {'fruit_id': 5, 'color': 'orangered'},
+    ]
+
+    code, json = client.fetch('/api/fruit/3')
+    assert code == 200
+    assert json['objects'] == [{'fruit_id': 3, 'color': 'brown'}]
+
+
+def test_read_only_core_stream(client):
+    rest = UnRest(client.app, client.session, framework=client.__framework__)
+    rest(
+        Tree,
+        projection='core',
+        read_only=True,
+        stream=True,
+        yield_per=2,
+    )
+    code, json = client.fetch('/api/tree')
+    assert code == 200
+    assert json['occurences'] == 3
+    assert idsorted(json['objects']) == [
+        {'id': 1, 'name': 'pine'},
+        {'id': 2, 'name': 'maple'},
+        {'id': 3, 'name': 'oak'},
+    ]
+
+
+def test_read_only_session(client):
+    rest = UnRest(client.app, client.session, framework=client.__framework__)
+    tree = rest(Tree, read_only=True)
+    forest = rest(Tree, name='forest')
+    client.session.add(Tree(name='ash'))
+    # The pending tree is not flushed by the read only query
+    assert len(tree.get(None)['objects']) == 3
+    assert len(forest.get(None)['objects']) == 4
+    client.session.rollback()
+
+
+def test_read_only_session_closed(client, monkeypatch):
+    sessions = []
+
+    class ThrowawaySession(Session):
+        def __init__(self, *args, **kwargs):
+            super().__init__(*args, **kwargs)
+            self.closed = False
+            sessions.append(self)
+
+        def close(self):
+            self.closed = True
+            super().close()
+
+    monkeypatch.setattr(rest_module, 'Session', ThrowawaySession)
+    rest = UnRest(client.app, client.session, framework=client.__framework__)
+    fruit = rest(Fruit, methods=[], only=['color'])
+    tree = rest(Tree, relationships={'fruits': fruit}, read_only=True)
+    stream = rest(
+        Tree,
+        name='stream',
+        relationships={'fruits': fruit},
+        read_only=True,
+        stream=True,
+        yield_per=2,
+    )
+    client.session.expunge_all()
+
+    assert idsorted(tree.get(None)['objects']) == trees
+    assert tree.get(None, id=2)['objects'] == [trees[1]]
+    assert len(client.session.identity_map) == 0
+    assert [session.closed for session in sessions] == [True, True]
+
+    objects = stream.get(None)['objects']
+    assert not sessions[-1].closed
+    assert idsorted(list(objects)) == trees
+    assert sessions[-1].closed
+    assert len(client.session.identity_map) == 0
@@ -1,5 +1,5 @@
 from ...unrest import UnRest
-from .. import idsorted
+from .. import idsorted, selects
 from ..model import Fruit, Tree
 
 
@@ -97,3 +97,98 @@ def test_virtual_enforce_no_methods_kwargs(client):
     rest(Tree, relationships={'fruits': rest.virtual(Fruit, methods=rest.all)})
     code, json = client.fetch('/api/fruit')
     assert code == 404
+
+
+def test_eager_selectin(client):
+    rest = UnRest(client.app, client.session, framework=client.__framework__)
+    fruit = rest(Fruit, methods=[], only=['color'])
+    rest(Tree, relationships={'fruits': fruit})
+    with selects(client.engine) as statements:
+        code, json = client.fetch('/api/tree')
+    assert code == 200
+    # count, trees and fruits
+    assert len(statements) == 3
+    assert [len(tree['fruits']) for tree in idsorted(json['objects'])] == [
+        3,
+        1,
+        0,
+    ]
+
+
+def test_eager_joined(client):
+    rest = UnRest(client.app, client.session, framework=client.__framework__)
+    fruit = rest(Fruit, methods=[], only=['color'])
+    rest(Tree, relationships={'fruits': fruit}, eager={'fruits': 'joined'})
+    with selects(client.engine) as statements:
+        code, json = client.fetch('/api/tree')
+    assert code == 200
+    # count and trees joined with fruits
+    assert len(statements) == 2
+    assert json['occurences'] == 3
+    assert [len(tree['fruits']) for tree in idsorted(json['objects'])] == [
+        3,
+        1,
+        0,
+    ]
+
+
+def test_eager_lazy(client):
+    rest = UnRest(client.app, client.session, framework=client.__framework__)
+    fruit = rest(Fruit, methods=[], only=['color'])
+    rest(Tree, relationships={'fruits': fruit}, eager=None)
+    with selects(client.engine) as statements:
+        code, json = client.fetch('/api/tree')
+    assert code == 200
+    # count, trees and fruits of each tree
+    assert len(statements) == 5
+
+
+def test_eager_dynamic(client):
+    rest = UnRest(client.app, client.session, framework=client.__framework__)
+    fruit = rest(Fruit, methods=[], only=['color'])
+    rest(Tree, relationships={'dynamic_fruits': fruit})
+    code, json = client.fetch('/api/tree')
+    assert code == 200
+    assert [
+        len(tree['dynamic_fruits']) for tree in idsorted(json['objects'])
+    ] == [3, 1, 0]
+
+
+def test_eager_nested(client):
+    rest = UnRest(client.app, client.session, framework=client.__framework__)
+    tree = rest(Tree, methods=[])
+    fruit = rest(
+        Fruit, methods=[], only=['color'], relationships={'tree': tree}
+    )
+    rest(Tree, relationships={'fruits': fruit}, name='forest')
+    with selects(client.engine) as statements:
+        code, json = client.fetch('/api/forest')
+    assert code == 200
+    # count, trees, fruits and trees of the fruits
+    assert len(statements) == 4
+    assert idsorted(json['objects'])[1]['fruits'] == [
+        {'fruit_id': 4, 'color': 'red', 'tree': [{'id': 2, 'name': 'maple'}]}
+    ]
+
+
+def test_eager_joined_stream(client):
+    rest = UnRest(client.app, client.session, framework=client.__framework__)
+    fruit = rest(Fruit, methods=[], only=['color'])
+    rest(
+        Tree,
+        relationships={'fruits': fruit},
+        eager='joined',
+        stream=True,
+        yield_per=2,
+    )
+    with selects(client.engine) as statements:
+        code, json = client.fetch('/api/tree')
+    assert code == 200
+    # Joined collections are selectin loaded when streaming
+    assert not any('JOIN' in statement for statement in statements)
+    assert json['occurences'] == 3
+    assert [len(tree['fruits']) for tree in idsorted(json['objects'])] == [
+        3,
+        1,
+        0,
+    ]
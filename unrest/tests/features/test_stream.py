@@ -0,0 +1,130 @@
+import json as jsonlib
+
+from ...idiom.json_server import JsonServerIdiom
+from ...idiom.yaml import YamlIdiom
+from ...unrest import UnRest
+from ...util import iterencode
+from .. import idsorted
+from ..model import Fruit, Tree
+
+
+def test_stream(client):
+    rest = UnRest(client.app, client.session, framework=client.__framework__)
+    rest(Fruit, only=['color'], stream=True, yield_per=2)
+    code, json = client.fetch('/api/fruit')
+    assert code == 200
+    assert json['occurences'] == 5
+    assert json['primary_keys'] == ['fruit_id']
+    assert idsorted(json['objects'], 'fruit_id') == [
+        {'fruit_id': 1, 'color': 'grey'},
+        {'fruit_id': 2, 'color': 'darkgrey'},
+        {'fruit_id': 3, 'color': 'brown'},
+        {'fruit_id': 4, 'color': 'red'},
+        {'fruit_id': 5, 'color': 'orangered'},
+    ]
+
+    code, json = client.fetch('/api/fruit/2')
+    assert code == 200
+    assert json['occurences'] == 1
+    assert json['objects'] == [{'fruit_id': 2, 'color': 'darkgrey'}]
+
+
+def test_stream_empty(client):
+    rest = UnRest(
+        client.app,
+        client.session,
+        framework=client.__framework__,
+        empty_get_as_404=True,
+    )
+    rest(Tree, query=lambda q: q.filter(Tree.id > 3), stream=True)
+    code, json = client.fetch('/api/tree')
+    assert code == 404
+    assert json == {'primary_keys': ['id'], 'occurences': 0, 'objects': []}
+
+
+def test_stream_with_relationship(client):
+    rest = UnRest(client.app, client.session, framework=client.__framework__)
+    fruit = rest(Fruit, methods=[], only=['color'])
+    rest(Tree, relationships={'fruits': fruit}, stream=True, yield_per=1)
+    code, json = client.fetch('/api/tree')
+    assert code == 200
+    assert json['occurences'] == 3
+    assert idsorted(json['objects']) == [
+        {
+            'id': 1,
+            'name': 'pine',
+            'fruits': [
+                {'fruit_id': 1, 'color': 'grey'},
+                {'fruit_id': 2, 'color': 'darkgrey'},
+                {'fruit_id': 3, 'color': 'brown'},
+            ],
+        },
+        {
+            'id': 2,
+            'name': 'maple',
+            'fruits': [{'fruit_id': 4, 'color': 'red'}],
+        },
+        {'id': 3, 'name': 'oak', 'fruits': []},
+    ]
+
+
+def test_stream_json_server(client):
+    rest = UnRest(
+        client.app,
+        client.session,
+        idiom=JsonServerIdiom,
+        framework=client.__framework__,
+    )
+    fruit = rest(Fruit, methods=[], only=['color'])
+    rest(Tree, relationships={'fruits': fruit}, stream=True, yield_per=2)
+    code, json = client.fetch('/api/tree')
+    assert code == 200
+    assert idsorted(json) == [
+        {'id': 1, 'name': 'pine', 'fruits': [1, 2, 3]},
+        {'id': 2, 'name': 'maple', 'fruits': [4]},
+        {'id': 3, 'name': 'oak', 'fruits': []},
+    ]
+
+
+def test_stream_yaml(client):
+    rest = UnRest(
+        client.app,
+        client.session,
+        idiom=YamlIdiom,
+        framework=client.__framework__,
+    )
+    rest(Tree, stream=True)
+    code, yaml = client.fetch('/api/tree')
+    assert code == 200
+    assert (
+        yaml
+        == '''\
+objects:
+- id: 1
+  name: pine
+- id: 2
+  name: maple
+- id: 3
+  name: oak
+occurences: 3
+primary_keys:
+- id
+'''
+    )
+
+
+def test_iterencode():
+    chunks = list(
+        iterencode(
+            ({'id': i} for i in range(5)),
+            jsonlib.dumps,
+            '{"objects": [',
+            ']}',
+            chunk_size=20,
+        )
+    )
+    assert len(chunks) == 4
+    assert all(isinstance(chunk, bytes) for chunk in chunks)
+    assert jsonlib.loads(b''.join(chunks)) == {
+        'objects': [{'id': i} for i in range(5)]
+    }
@@ -0,0 +1,82 @@
+import asyncio
+from urllib.parse import urlsplit
+from wsgiref.headers import Headers
+
+from ...framework.asgi import ASGIApplication, ASGIFramework
+from .http_server import FakeResponse
+from .unrest_client import UnRestClient
+
+
+class ASGIClient(UnRestClient):
+    __framework__ = ASGIFramework
+
+    def setUp(self):
+        self.get_app()
+        super().setUp()
+
+    def get_app(self):
+        async def index(scope, receive, send):
+            status = 200 if scope['path'] == '/' else 404
+            await send(
+                {
+                    'type': 'http.response.start',
+                    'status': status,
+                    'headers': [],
+                }
+            )
+            await send(
+                {
+                    'type': 'http.response.body',
+                    'body': b'A normal route!' if status == 200 else b'',
+                }
+            )
+
+        self.app = ASGIApplication(index)
+        return self.app
+
+    def raw_fetch(self, url, method='GET', headers={}, body=None):
+        url = urlsplit(url)
+        scope = {
+            'type': 'http',
+            'http_version': '1.1',
+            'method': method.upper(),
+            'scheme': 'http',
+            'path': url.path,
+            'root_path': '',
+            'query_string': url.query.encode('latin-1'),
+            'headers': [
+                (name.lower().encode('latin-1'), str(value).encode('latin-1'))
+                for name, value in headers.items()
+            ],
+            'server': ('testserver', 80),
+        }
+        # Send the body in two messages
+        body = (body or '').encode('utf-8')
+        half = len(body) // 2
+        messages = [
+            {'type': 'http.request', 'body': body[:half], 'more_body': True},
+            {'type': 'http.request', 'body': body[half:]},
+        ]
+        sent = []
+
+        async def receive():
+            return messages.pop(0)
+
+        async def send(message):
+            sent.append(message)
+
+        try:
+            asyncio.run(self.app(scope, receive, send))
+        finally:
+            self.session.remove()
+        start = sent.pop(0)
+        return FakeResponse(
+            start['status'],
+            Headers(
+                [
+                    (name.decode('latin-1'), value.decode('latin-1'))
+                    for name, value in start['headers']
+                ]
+            ),
+            b''.join(message.get('body', b'') for message in sent),
+        )
@@ -78,7 +78,7 @@ class HTTPServerClient(UnRestClient):
         res_lines = head.split('\r\n')
         [_, code, message] = res_lines[0].split(' ', 2)
         headers = {
-            line.split(':')[0]: line.split(':')[1].strip()
+            line.split(':', 1)[0]: line.split(':', 1)[1].strip()
             for line in res_lines[1:]
         }
 
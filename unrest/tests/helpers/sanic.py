@@ -1,6 +1,7 @@
 import uuid
 
 from sanic import Sanic, response
+from sanic.response import StreamingHTTPResponse
 
 from ...framework.sanic import SanicFramework
 from .unrest_client import UnRestClient
@@ -22,6 +23,17 @@ class SanicClient(UnRestClient):
 
         @self.app.middleware('response')
         async def after_request(request, response):
+            if isinstance(response, StreamingHTTPResponse):
+                streaming_fn = response.streaming_fn
+
+                async def remove_after_streaming(response):
+                    try:
+                        await streaming_fn(response)
+                    finally:
+                        self.app.session.remove()
+
+                response.streaming_fn = remove_after_streaming
+                return
             self.app.session.remove()
 
         self.app.session = self.session
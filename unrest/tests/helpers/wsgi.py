@@ -0,0 +1,61 @@
+from io import BytesIO
+from urllib.parse import urlsplit
+from wsgiref.headers import Headers
+from wsgiref.util import setup_testing_defaults
+
+from ...framework.wsgi import WSGIApplication, WSGIFramework
+from .http_server import FakeResponse
+from .unrest_client import UnRestClient
+
+
+class WSGIClient(UnRestClient):
+    __framework__ = WSGIFramework
+
+    def setUp(self):
+        self.get_app()
+        super().setUp()
+
+    def get_app(self):
+        def index(environ, start_response):
+            if environ['PATH_INFO'] != '/':
+                start_response('404 Not Found', [])
+                return [b'']
+            start_response('200 OK', [])
+            return [b'A normal route!']
+
+        self.app = WSGIApplication(index)
+        return self.app
+
+    def raw_fetch(self, url, method='GET', headers={}, body=None):
+        url = urlsplit(url)
+        body = (body or '').encode('utf-8')
+        environ = {
+            'REQUEST_METHOD': method.upper(),
+            'PATH_INFO': url.path,
+            'QUERY_STRING': url.query,
+            'CONTENT_LENGTH': str(len(body)),
+            'wsgi.input': BytesIO(body),
+        }
+        for name, value in headers.items():
+            key = name.upper().replace('-', '_')
+            if key not in ('CONTENT_TYPE', 'CONTENT_LENGTH'):
+                key = f'HTTP_{key}'
+            environ[key] = str(value)
+        setup_testing_defaults(environ)
+
+        response = {}
+
+        def start_response(status, headers):
+            response['code'] = int(status.split(' ', 1)[0])
+            response['headers'] = Headers(headers)
+
+        try:
+            chunks = self.app(environ, start_response)
+            try:
+                body = b''.join(chunks)
+            finally:
+                if hasattr(chunks, 'close'):
+                    chunks.close()
+        finally:
+            self.session.remove()
+        return FakeResponse(response['code'], response['headers'], body)
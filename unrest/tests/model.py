@@ -15,6 +15,7 @@ class Tree(Base):
     __tablename__ = 'tree'
     id = Column(Integer, primary_key=True)
     name = Column(String)
+    dynamic_fruits = relationship('Fruit', lazy='dynamic', viewonly=True)
 
     @property
     def fruit_colors(self):
@@ -46,6 +47,16 @@ class Fruit(Base):
         return datetime(2020, 1, 1, 0, 0, 0) - self.age
 
 
+class Seed(Base):
+    """Soon a tree"""
+
+    __tablename__ = 'seed'
+    id = Column(Integer, primary_key=True)
+    name = Column(String)
+    status = Column(String, default='new')
+    season = Column(String, server_default='spring')
+
+
 def fill_data(session):
     pine = Tree(name='pine')
     maple = Tree(name='maple')
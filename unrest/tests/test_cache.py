@@ -0,0 +1,88 @@
+import os
+from time import sleep
+
+from ..cache import FileCache, MemoryCache
+
+
+def test_memory_cache():
+    cache = MemoryCache(max_entries=2, max_bytes=10)
+    cache.set('a', (200, {}, b'aaaa'))
+    cache.set('b', (200, {}, b'bbbb'))
+    assert cache.get('a') == (200, {}, b'aaaa')
+    assert cache.size == 8
+
+    # b is the least recently used
+    cache.set('c', (200, {}, b'cc'))
+    assert cache.get('b') is None
+    assert cache.get('a') == (200, {}, b'aaaa')
+    assert cache.get('c') == (200, {}, b'cc')
+
+    # Bounded in bytes
+    cache.set('d', (200, {}, b'dddddddd'))
+    assert cache.get('a') is None
+    assert cache.get('c') == (200, {}, b'cc')
+    assert cache.get('d') == (200, {}, b'dddddddd')
+    assert cache.size == 10
+
+    # Too large
+    cache.set('e', (200, {}, b'e' * 11))
+    assert cache.get('e') is None
+    assert cache.get('d') is not None
+
+    cache.clear()
+    assert cache.get('d') is None
+    assert cache.size == 0
+
+
+def test_memory_cache_ttl():
+    cache = MemoryCache(ttl=0.01)
+    cache.set('a', (200, {}, b'a'))
+    assert cache.get('a') == (200, {}, b'a')
+    sleep(0.02)
+    assert cache.get('a') is None
+    assert cache.size == 0
+
+
+def test_memory_cache_generation():
+    cache = MemoryCache()
+    assert cache.generation('tree') == 0
+    cache.invalidate('tree')
+    generation = cache.generation('tree')
+    assert generation != 0
+    cache.invalidate('fruit')
+    cache.invalidate('tree')
+    assert cache.generation('tree') not in (0, generation)
+
+
+def test_file_cache(tmp_path):
+    cache = FileCache(str(tmp_path), purge_every=2)
+    other = FileCache(str(tmp_path))
+    headers = {'Content-Type': 'application/json', 'X-Total-Count': 3}
+    cache.set('a', (200, headers, b'{"a":\n1}'))
+    assert other.get('a') == (200, headers, b'{"a":\n1}')
+    assert other.get('b') is None
+
+    assert cache.generation('tree') == ''
+    other.invalidate('tree')
+    generation = cache.generation('tree')
+    assert generation != ''
+    cache.invalidate('tree')
+    assert other.generation('tree') not in ('', generation)
+
+    cache.clear()
+    assert other.get('a') is None
+
+
+def test_file_cache_ttl(tmp_path):
+    cache = FileCache(str(tmp_path), ttl=60, purge_every=3)
+    cache.set('a', (200, {}, b'a'))
+    path = tmp_path / 'entries' / 'a'
+    os.utime(path, (0, 0))
+    assert cache.get('a') is None
+    assert not path.exists()
+
+    cache.set('b', (200, {}, b'b'))
+    os.utime(tmp_path / 'entries' / 'b', (0, 0))
+    # Purged on the third write
+    cache.set('c', (200, {}, b'c'))
+    assert os.listdir(tmp_path / 'entries') == ['c']
@@ -0,0 +1,42 @@
+from datetime import datetime
+from uuid import UUID
+
+from pytest import raises
+
+from ..codec import JsonCodec, OrJsonCodec, UJsonCodec, best_json_codec
+
+
+def test_json_codec():
+    codec = JsonCodec()
+    assert codec.loads(b'{"a": [1, "\xc3\xa9"]}') == {'a': [1, 'é']}
+    assert codec.dumps({'a': [1, None]}) == '{"a": [1, null]}'
+    with raises(ValueError):
+        codec.loads(b'{"a": }')
+
+
+def test_orjson_codec():
+    codec = OrJsonCodec()
+    assert codec.loads(b'{"a": [1, "\xc3\xa9"]}') == {'a': [1, 'é']}
+    assert codec.dumps(
+        {
+            'date': datetime(2050, 3, 26, 17, 40, 14),
+            'uuid': UUID('b2e1c0a6-98e3-4bd4-9f5e-9d0b9b1f3e84'),
+        }
+    ) == (
+        b'{"date":"2050-03-26T17:40:14",'
+        b'"uuid":"b2e1c0a6-98e3-4bd4-9f5e-9d0b9b1f3e84"}'
+    )
+    with raises(ValueError):
+        codec.loads(b'{"a": }')
+
+
+def test_ujson_codec():
+    codec = UJsonCodec()
+    assert codec.loads(b'{"a": [1, "\xc3\xa9"]}') == {'a': [1, 'é']}
+    assert codec.dumps({'a': '/'}) == '{"a":"/"}'
+    with raises(ValueError):
+        codec.loads(b'{"a": }')
+
+
+def test_best_json_codec():
+    assert best_json_codec() is OrJsonCodec
@@ -96,3 +96,55 @@ def test_deserialize():
         timedelta(seconds=48),
         timedelta(hours=21),
     ]
+
+
+def test_serialize_all():
+    class UpperCaseSerialize(Serialize):
+        def serialize_string(self, type, data):
+            return data.upper()
+
+    serialize = UpperCaseSerialize(
+        None,
+        {'id': Item.id, 'str': Item.str, 'date': Item.date},
+        [],
+        {},
+    )
+    assert serialize.compilable
+    assert serialize.all(
+        [
+            Item(id=1, str='str', date=date(2020, 12, 21)),
+            Item(id=2, str=None, date=None),
+        ]
+    ) == [
+        {'id': 1, 'str': 'STR', 'date': '2020-12-21'},
+        {'id': 2, 'str': None, 'date': None},
+    ]
+
+
+def test_serialize_all_overridden():
+    class NoneSerialize(Serialize):
+        def serialize(self, name, column):
+            return None
+
+    serialize = NoneSerialize(None, {'id': Item.id, 'str': Item.str}, [], {})
+    assert not serialize.compilable
+    assert serialize.all([Item(id=1, str='str')]) == [
+        {'id': None, 'str': None}
+    ]
+
+
+def test_deserialize_create():
+    deserialize = Deserialize(
+        {'objects': [{'id': 1, 'date': '2020-12-21'}, {'str': 'str'}]},
+        {'id': Item.id, 'str': Item.str, 'date': Item.date},
+    )
+    assert deserialize.compilable
+    items = deserialize.create(Item)
+    assert [(item.id, item.str, item.date) for item in items] == [
+        (1, None, date(2020, 12, 21)),
+        (None, 'str', None),
+    ]
+    assert deserialize.mappings(primary_keys=['id']) == [
+        {'id': 1, 'str': None, 'date': date(2020, 12, 21)},
+        {'str': 'str', 'date': None},
+    ]
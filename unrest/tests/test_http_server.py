@@ -0,0 +1,102 @@
+from http.server import BaseHTTPRequestHandler
+
+from pytest import raises
+
+from ..framework.http_server import HTTPServerFramework
+from ..util import Response
+from .helpers.http_server import FakeApp, patch_app
+
+
+def route(method):
+    def function(request):
+        pass
+
+    function.__name__ = method
+    return function
+
+
+def lookup(framework, path):
+    found = framework.lookup(path)
+    if found:
+        methods, url_parameters = found
+        return {
+            method: function.__name__ for method, function in methods.items()
+        }, url_parameters
+
+
+def test_route_trie():
+    framework = HTTPServerFramework(FakeApp(BaseHTTPRequestHandler), '/api')
+    framework.register_route('/api/', 'GET', None, route('index'))
+    framework.register_route('/api/tree', 'GET', ['id'], route('tree'))
+    framework.register_route('/api/tree', 'PUT', ['id'], route('put_tree'))
+    framework.register_route(
+        '/api/tree/fruit', 'GET', ['fruit_id', 'tree_id'], route('fruit')
+    )
+
+    assert lookup(framework, '/api/') == ({'GET': 'index'}, {})
+    assert lookup(framework, '/api/tree') == (
+        {'GET': 'tree', 'PUT': 'put_tree'},
+        {'id': None},
+    )
+    assert lookup(framework, '/api/tree/2') == (
+        {'GET': 'tree', 'PUT': 'put_tree'},
+        {'id': '2'},
+    )
+    assert lookup(framework, '/api/tree/fruit') == (
+        {'GET': 'fruit'},
+        {'fruit_id': None, 'tree_id': None},
+    )
+    assert lookup(framework, '/api/tree/fruit/1/2') == (
+        {'GET': 'fruit'},
+        {'fruit_id': '1', 'tree_id': '2'},
+    )
+    assert lookup(framework, '/api/tree/fruit/1') == (
+        {'GET': 'tree', 'PUT': 'put_tree'},
+        {'id': 'fruit/1'},
+    )
+    assert lookup(framework, '/api/tree/') is None
+    assert lookup(framework, '/api') is None
+    assert lookup(framework, '/api/fruit') is None
+
+    with raises(KeyError):
+        framework.register_route('/api/tree', 'GET', ['id'], route('tree'))
+
+
+def test_streamed_response_encoding():
+    class Handler(BaseHTTPRequestHandler):
+        protocol_version = 'HTTP/1.1'
+
+        def log_message(self, *args):
+            pass
+
+        def finish(self):
+            pass
+
+    app = FakeApp(Handler)
+    framework = HTTPServerFramework(app, '/api')
+    framework.register_route(
+        '/api/tree',
+        'GET',
+        None,
+        lambda request: Response(iter([b'[1, ', b'2]']), {}, 200),
+    )
+    patch_app(app)
+
+    def fetch(version):
+        handler = app.RequestHandlerClass(
+            f'GET /api/tree {version}\r\n\r\n'.encode('iso-8859-1')
+        )
+        handler.wfile.seek(0)
+        head, body = handler.wfile.read().split(b'\r\n\r\n', 1)
+        return handler, head, body
+
+    handler, head, body = fetch('HTTP/1.1')
+    assert b'Transfer-Encoding: chunked' in head
+    assert body == b'4\r\n[1, \r\n2\r\n2]\r\n0\r\n\r\n'
+    assert not handler.close_connection
+
+    # HTTP/1.0 clients do not understand chunked encoding
+    handler, head, body = fetch('HTTP/1.0')
+    assert b'Transfer-Encoding' not in head
+    assert body == b'[1, 2]'
+    assert handler.close_connection
@@ -0,0 +1,84 @@
+from io import BytesIO
+
+from pytest import raises
+
+from ..framework.asgi import ScopeHeaders, request_url
+from ..framework.wsgi import EnvironHeaders, read_payload
+from ..util import Request, Response
+
+
+def test_lazy_request():
+    calls = []
+
+    def parse_query():
+        calls.append('query')
+        return {'a': ['1']}
+
+    request = Request('/api/tree/1', 'GET', {'id': '1'}, parse_query, b'', {})
+    assert calls == []
+    assert request.url == '/api/tree/1'
+    assert request.payload == b''
+    assert request.query == {'a': ['1']}
+    assert request.query == {'a': ['1']}
+    assert calls == ['query']
+
+    request.payload = b'{}'
+    request.query = {}
+    request.headers = {'X-Token': 'secret'}
+    request.url = '/api/tree/2'
+    assert request.payload == b'{}'
+    assert request.query == {}
+    assert request.headers == {'X-Token': 'secret'}
+    assert request.url == '/api/tree/2'
+
+    with raises(AttributeError):
+        request.extra = 'slots'
+    with raises(AttributeError):
+        Response(b'', {}, 200).extra = 'slots'
+
+
+def test_wsgi_environ():
+    environ = {
+        'REQUEST_METHOD': 'PUT',
+        'PATH_INFO': '/api/tree/1',
+        'CONTENT_TYPE': 'application/json',
+        'CONTENT_LENGTH': '2',
+        'HTTP_X_TOKEN': 'secret',
+        'wsgi.input': BytesIO(b'{}'),
+    }
+    assert read_payload(environ) == b'{}'
+
+    headers = EnvironHeaders(environ)
+    assert headers['content-type'] == 'application/json'
+    assert headers['X-Token'] == 'secret'
+    assert headers.get('Accept') is None
+    assert sorted(headers) == ['Content-Length', 'Content-Type', 'X-Token']
+
+    environ['HTTP_X_TOKEN'] = 'changed'
+    assert headers['X-Token'] == 'changed'
+
+
+def test_asgi_scope():
+    scope = {
+        'type': 'http',
+        'method': 'GET',
+        'scheme': 'https',
+        'path': '/api/tree',
+        'query_string': b'a=1&a=2&b=',
+        'headers': [
+            (b'host', b'example.org'),
+            (b'accept', b'application/json'),
+            (b'accept', b'text/plain'),
+        ],
+        'server': ('127.0.0.1', 8000),
+    }
+    assert request_url(scope) == 'https://example.org/api/tree?a=1&a=2&b='
+
+    headers = ScopeHeaders(scope['headers'])
+    assert headers['Accept'] == 'application/json, text/plain'
+    assert headers.get('Content-Type') is None
+    assert list(headers) == ['Host', 'Accept']
+    assert len(headers) == 2
+
+    del scope['headers'][0]
+    assert request_url(scope) == 'https://127.0.0.1:8000/api/tree?a=1&a=2&b='
@@ -0,0 +1,63 @@
+import asyncio
+from io import BytesIO
+
+from ..framework.asgi import ASGIApplication, ASGIFramework
+from ..framework.wsgi import WSGIApplication, WSGIFramework
+from ..util import Response
+
+
+def streamed_route(events):
+    def route(request):
+        def chunks():
+            events.append('chunk')
+            yield b'{}'
+
+        return Response(chunks(), {}, 200)
+
+    return route
+
+
+def test_wsgi_teardown():
+    events = []
+    app = WSGIApplication()
+    framework = WSGIFramework(app, '/api', lambda: events.append('teardown'))
+    framework.register_route('/api/tree', 'GET', None, streamed_route(events))
+    environ = {
+        'REQUEST_METHOD': 'GET',
+        'PATH_INFO': '/api/tree',
+        'wsgi.input': BytesIO(),
+    }
+    chunks = app(environ, lambda status, headers: None)
+    assert list(chunks) == [b'{}']
+    assert events == ['chunk']
+    chunks.close()
+    assert events == ['chunk', 'teardown']
+
+    environ['REQUEST_METHOD'] = 'POST'
+    app(environ, lambda status, headers: None).close()
+    assert events == ['chunk', 'teardown', 'teardown']
+
+
+def test_asgi_teardown():
+    events = []
+    app = ASGIApplication()
+    framework = ASGIFramework(
+        app, '/api', teardown=lambda: events.append('teardown')
+    )
+    framework.register_route('/api/tree', 'GET', None, streamed_route(events))
+    scope = {
+        'type': 'http',
+        'method': 'GET',
+        'path': '/api/tree',
+        'query_string': b'',
+        'headers': [],
+    }
+
+    async def receive():
+        return {'type': 'http.request', 'body': b''}
+
+    async def send(message):
+        events.append(message.get('body'))
+
+    asyncio.run(app(scope, receive, send))
+    assert events == [None, 'chunk', b'{}', b'', 'teardown']
@@ -1,12 +1,12 @@
-import json
 import logging
 
 from .__about__ import __uri__, __version__
+from .codec import JsonCodec
 from .coercers import Property
 from .generators.openapi import OpenApi
 from .generators.options import Options
 from .rest import Rest
-from .util import Response
+from .util import Response, to_bytes
 
 log = logging.getLogger(__name__)
 
@@ -45,11 +45,15 @@ class UnRest(object):
         serve_openapi_file: Set it to False to disable openapi file generation.
         empty_get_as_404: If True return a 404 on get with id not found.
         info: Additional info for the openapi metadata.
+        codec: The json codec class used to decode requests and encode
+            responses, defaults to #::unrest.codec#JsonCodec.
+            (See #::unrest.codec#best_json_codec)
 
     # Frameworks
     Unrest aims to be framework agnostic.
     It currently works with Flask out of the box and provides some other
-    frameworks: Tornado and python http.server.
+    frameworks: Tornado, Sanic, python http.server and plain WSGI or ASGI
+    servers.
     See #::unrest.framework#Framework.
     """
 
@@ -90,6 +94,7 @@ class UnRest(object):
         OptionsClass=Options,
         empty_get_as_404=False,
         info={},
+        codec=JsonCodec,
     ):
         self.rests = []
         self.path = path
@@ -106,6 +111,7 @@ class UnRest(object):
         self.OpenApi = OpenApiClass
         self.Options = OptionsClass
         self.empty_get_as_404 = empty_get_as_404
+        self.codec = codec()
         if app is not None:
             self.init_app(app)
         if session is not None:
@@ -192,16 +198,17 @@ class UnRest(object):
 
     def index(self, request):
         """The API index GET route."""
-        return Response(
+        payload = (
             (
                 '<h1>unrest <small>api server</small></h1> version '
                 f'{__version__} <a href="{__uri__}">unrest</a>'
             )
             + (f' <a href="{self.root_path}/openapi.json">openapi.json</a>')
             if self.serve_openapi_file
-            else '',
-            {'Content-Type': 'text/html'},
-            200,
+            else ''
+        )
+        return Response(
+            payload.encode('utf-8'), {'Content-Type': 'text/html'}, 200
         )
 
     def send_json(self, data):
@@ -214,7 +221,7 @@ class UnRest(object):
         # Returns
         The #::unrest.util#Response containing the json data.
         """
-        payload = json.dumps(data)
+        payload = to_bytes(self.codec.dumps(data))
         headers = {'Content-Type': 'application/json'}
         return Response(payload, headers, 200)
 
@@ -2,6 +2,12 @@ class Request(object):
     """
     The unrest request object created in the #::unrest.framework route wrapper.
 
+    The `url`, `query`, `payload` and `headers` can be given as functions
+    without arguments which are only called (once) when the field is first
+    read, so that a request which never reads its body or its query string
+    does not parse them. They can also be replaced (i.e. by an auth
+    decorator).
+
     # Arguments
         url: The request url.
         method: The request method.
@@ -11,13 +17,62 @@ class Request(object):
         headers: A mapping of request headers.
     """
 
+    __slots__ = (
+        'method',
+        'parameters',
+        '_url',
+        '_query',
+        '_payload',
+        '_headers',
+    )
+
     def __init__(self, url, method, parameters, query, payload, headers):
-        self.url = url
+        self._url = url
         self.method = method
         self.parameters = parameters
-        self.query = query
-        self.payload = payload
-        self.headers = headers
+        self._query = query
+        self._payload = payload
+        self._headers = headers
+
+    @property
+    def url(self):
+        if callable(self._url):
+            self._url = self._url()
+        return self._url
+
+    @url.setter
+    def url(self, value):
+        self._url = value
+
+    @property
+    def query(self):
+        if callable(self._query):
+            self._query = self._query()
+        return self._query
+
+    @query.setter
+    def query(self, value):
+        self._query = value
+
+    @property
+    def payload(self):
+        if callable(self._payload):
+            self._payload = self._payload()
+        return self._payload
+
+    @payload.setter
+    def payload(self, value):
+        self._payload = value
+
+    @property
+    def headers(self):
+        if callable(self._headers):
+            self._headers = self._headers()
+        return self._headers
+
+    @headers.setter
+    def headers(self, value):
+        self._headers = value
 
 
 class Response(object):
@@ -25,12 +80,56 @@ class Response(object):
     The unrest response object created by the #::unrest.idiom.
 
     # Arguments
-        payload: The response body as string.
+        payload: The response body as bytes or as an iterable of bytes
+            chunks for streamed responses. Frameworks pass them through
+            untouched (strings are still accepted and encoded in utf-8).
         headers: A mapping of response headers.
         status: The response status code.
     """
 
+    __slots__ = ('payload', 'headers', 'status')
+
     def __init__(self, payload, headers, status):
         self.payload = payload
         self.headers = headers
         self.status = status
+
+    @property
+    def streamed(self):
+        """Whether the payload is an iterable of chunks to stream."""
+        return not isinstance(self.payload, (str, bytes))
+
+
+def to_bytes(data):
+    """Encode `data` in utf-8 if it is a string, return it otherwise."""
+    if isinstance(data, str):
+        return data.encode('utf-8')
+    return data
+
+
+def iterencode(objects, encode, prefix='[', suffix=']', chunk_size=65536):
+    """
+    Lazily encode the `objects` iterable as a json array, yielding bytes
+    chunks of about `chunk_size` bytes.
+
+    # Arguments
+        objects: An iterable of objects to encode.
+        encode: The function used to encode each object to a string or bytes.
+        prefix: The string or bytes written before the array items.
+        suffix: The string or bytes written after the array items.
+        chunk_size: The size in bytes from which a chunk is yielded.
+    """
+    chunk = [to_bytes(prefix)]
+    size = len(chunk[0])
+    separator = b''
+    for object in objects:
+        part = separator + to_bytes(encode(object))
+        chunk.append(part)
+        size += len(part)
+        separator = b', '
+        if size >= chunk_size:
+            yield b''.join(chunk)
+            chunk = []
+            size = 0
+    chunk.append(to_bytes(suffix))
+    yield b''.join(chunk)